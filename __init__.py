@@ -1,8 +1,23 @@
+from typing import TYPE_CHECKING
+
+from common.lazy import lazy_attributes
+
 from version import __version__
-from accounts.bithumb.v2_1_0.api import BithumbAPI
-from accounts.bithumb.v2_1_0.bithumb_exchange import BithumbExchange
-from strategies.turtle.turtle_strategy import TurtleStrategy
-from indicators.moving_average import MovingAverage
+
+_LAZY_ATTRIBUTES = {
+    "BithumbAPI": "accounts.bithumb.v2_1_0.api",
+    "BithumbExchange": "accounts.bithumb.v2_1_0.bithumb_exchange",
+    "TurtleStrategy": "strategies.turtle.turtle_strategy",
+    "MovingAverage": "indicators.moving_average",
+    "RollingIndicator": "indicators.rolling",
+}
+
+if TYPE_CHECKING:
+    from accounts.bithumb.v2_1_0.api import BithumbAPI
+    from accounts.bithumb.v2_1_0.bithumb_exchange import BithumbExchange
+    from strategies.turtle.turtle_strategy import TurtleStrategy
+    from indicators.moving_average import MovingAverage
+    from indicators.rolling import RollingIndicator
 
 __all__ = [
     "__version__",
@@ -10,4 +25,8 @@ __all__ = [
     "BithumbExchange",
     "TurtleStrategy",
     "MovingAverage",
-]
\ No newline at end of file
+    "RollingIndicator",
+]
+
+
+__getattr__, __dir__ = lazy_attributes(globals(), _LAZY_ATTRIBUTES)
@@ -1,19 +1,64 @@
-from accounts.bithumb.v2_1_0.api import BithumbAPI
-from accounts.bithumb.v2_1_0.schema import Account, Candle, Order, Ticker, Trade
-from accounts.bithumb.v2_1_0.enums import OrderSide, OrderType
+from typing import TYPE_CHECKING
+
+from common.lazy import lazy_attributes
+
+from accounts.bithumb.v2_1_0.enums import (
+    CandleInterval,
+    DecodeMode,
+    OrderSide,
+    OrderState,
+    OrderType,
+    StreamChannel,
+)
+
+_LAZY_ATTRIBUTES = {
+    'BithumbAPI': 'accounts.bithumb.v2_1_0.api',
+    'AsyncBithumbAPI': 'accounts.bithumb.v2_1_0.async_api',
+    'AccountState': 'accounts.bithumb.v2_1_0.account_state',
+    'MarketStream': 'accounts.bithumb.v2_1_0.market_stream',
+    'OrderManager': 'accounts.bithumb.v2_1_0.order_manager',
+    'Account': 'accounts.bithumb.v2_1_0.schema',
+    'Candle': 'accounts.bithumb.v2_1_0.schema',
+    'Order': 'accounts.bithumb.v2_1_0.schema',
+    'OrderFillEvent': 'accounts.bithumb.v2_1_0.schema',
+    'PriceTick': 'accounts.bithumb.v2_1_0.schema',
+    'Ticker': 'accounts.bithumb.v2_1_0.schema',
+    'Trade': 'accounts.bithumb.v2_1_0.schema',
+}
+
+if TYPE_CHECKING:
+    from accounts.bithumb.v2_1_0.api import BithumbAPI
+    from accounts.bithumb.v2_1_0.async_api import AsyncBithumbAPI
+    from accounts.bithumb.v2_1_0.account_state import AccountState
+    from accounts.bithumb.v2_1_0.market_stream import MarketStream
+    from accounts.bithumb.v2_1_0.order_manager import OrderManager
+    from accounts.bithumb.v2_1_0.schema import Account, Candle, Order, OrderFillEvent, PriceTick, Ticker, Trade
 
 __all__ = [
     # Main API
     'BithumbAPI',
+    'AsyncBithumbAPI',
+    'AccountState',
+    'MarketStream',
+    'OrderManager',
 
     # Schemas
     'Account',
     'Candle',
     'Order',
+    'OrderFillEvent',
+    'PriceTick',
     'Ticker',
     'Trade',
 
     # Enums
     'OrderSide',
     'OrderType',
+    'OrderState',
+    'CandleInterval',
+    'DecodeMode',
+    'StreamChannel',
 ]
+
+
+__getattr__, __dir__ = lazy_attributes(globals(), _LAZY_ATTRIBUTES)
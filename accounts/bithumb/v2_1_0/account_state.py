@@ -0,0 +1,136 @@
+import threading
+import time
+
+from accounts.bithumb.v2_1_0.constants import ACCOUNT_BASE_CURRENCY, ACCOUNT_REFRESH_INTERVAL
+from accounts.bithumb.v2_1_0.enums import OrderSide, OrderType
+from accounts.bithumb.v2_1_0.schema import Account, OrderFillEvent
+from accounts.bithumb.v2_1_0.services.account_service import AccountService
+
+
+class AccountState:
+    """통화별로 색인된 계좌 스냅샷
+
+    /v1/accounts를 refresh_interval마다 한 번만 불러와 dict[currency, Account]로 보관하므로
+    잔고/주문중/평단가 조회는 API 호출 없이 O(1)이다.
+    스냅샷 사이에는 OrderManager의 지정가 체결 이벤트(apply_fill)를 로컬에 반영하고,
+    체결가를 알 수 없는 시장가 체결이나 주문 종료 시에는 다음 조회에서 다시 불러온다.
+    스냅샷은 조회 시작/완료 시각을 함께 보관해 이미 반영된 체결을 다시 더하지 않는다.
+    """
+
+    def __init__(self, account_service: AccountService, refresh_interval: float = ACCOUNT_REFRESH_INTERVAL):
+        self.account_service = account_service
+        self.refresh_interval = refresh_interval
+        self._accounts: dict[str, Account] = {}
+        self._refreshed_at: float | None = None
+        self._fetch_started_at: float | None = None  # 스냅샷 조회 요청 시작 시각 - 이전 체결은 모두 포함
+        self._fetch_finished_at: float | None = None # 스냅샷 조회 응답 수신 시각 - 이후 체결은 포함되지 않음
+        self._fill_applied_at: float | None = None  # 로컬 반영한 마지막 체결의 polled_at
+        self._lock = threading.Lock()
+
+    @property
+    def stale(self) -> bool:
+        refreshed_at = self._refreshed_at
+        return refreshed_at is None or time.monotonic() - refreshed_at >= self.refresh_interval
+
+    def refresh(self) -> dict[str, Account]:
+        started = time.monotonic()
+        accounts = {account.currency: account for account in self.account_service.get_accounts()}
+        with self._lock:
+            self._accounts = accounts
+            self._fetch_started_at = started
+            self._fetch_finished_at = time.monotonic()
+            # 조회 중 로컬에 반영한 체결은 이 스냅샷에 포함됐는지 알 수 없으므로 다음 조회에서 다시 맞춘다
+            fill_applied_at = self._fill_applied_at
+            self._refreshed_at = None if fill_applied_at is not None and fill_applied_at > started else self._fetch_finished_at
+        return accounts
+
+    def invalidate(self):
+        """다음 조회 때 스냅샷을 다시 불러오도록 표시 (주문 접수 직후 등)"""
+        self._refreshed_at = None
+
+    def snapshot(self) -> dict[str, Account]:
+        if self.stale:
+            return dict(self.refresh())
+        return dict(self._accounts)
+
+    def account(self, currency: str) -> Account | None:
+        accounts = self.refresh() if self.stale else self._accounts
+        return accounts.get(currency.upper())
+
+    def balance(self, currency: str = ACCOUNT_BASE_CURRENCY) -> float:
+        account = self.account(currency)
+        return account.balance if account is not None else 0.0
+
+    def locked(self, currency: str) -> float:
+        account = self.account(currency)
+        return account.locked if account is not None else 0.0
+
+    def avg_buy_price(self, currency: str) -> float:
+        account = self.account(currency)
+        return account.avg_buy_price if account is not None else 0.0
+
+    def balances(self, currencies: list[str]) -> dict[str, float]:
+        """여러 통화 잔고를 한 번의 스냅샷에서 조회"""
+        accounts = self.refresh() if self.stale else self._accounts
+        result = {}
+        for currency in currencies:
+            account = accounts.get(currency.upper())
+            result[currency] = account.balance if account is not None else 0.0
+        return result
+
+    def apply_fill(self, event: OrderFillEvent):
+        """체결 이벤트를 스냅샷에 반영 - OrderManager.add_callback(account_state.apply_fill)로 연결"""
+        if event.closed or event.ord_type != OrderType.LIMIT or event.price is None:
+            # 취소 시 잔여 주문중 금액/예약 수수료 해제, 시장가 체결가는 서버 값으로 맞춘다
+            self.invalidate()
+        if event.filled_volume <= 0 or event.ord_type != OrderType.LIMIT or event.price is None:
+            return
+
+        quote, base = event.market.split("-", 1)
+        volume = event.filled_volume
+        funds = volume * event.price
+        with self._lock:
+            fetch_started_at = self._fetch_started_at
+            if fetch_started_at is not None and event.polled_at is not None and fetch_started_at >= event.polled_at:
+                return # 체결 이후에 조회를 시작한 스냅샷이 이미 포함
+            if fetch_started_at is not None and (
+                event.previous_polled_at is None or self._fetch_finished_at > event.previous_polled_at
+            ):
+                # 체결 시각과 스냅샷 조회 시각이 겹쳐 포함 여부를 알 수 없으면 로컬 반영 대신 다시 불러온다
+                self._refreshed_at = None
+                return
+
+            accounts = dict(self._accounts)
+            quote_account = accounts.get(quote) or self._empty(quote)
+            base_account = accounts.get(base) or self._empty(base, quote)
+
+            if event.side == OrderSide.BID:
+                held = base_account.balance + base_account.locked
+                accounts[quote] = quote_account.model_copy(update={
+                    "locked": max(quote_account.locked - funds - event.fee, 0.0),
+                })
+                accounts[base] = base_account.model_copy(update={
+                    "balance": base_account.balance + volume,
+                    "avg_buy_price": (base_account.avg_buy_price * held + funds) / (held + volume),
+                })
+            else:
+                accounts[base] = base_account.model_copy(update={
+                    "locked": max(base_account.locked - volume, 0.0),
+                })
+                accounts[quote] = quote_account.model_copy(update={
+                    "balance": quote_account.balance + funds - event.fee,
+                })
+            # 조회 스레드는 락 없이 읽으므로 dict를 통째로 교체
+            self._accounts = accounts
+            self._fill_applied_at = event.polled_at if event.polled_at is not None else time.monotonic()
+
+    @staticmethod
+    def _empty(currency: str, unit_currency: str = ACCOUNT_BASE_CURRENCY) -> Account:
+        return Account(
+            currency=currency,
+            balance=0.0,
+            locked=0.0,
+            avg_buy_price=0.0,
+            avg_buy_price_modified=False,
+            unit_currency=unit_currency,
+        )
@@ -3,15 +3,33 @@ from accounts.bithumb.v2_1_0.services.account_service import AccountService
 from accounts.bithumb.v2_1_0.services.ticker_service import TickerService
 from accounts.bithumb.v2_1_0.services.order_service import OrderService
 from accounts.bithumb.v2_1_0.services.candle_service import CandleService
+from accounts.bithumb.v2_1_0.config.response_cache import ResponseCache
+from accounts.bithumb.v2_1_0.enums import DecodeMode
 
 
 class BithumbAPI:
-    def __init__(self, api_key: str, api_secret_key: str):
-        self._client = BithumbClient(api_key, api_secret_key)
+    def __init__(
+        self,
+        api_key: str,
+        api_secret_key: str,
+        decode_mode: DecodeMode = DecodeMode.FIELDS,
+        use_response_cache: bool = True,
+        **client_options,
+    ):
+        """use_response_cache: 같은 판단 주기 안의 중복 시세 조회를 짧은 TTL 캐시로 합침"""
+        if use_response_cache:
+            client_options.setdefault("response_cache", ResponseCache())
+        self._client = BithumbClient(api_key, api_secret_key, **client_options)
         self._account_service = None
         self._ticker_service = None
         self._order_service = None
         self._candle_service = None
+        self.decode_mode = decode_mode
+
+    @property
+    def response_cache(self) -> ResponseCache | None:
+        """시세 응답 캐시 (hit/miss 통계는 response_cache.stats)"""
+        return self._client.response_cache
 
     @property
     def account(self) -> AccountService:
@@ -24,7 +42,7 @@ class BithumbAPI:
     def ticker(self) -> TickerService:
         """시세 조회 서비스"""
         if self._ticker_service is None:
-            self._ticker_service = TickerService(self._client)
+            self._ticker_service = TickerService(self._client, self.decode_mode)
         return self._ticker_service
 
     @property
@@ -38,5 +56,15 @@ class BithumbAPI:
     def candle(self) -> CandleService:
         """캔들 조회 서비스"""
         if self._candle_service is None:
-            self._candle_service = CandleService(self._client)
+            self._candle_service = CandleService(self._client, self.decode_mode)
         return self._candle_service
+
+    def close(self):
+        """HTTP 커넥션 풀 정리"""
+        self._client.close()
+
+    def __enter__(self) -> "BithumbAPI":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,70 @@
+from accounts.bithumb.v2_1_0.config.async_bithumb_client import AsyncBithumbClient
+from accounts.bithumb.v2_1_0.services.account_service import AsyncAccountService
+from accounts.bithumb.v2_1_0.services.ticker_service import AsyncTickerService
+from accounts.bithumb.v2_1_0.services.order_service import AsyncOrderService
+from accounts.bithumb.v2_1_0.services.candle_service import AsyncCandleService
+from accounts.bithumb.v2_1_0.config.response_cache import ResponseCache
+from accounts.bithumb.v2_1_0.enums import DecodeMode
+
+
+class AsyncBithumbAPI:
+    def __init__(
+        self,
+        api_key: str,
+        api_secret_key: str,
+        decode_mode: DecodeMode = DecodeMode.FIELDS,
+        use_response_cache: bool = True,
+        **client_options,
+    ):
+        """use_response_cache: 같은 판단 주기 안의 중복 시세 조회를 짧은 TTL 캐시로 합침"""
+        if use_response_cache:
+            client_options.setdefault("response_cache", ResponseCache())
+        self._client = AsyncBithumbClient(api_key, api_secret_key, **client_options)
+        self._account_service = None
+        self._ticker_service = None
+        self._order_service = None
+        self._candle_service = None
+        self.decode_mode = decode_mode
+
+    @property
+    def response_cache(self) -> ResponseCache | None:
+        """시세 응답 캐시 (hit/miss 통계는 response_cache.stats)"""
+        return self._client.response_cache
+
+    @property
+    def account(self) -> AsyncAccountService:
+        """계정 관련 서비스"""
+        if self._account_service is None:
+            self._account_service = AsyncAccountService(self._client)
+        return self._account_service
+
+    @property
+    def ticker(self) -> AsyncTickerService:
+        """시세 조회 서비스"""
+        if self._ticker_service is None:
+            self._ticker_service = AsyncTickerService(self._client, self.decode_mode)
+        return self._ticker_service
+
+    @property
+    def order(self) -> AsyncOrderService:
+        """주문 서비스"""
+        if self._order_service is None:
+            self._order_service = AsyncOrderService(self._client)
+        return self._order_service
+
+    @property
+    def candle(self) -> AsyncCandleService:
+        """캔들 조회 서비스"""
+        if self._candle_service is None:
+            self._candle_service = AsyncCandleService(self._client, self.decode_mode)
+        return self._candle_service
+
+    async def close(self):
+        """aiohttp 세션 정리"""
+        await self._client.close()
+
+    async def __aenter__(self) -> "AsyncBithumbAPI":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
@@ -1,16 +1,35 @@
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 from interfaces.exchange import ExchangeInterface
 from accounts.bithumb.v2_1_0.api import BithumbAPI
 from common.schema import OHLC
+from common.ohlc_frame import OHLCFrame
+from accounts.bithumb.v2_1_0.schema import Candle
 from accounts.bithumb.v2_1_0.constants import ACCOUNT_BASE_CURRENCY
+from accounts.bithumb.v2_1_0.candle_store import CandleStore
+from accounts.bithumb.v2_1_0.enums import CandleInterval
+from accounts.bithumb.v2_1_0.account_state import AccountState
+
+if TYPE_CHECKING:
+    # 스트림을 쓰지 않으면 aiohttp를 불러오지 않는다
+    from accounts.bithumb.v2_1_0.market_stream import MarketStream
 
 class BithumbExchange(ExchangeInterface):
-    def __init__(self, api: BithumbAPI):
+    def __init__(
+        self,
+        api: BithumbAPI,
+        candle_store: CandleStore | None = None,
+        market_stream: "MarketStream | None" = None,
+        account_state: AccountState | None = None,
+    ):
         self.api = api
+        self.candle_store = candle_store
+        self.market_stream = market_stream
+        self.account_state = account_state
 
     def candles(self, market: str, count: int) -> list[OHLC]:
-        candles = self.api.candle.get_daily_candles(market, count=count)
+        candles = self._daily_candles(market, count)
 
         ohlcs = [
             OHLC(
@@ -24,22 +43,83 @@ class BithumbExchange(ExchangeInterface):
 
         return ohlcs
 
-    def current_price(self, market: str) -> float:
-        tickers = self.api.ticker.get_ticker(market)
+    def candles_frame(self, market: str, count: int) -> OHLCFrame:
+        if self.candle_store is not None:
+            self.candle_store.sync(self.api.candle, market, CandleInterval.DAY, count)
+            return self.candle_store.latest_frame(market, CandleInterval.DAY, count)
+
+        candles = self.api.candle.get_daily_candles(market, count=count)
+
+        return OHLCFrame(
+            high=[candle.high_price for candle in candles],
+            low=[candle.low_price for candle in candles],
+            close=[candle.trade_price for candle in candles],
+            trade_date=[candle.candle_date_time_kst[:10] for candle in candles],
+        )
+
+    def _daily_candles(self, market: str, count: int) -> list[Candle]:
+        if self.candle_store is None:
+            return self.api.candle.get_daily_candles(market, count=count)
+
+        self.candle_store.sync(self.api.candle, market, CandleInterval.DAY, count)
+        return self.candle_store.latest(market, CandleInterval.DAY, count)
+
+    def current_price(self, market: str, fresh: bool = False) -> float:
+        """스트림에 최신 가격이 있으면 바로 반환, 없거나 오래됐으면 REST 조회
+
+        REST 조회는 기본적으로 응답 캐시(1초)를 거쳐 한 주기 안의 매수/청산/추가매수 판단이 같은 시세를 공유한다.
+        손절처럼 캐시된 값을 쓰면 안 되는 호출은 fresh=True로 캐시를 건너뛴다.
+        """
+        if self.market_stream is not None:
+            price = self.market_stream.price(market)
+            if price is not None:
+                return price
+
+        tickers = self.api.ticker.get_ticker(market, fresh=fresh)
         if not tickers or len(tickers) == 0:
             raise ValueError(f"{market}의 현재가를 조회할 수 없습니다.")
         return tickers[0].trade_price
 
+    def current_prices(self, markets: list[str], fresh: bool = False) -> dict[str, float]:
+        prices = self.market_stream.prices(markets) if self.market_stream is not None else {}
+        stale = [market for market in markets if market not in prices]
+        if not stale:
+            return prices
+
+        tickers = self.api.ticker.get_tickers(stale, fresh=fresh)
+        missing = [market for market in stale if market not in tickers]
+        if missing:
+            raise ValueError(f"{missing}의 현재가를 조회할 수 없습니다.")
+        prices.update((market, ticker.trade_price) for market, ticker in tickers.items())
+        return prices
+
     def buy(self, market: str, amount: float):
-        return self.api.order.execute_market_buy_order(market, amount)
+        order = self.api.order.execute_market_buy_order(market, amount)
+        if self.account_state is not None:
+            self.account_state.invalidate()
+        return order
 
     def sell(self, market: str, volume: float):
-        return self.api.order.execute_market_sell_order(market, volume)
+        order = self.api.order.execute_market_sell_order(market, volume)
+        if self.account_state is not None:
+            self.account_state.invalidate()
+        return order
 
     def balance(self, currency: str = ACCOUNT_BASE_CURRENCY) -> float:
         """잔고 조회 - 'KRW', 'BTC' 가능"""
+        if self.account_state is not None:
+            return self.account_state.balance(currency)
+
         accounts = self.api.account.get_accounts()
         for account in accounts:
             if account.currency == currency:
                 return account.balance
         return 0.0
+
+    def balances(self, currencies: list[str]) -> dict[str, float]:
+        """여러 통화 잔고를 한 번의 계좌 조회로 반환"""
+        if self.account_state is not None:
+            return self.account_state.balances(currencies)
+
+        accounts = {account.currency: account.balance for account in self.api.account.get_accounts()}
+        return {currency: accounts.get(currency, 0.0) for currency in currencies}
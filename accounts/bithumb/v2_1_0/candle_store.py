@@ -0,0 +1,163 @@
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+
+from common.ohlc_frame import OHLCFrame
+from accounts.bithumb.v2_1_0.constants import CANDLE_PAGE_SIZE
+from accounts.bithumb.v2_1_0.enums import CandleInterval
+from accounts.bithumb.v2_1_0.schema import Candle
+from accounts.bithumb.v2_1_0.services.candle_service import CandleService
+
+_CANDLE_COLUMNS = tuple(Candle.model_fields)
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS candles (
+    interval TEXT NOT NULL,
+    market TEXT NOT NULL,
+    candle_date_time_utc TEXT NOT NULL,
+    candle_date_time_kst TEXT NOT NULL,
+    opening_price REAL NOT NULL,
+    high_price REAL NOT NULL,
+    low_price REAL NOT NULL,
+    trade_price REAL NOT NULL,
+    timestamp INTEGER NOT NULL,
+    candle_acc_trade_price REAL NOT NULL,
+    candle_acc_trade_volume REAL NOT NULL,
+    prev_closing_price REAL NOT NULL,
+    change_price REAL NOT NULL,
+    change_rate REAL NOT NULL,
+    converted_trade_price REAL,
+    PRIMARY KEY (market, interval, candle_date_time_utc)
+) WITHOUT ROWID
+"""
+
+
+class CandleStore:
+    """마켓/캔들 주기별 캔들을 저장하는 SQLite 저장소
+
+    sync()는 마지막으로 저장된 캔들 이후 구간(아직 마감되지 않은 마지막 봉 포함)만
+    조회하므로 매 틱마다 전체 구간을 다시 받지 않는다.
+    """
+
+    def __init__(self, path: str | Path = ":memory:"):
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_CREATE_TABLE)
+        self._conn.commit()
+        self._exhausted: set[tuple[str, CandleInterval]] = set()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "CandleStore":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def upsert(self, candles: list[Candle], interval: CandleInterval = CandleInterval.DAY):
+        """같은 시각의 캔들은 최신 값으로 덮어씀 (진행 중인 봉 갱신)"""
+        rows = [
+            (interval.value, *(getattr(candle, column) for column in _CANDLE_COLUMNS))
+            for candle in candles
+        ]
+        placeholders = ", ".join("?" * (len(_CANDLE_COLUMNS) + 1))
+        with self._lock:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO candles (interval, {', '.join(_CANDLE_COLUMNS)}) VALUES ({placeholders})",
+                rows,
+            )
+            self._conn.commit()
+
+    def latest(self, market: str, interval: CandleInterval = CandleInterval.DAY, count: int = CANDLE_PAGE_SIZE) -> list[Candle]:
+        """최근 count개 캔들 (과거→최신 순서)"""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(_CANDLE_COLUMNS)} FROM candles "
+                "WHERE market = ? AND interval = ? ORDER BY candle_date_time_utc DESC LIMIT ?",
+                (market, interval.value, count),
+            ).fetchall()
+
+        rows.reverse()
+        return [Candle(**dict(zip(_CANDLE_COLUMNS, row))) for row in rows]
+
+    def latest_frame(self, market: str, interval: CandleInterval = CandleInterval.DAY, count: int = CANDLE_PAGE_SIZE) -> OHLCFrame:
+        """최근 count개 캔들을 Candle 객체 생성 없이 배열로 조회 (과거→최신 순서)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT high_price, low_price, trade_price, substr(candle_date_time_kst, 1, 10) FROM candles "
+                "WHERE market = ? AND interval = ? ORDER BY candle_date_time_utc DESC LIMIT ?",
+                (market, interval.value, count),
+            ).fetchall()
+
+        rows.reverse()
+        high, low, close, trade_date = zip(*rows) if rows else ((), (), (), ())
+        return OHLCFrame(high, low, close, trade_date)
+
+    def count(self, market: str, interval: CandleInterval = CandleInterval.DAY) -> int:
+        with self._lock:
+            (count,) = self._conn.execute(
+                "SELECT COUNT(*) FROM candles WHERE market = ? AND interval = ?",
+                (market, interval.value),
+            ).fetchone()
+        return count
+
+    def first_time(self, market: str, interval: CandleInterval = CandleInterval.DAY) -> datetime | None:
+        return self._edge_time("MIN", market, interval)
+
+    def last_time(self, market: str, interval: CandleInterval = CandleInterval.DAY) -> datetime | None:
+        return self._edge_time("MAX", market, interval)
+
+    def _edge_time(self, func: str, market: str, interval: CandleInterval) -> datetime | None:
+        with self._lock:
+            (value,) = self._conn.execute(
+                f"SELECT {func}(candle_date_time_utc) FROM candles WHERE market = ? AND interval = ?",
+                (market, interval.value),
+            ).fetchone()
+        return datetime.fromisoformat(value) if value else None
+
+    def sync(
+        self,
+        candle_service: CandleService,
+        market: str,
+        interval: CandleInterval = CandleInterval.DAY,
+        count: int = CANDLE_PAGE_SIZE,
+    ) -> int:
+        """새 캔들과 진행 중인 마지막 봉만 받아오고, 저장분이 count보다 적으면 과거를 보충
+
+        Returns: 저장(갱신 포함)한 캔들 수
+        """
+        synced = 0
+        last_time = self.last_time(market, interval)
+
+        if last_time is None:
+            candles = list(candle_service.iter_candle_history(market, interval, limit=count))
+            if len(candles) < count:
+                self._exhausted.add((market, interval))
+        else:
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            missing = max((now - last_time) // interval.duration, 0) + 1  # 마지막 저장 봉 포함
+            if missing <= CANDLE_PAGE_SIZE:
+                candles = candle_service.get_candles(market, interval, count=missing)
+            else:
+                candles = list(candle_service.iter_candle_history(market, interval, since=last_time))
+
+        self.upsert(candles, interval)
+        synced += len(candles)
+
+        if (market, interval) not in self._exhausted:
+            stored = self.count(market, interval)
+            if stored < count:
+                older = list(candle_service.iter_candle_history(
+                    market, interval, to=self.first_time(market, interval), limit=count - stored
+                ))
+                if len(older) < count - stored:
+                    self._exhausted.add((market, interval))  # 상장일 이전 데이터 없음
+                self.upsert(older, interval)
+                synced += len(older)
+
+        return synced
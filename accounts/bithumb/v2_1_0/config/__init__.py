@@ -1,7 +1,36 @@
-from accounts.bithumb.v2_1_0.config.bithumb_client import BithumbClient
-from accounts.bithumb.v2_1_0.config.settings import settings
+from typing import TYPE_CHECKING
+
+from common.lazy import lazy_attributes
+
+_LAZY_ATTRIBUTES = {
+    'BithumbAuth': 'accounts.bithumb.v2_1_0.config.auth',
+    'RateLimiter': 'accounts.bithumb.v2_1_0.config.rate_limiter',
+    'RetryPolicy': 'accounts.bithumb.v2_1_0.config.rate_limiter',
+    'TokenBucket': 'accounts.bithumb.v2_1_0.config.rate_limiter',
+    'ResponseCache': 'accounts.bithumb.v2_1_0.config.response_cache',
+    'BithumbClient': 'accounts.bithumb.v2_1_0.config.bithumb_client',
+    'AsyncBithumbClient': 'accounts.bithumb.v2_1_0.config.async_bithumb_client',
+    'settings': 'accounts.bithumb.v2_1_0.config.settings',
+}
+
+if TYPE_CHECKING:
+    from accounts.bithumb.v2_1_0.config.auth import BithumbAuth
+    from accounts.bithumb.v2_1_0.config.rate_limiter import RateLimiter, RetryPolicy, TokenBucket
+    from accounts.bithumb.v2_1_0.config.response_cache import ResponseCache
+    from accounts.bithumb.v2_1_0.config.bithumb_client import BithumbClient
+    from accounts.bithumb.v2_1_0.config.async_bithumb_client import AsyncBithumbClient
+    from accounts.bithumb.v2_1_0.config.settings import settings
 
 __all__ = [
+    'BithumbAuth',
+    'RateLimiter',
+    'ResponseCache',
+    'RetryPolicy',
+    'TokenBucket',
     'BithumbClient',
+    'AsyncBithumbClient',
     'settings',
 ]
+
+
+__getattr__, __dir__ = lazy_attributes(globals(), _LAZY_ATTRIBUTES)
@@ -0,0 +1,236 @@
+import json
+import time
+import aiohttp
+
+from accounts.bithumb.v2_1_0.config import client_metrics
+from accounts.bithumb.v2_1_0.config.auth import BithumbAuth
+from accounts.bithumb.v2_1_0.config.rate_limiter import RateLimiter, RetryPolicy
+from accounts.bithumb.v2_1_0.config.response_cache import ResponseCache
+from accounts.bithumb.v2_1_0.constants import (
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+)
+from accounts.bithumb.v2_1_0.enums import ApiType
+from common.metrics import metrics
+
+
+class AsyncBithumbClient:
+    """BithumbClient의 asyncio 버전 - 하나의 aiohttp 세션을 공유"""
+    BASE_URL = "https://api.bithumb.com"
+
+    def __init__(
+        self,
+        api_key: str,
+        api_secret_key: str,
+        base_url: str | None = None,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        timeout: float | tuple[float, float] = (DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT),
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        response_cache: ResponseCache | None = None,
+    ):
+        self.api_key = api_key
+        self.secret_key = api_secret_key
+        self._auth = BithumbAuth(api_key, api_secret_key)
+        self.base_url = base_url or self.BASE_URL
+        self.pool_maxsize = pool_maxsize
+        self.timeout = self._to_client_timeout(timeout)
+        self._session: aiohttp.ClientSession | None = None
+        # BithumbClient와 같은 RateLimiter를 넘기면 동기/비동기 요청이 함께 제한된다
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.response_cache = response_cache
+
+    @staticmethod
+    def _to_client_timeout(timeout: float | tuple[float, float] | None) -> aiohttp.ClientTimeout | None:
+        if timeout is None:
+            return None
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return aiohttp.ClientTimeout(connect=connect, sock_read=read)
+        return aiohttp.ClientTimeout(total=timeout)
+
+    @staticmethod
+    def _query_params(request_body: dict) -> list[tuple[str, str]]:
+        """리스트 값(uuids[] 등)은 같은 키를 반복 - requests의 params 인코딩과 동일"""
+        params = []
+        for key, value in request_body.items():
+            if isinstance(value, (list, tuple)):
+                params.extend((key, str(item)) for item in value)
+            else:
+                params.append((key, str(value)))
+        return params
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """실행 중인 이벤트 루프에서 세션을 지연 생성"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_maxsize, keepalive_timeout=30)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+        return self._session
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> "AsyncBithumbClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _send(
+        self,
+        api_type: ApiType,
+        method: str,
+        url: str,
+        make_headers,
+        idempotent: bool = True,
+        **kwargs,
+    ) -> tuple[int, dict | list]:
+        """BithumbClient._send의 asyncio 버전"""
+        enabled = metrics.enabled
+        if enabled:
+            labels = (url.removeprefix(self.base_url), method)
+
+        attempt = 0
+        while True:
+            await self.rate_limiter.acquire_async(api_type)
+            if enabled:
+                started = time.perf_counter()
+                headers = make_headers()
+                signed = time.perf_counter()
+                client_metrics.AUTH_SECONDS.observe(signed - started, (api_type,))
+            else:
+                headers = make_headers()
+
+            try:
+                async with self.session.request(method, url, headers=headers, **kwargs) as response:
+                    status = response.status
+                    retry = self.retry_policy.should_retry(status, attempt, idempotent)
+                    data = None if retry else await response.json(content_type=None)
+                    retry_after = response.headers.get("Retry-After")
+            except Exception as e:
+                if enabled:
+                    client_metrics.REQUEST_ERRORS.inc(labels + (type(e).__name__,))
+                raise
+            finally:
+                if enabled:
+                    client_metrics.REQUEST_SECONDS.observe(time.perf_counter() - signed, labels)
+
+            if enabled:
+                client_metrics.RESPONSES.inc(labels + (str(status),))
+            if not retry:
+                return status, data
+
+            if enabled:
+                client_metrics.RETRIES.inc(labels + (str(status),))
+            self.rate_limiter.backoff(api_type, self.retry_policy.delay(attempt, retry_after))
+            attempt += 1
+
+    async def call_private_api(self, endpoint: str, timeout: float | tuple[float, float] | None = None) -> dict:
+        try:
+            status_code, data = await self._send(
+                ApiType.PRIVATE,
+                "GET",
+                f"{self.base_url}{endpoint}",
+                self._auth.headers,
+                timeout=self._to_client_timeout(timeout) or self.timeout,
+            )
+            return {
+                'status_code': status_code,
+                'data': data
+            }
+        except Exception as e:
+            return {
+                'status_code': 0,
+                'data': {"error": str(e)}
+            }
+
+    async def call_public_api(
+        self,
+        endpoint: str,
+        params: dict,
+        timeout: float | tuple[float, float] | None = None,
+        use_cache: bool = True,
+    ) -> dict:
+        """use_cache=False면 캐시를 거치지 않고 항상 새로 조회"""
+        cache = self.response_cache
+        if cache is None:
+            return await self._call_public_api(endpoint, params, timeout)
+        if not use_cache:
+            cache.record_bypass()
+            return await self._call_public_api(endpoint, params, timeout)
+        return await cache.get_or_load_async(endpoint, params, lambda: self._call_public_api(endpoint, params, timeout))
+
+    async def _call_public_api(
+        self,
+        endpoint: str,
+        params: dict,
+        timeout: float | tuple[float, float] | None = None,
+    ) -> dict:
+        headers = {"accept": "application/json"}
+
+        try:
+            status_code, data = await self._send(
+                ApiType.PUBLIC,
+                "GET",
+                f"{self.base_url}{endpoint}",
+                lambda: headers,
+                params={key: str(value) for key, value in params.items()},
+                timeout=self._to_client_timeout(timeout) or self.timeout,
+            )
+            return {
+                'status_code': status_code,
+                'data': data
+            }
+        except Exception as e:
+            return {
+                'status_code': 400,
+                'data': {"error": str(e)}
+            }
+
+    async def call_order_api(
+        self,
+        endpoint: str,
+        request_body: dict,
+        method: str = "POST",
+        timeout: float | tuple[float, float] | None = None,
+    ) -> dict:
+        try:
+            method = method.upper()
+            make_headers = lambda: self._auth.order_headers(request_body)
+            url = f"{self.base_url}{endpoint}"
+            timeout = self._to_client_timeout(timeout) or self.timeout
+
+            if method == "POST":
+                # 주문 생성/취소는 중복 실행될 수 있어 429만 재시도
+                status_code, data = await self._send(
+                    ApiType.ORDER, method, url, make_headers,
+                    idempotent=False, data=json.dumps(request_body), timeout=timeout,
+                )
+            elif method == "DELETE":
+                status_code, data = await self._send(
+                    ApiType.ORDER, method, url, make_headers,
+                    idempotent=False, params=self._query_params(request_body), timeout=timeout,
+                )
+            elif method == "GET":
+                status_code, data = await self._send(
+                    ApiType.PRIVATE, method, url, make_headers,
+                    params=self._query_params(request_body), timeout=timeout,
+                )
+            else:
+                raise ValueError(f"Unsupported HTTP method: {method}")
+
+            return {
+                "status_code": status_code,
+                "data": data
+            }
+
+        except Exception as e:
+            return {
+                "status_code": 0,
+                "data": {"error": str(e)}
+            }
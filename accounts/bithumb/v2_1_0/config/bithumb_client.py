@@ -1,39 +1,132 @@
-import jwt
-import uuid
-import time
 import json
-import hashlib
-from urllib.parse import urlencode
+import time
 import requests
+from requests.adapters import HTTPAdapter
+
+from accounts.bithumb.v2_1_0.config import client_metrics
+from accounts.bithumb.v2_1_0.config.auth import BithumbAuth
+from accounts.bithumb.v2_1_0.config.rate_limiter import RateLimiter, RetryPolicy
+from accounts.bithumb.v2_1_0.config.response_cache import ResponseCache
+from accounts.bithumb.v2_1_0.constants import (
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+)
+from accounts.bithumb.v2_1_0.enums import ApiType
+from common.metrics import metrics
 
 
 class BithumbClient:
     BASE_URL = "https://api.bithumb.com"
 
-    def __init__(self, api_key: str, api_secret_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        api_secret_key: str,
+        base_url: str | None = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        timeout: float | tuple[float, float] = (DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT),
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        response_cache: ResponseCache | None = None,
+    ):
         self.api_key = api_key
         self.secret_key = api_secret_key
-
-    def _generate_jwt_token(self) -> str:
-        payload = {
-            'access_key': self.api_key,
-            'nonce': str(uuid.uuid4()),
-            'timestamp': round(time.time() * 1000)
-        }
-        return jwt.encode(payload, self.secret_key, algorithm='HS256')
-
-    def _get_headers(self) -> dict[str, str]:
-        jwt_token = self._generate_jwt_token()
-        return {'Authorization': f'Bearer {jwt_token}'}
-
-    def call_private_api(self, endpoint: str) -> dict:
-        headers = self._get_headers()
-
+        self._auth = BithumbAuth(api_key, api_secret_key)
+        self.base_url = base_url or self.BASE_URL
+        self.timeout = timeout
+        self._session = self._create_session(pool_connections, pool_maxsize)
+        # 여러 클라이언트가 같은 계정/IP를 쓰면 rate_limiter를 공유해야 제한이 합산된다
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.response_cache = response_cache
+
+    @staticmethod
+    def _create_session(pool_connections: int, pool_maxsize: int) -> requests.Session:
+        """keep-alive 커넥션을 재사용하는 세션 생성"""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self):
+        """풀에 남아있는 커넥션 정리"""
+        self._session.close()
+
+    def __enter__(self) -> "BithumbClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _send(
+        self,
+        api_type: ApiType,
+        method: str,
+        url: str,
+        make_headers,
+        idempotent: bool = True,
+        **kwargs,
+    ) -> tuple[int, dict | list]:
+        """요청 수 제한을 지키며 전송하고 429/5xx는 백오프 후 재시도
+
+        JWT nonce는 재사용할 수 없으므로 시도마다 make_headers()로 헤더를 새로 만든다.
+        metrics가 켜져 있으면 인증/요청 시간, 상태 코드, 재시도, 예외 수를 기록한다.
+        """
+        enabled = metrics.enabled
+        if enabled:
+            labels = (url.removeprefix(self.base_url), method)
+
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire(api_type)
+            if enabled:
+                started = time.perf_counter()
+                headers = make_headers()
+                signed = time.perf_counter()
+                client_metrics.AUTH_SECONDS.observe(signed - started, (api_type,))
+            else:
+                headers = make_headers()
+
+            try:
+                response = self._session.request(method, url, headers=headers, **kwargs)
+                retry = self.retry_policy.should_retry(response.status_code, attempt, idempotent)
+                data = None if retry else response.json()
+            except Exception as e:
+                if enabled:
+                    client_metrics.REQUEST_ERRORS.inc(labels + (type(e).__name__,))
+                raise
+            finally:
+                if enabled:
+                    client_metrics.REQUEST_SECONDS.observe(time.perf_counter() - signed, labels)
+
+            if enabled:
+                client_metrics.RESPONSES.inc(labels + (str(response.status_code),))
+            if not retry:
+                return response.status_code, data
+
+            if enabled:
+                client_metrics.RETRIES.inc(labels + (str(response.status_code),))
+            delay = self.retry_policy.delay(attempt, response.headers.get("Retry-After"))
+            response.close()
+            self.rate_limiter.backoff(api_type, delay)
+            attempt += 1
+
+    def call_private_api(self, endpoint: str, timeout: float | tuple[float, float] | None = None) -> dict:
         try:
-            response = requests.get(f"{self.BASE_URL}{endpoint}", headers=headers)
+            status_code, data = self._send(
+                ApiType.PRIVATE,
+                "GET",
+                f"{self.base_url}{endpoint}",
+                self._auth.headers,
+                timeout=timeout or self.timeout,
+            )
             return {
-                'status_code': response.status_code,
-                'data': response.json()
+                'status_code': status_code,
+                'data': data
             }
         except Exception as e:
             return {
@@ -41,14 +134,42 @@ class BithumbClient:
                 'data': {"error": str(e)}
             }
 
-    def call_public_api(self, endpoint: str, params: dict) -> dict:
+    def call_public_api(
+        self,
+        endpoint: str,
+        params: dict,
+        timeout: float | tuple[float, float] | None = None,
+        use_cache: bool = True,
+    ) -> dict:
+        """use_cache=False면 캐시를 거치지 않고 항상 새로 조회"""
+        cache = self.response_cache
+        if cache is None:
+            return self._call_public_api(endpoint, params, timeout)
+        if not use_cache:
+            cache.record_bypass()
+            return self._call_public_api(endpoint, params, timeout)
+        return cache.get_or_load(endpoint, params, lambda: self._call_public_api(endpoint, params, timeout))
+
+    def _call_public_api(
+        self,
+        endpoint: str,
+        params: dict,
+        timeout: float | tuple[float, float] | None = None,
+    ) -> dict:
         headers = {"accept": "application/json"}
 
         try:
-            response = requests.get(f"{self.BASE_URL}{endpoint}", headers=headers, params=params)
+            status_code, data = self._send(
+                ApiType.PUBLIC,
+                "GET",
+                f"{self.base_url}{endpoint}",
+                lambda: headers,
+                params=params,
+                timeout=timeout or self.timeout,
+            )
             return {
-                'status_code': response.status_code,
-                'data': response.json()
+                'status_code': status_code,
+                'data': data
             }
         except Exception as e:
             return {
@@ -56,44 +177,44 @@ class BithumbClient:
                 'data': {"error": str(e)}
             }
 
-    def call_order_api(self, endpoint: str, request_body: dict, method: str = "POST") -> dict:
+    def call_order_api(
+        self,
+        endpoint: str,
+        request_body: dict,
+        method: str = "POST",
+        timeout: float | tuple[float, float] | None = None,
+    ) -> dict:
         try:
-            query = urlencode(request_body).encode()
-            hash_obj = hashlib.sha512()
-            hash_obj.update(query)
-            query_hash = hash_obj.hexdigest()
-
-            payload = {
-                'access_key': self.api_key,
-                'nonce': str(uuid.uuid4()),
-                'timestamp': round(time.time() * 1000),
-                'query_hash': query_hash,
-                'query_hash_alg': 'SHA512',
-            }
-
-            jwt_token = jwt.encode(payload, self.secret_key, algorithm='HS256')
-            authorization_token = f'Bearer {jwt_token}'
-
-            headers = {
-                'Authorization': authorization_token,
-                'Content-Type': 'application/json'
-            }
-
-            url = f"{self.BASE_URL}{endpoint}"
-
-            if method.upper() == "POST":
-                response = requests.post(url, data=json.dumps(request_body), headers=headers)
-            elif method.upper() == "DELETE":
-                response = requests.delete(url, data=json.dumps(request_body), headers=headers)
-            elif method.upper() == "GET":
-                response = requests.get(url, headers=headers, params=request_body)
+            method = method.upper()
+            make_headers = lambda: self._auth.order_headers(request_body)
+            url = f"{self.base_url}{endpoint}"
+            timeout = timeout or self.timeout
+
+            if method == "POST":
+                # 주문 생성/취소는 중복 실행될 수 있어 429만 재시도
+                status_code, data = self._send(
+                    ApiType.ORDER, method, url, make_headers,
+                    idempotent=False, data=json.dumps(request_body), timeout=timeout,
+                )
+            elif method == "DELETE":
+                status_code, data = self._send(
+                    ApiType.ORDER, method, url, make_headers,
+                    idempotent=False, params=request_body, timeout=timeout,
+                )
+            elif method == "GET":
+                status_code, data = self._send(
+                    ApiType.PRIVATE, method, url, make_headers, params=request_body, timeout=timeout,
+                )
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
 
             return {
-                "status_code": response.status_code,
-                "data": response.json()
+                "status_code": status_code,
+                "data": data
             }
 
         except Exception as e:
-            return {"error": str(e)}
\ No newline at end of file
+            return {
+                "status_code": 0,
+                "data": {"error": str(e)}
+            }
@@ -0,0 +1,28 @@
+from common.metrics import metrics
+
+# BithumbClient / AsyncBithumbClient 공용 계측 (metrics.enabled일 때만 기록)
+REQUEST_SECONDS = metrics.histogram(
+    "bithumb_request_duration_seconds",
+    "HTTP 요청 한 번(재시도는 각각)의 전송부터 응답 JSON 디코딩까지 소요 시간",
+    ("endpoint", "method"),
+)
+AUTH_SECONDS = metrics.histogram(
+    "bithumb_auth_duration_seconds",
+    "JWT 인증 헤더 생성 소요 시간",
+    ("api_type",),
+)
+RESPONSES = metrics.counter(
+    "bithumb_responses",
+    "상태 코드별 응답 수",
+    ("endpoint", "method", "status"),
+)
+RETRIES = metrics.counter(
+    "bithumb_retries",
+    "429/5xx 응답으로 다시 보낸 요청 수",
+    ("endpoint", "method", "status"),
+)
+REQUEST_ERRORS = metrics.counter(
+    "bithumb_request_errors",
+    "응답을 받지 못했거나 디코딩에 실패한 요청 수 (예외 종류별)",
+    ("endpoint", "method", "error"),
+)
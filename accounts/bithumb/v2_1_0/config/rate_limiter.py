@@ -0,0 +1,159 @@
+import asyncio
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+from accounts.bithumb.v2_1_0.constants import (
+    PUBLIC_API_RATE_LIMIT,
+    PRIVATE_API_RATE_LIMIT,
+    ORDER_API_RATE_LIMIT,
+    RETRY_MAX_ATTEMPTS,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+    RETRY_STATUS_CODES,
+)
+from accounts.bithumb.v2_1_0.enums import ApiType
+
+
+class TokenBucket:
+    """초당 rate개 토큰이 채워지는 버킷
+
+    토큰이 부족하면 음수로 예약해 대기 시간을 돌려주므로, 여러 스레드/코루틴이 동시에
+    요청해도 도착 순서대로 간격이 벌어진다. 락은 계산하는 동안만 잡는다.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        if rate <= 0:
+            raise ValueError(f"rate는 0보다 커야 합니다. 현재 값: {rate}")
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """토큰 1개를 예약하고 사용 가능해질 때까지 남은 시간(초) 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def defer(self, seconds: float):
+        """seconds 동안 토큰을 내주지 않도록 버킷을 비움 (429 등 서버 측 제한 응답 시)"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens = min(self._tokens, 1 - seconds * self.rate)
+
+
+class RateLimiterStats:
+    __slots__ = ("requests", "throttled", "throttled_seconds", "retried")
+
+    def __init__(self):
+        self.requests = 0
+        self.throttled = 0
+        self.throttled_seconds = 0.0
+        self.retried = 0
+
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class RateLimiter:
+    """Public/Private/Order API별 토큰 버킷 (스레드, asyncio 공용)
+
+    동기/비동기 클라이언트가 같은 인스턴스를 공유하면 프로세스 전체 요청 수가 함께 제한된다.
+    """
+
+    def __init__(
+        self,
+        public_rate: float = PUBLIC_API_RATE_LIMIT,
+        private_rate: float = PRIVATE_API_RATE_LIMIT,
+        order_rate: float = ORDER_API_RATE_LIMIT,
+    ):
+        self._buckets = {
+            ApiType.PUBLIC: TokenBucket(public_rate),
+            ApiType.PRIVATE: TokenBucket(private_rate),
+            ApiType.ORDER: TokenBucket(order_rate),
+        }
+        self.stats = {api_type: RateLimiterStats() for api_type in ApiType}
+        self._stats_lock = threading.Lock()
+
+    def acquire(self, api_type: ApiType) -> float:
+        wait = self._reserve(api_type)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, api_type: ApiType) -> float:
+        wait = self._reserve(api_type)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def backoff(self, api_type: ApiType, seconds: float):
+        """재시도 대기 - 같은 버킷을 쓰는 다른 요청도 함께 seconds만큼 늦춘다"""
+        self._buckets[api_type].defer(seconds)
+        with self._stats_lock:
+            self.stats[api_type].retried += 1
+
+    def stats_dict(self) -> dict[str, dict]:
+        with self._stats_lock:
+            return {str(api_type): stats.as_dict() for api_type, stats in self.stats.items()}
+
+    def _reserve(self, api_type: ApiType) -> float:
+        wait = self._buckets[api_type].reserve()
+        with self._stats_lock:
+            stats = self.stats[api_type]
+            stats.requests += 1
+            if wait > 0:
+                stats.throttled += 1
+                stats.throttled_seconds += wait
+        return wait
+
+
+class RetryPolicy:
+    """429/5xx 응답에 대한 지수 백오프 (full jitter, Retry-After 우선)"""
+
+    def __init__(
+        self,
+        max_retries: int = RETRY_MAX_ATTEMPTS,
+        base_delay: float = RETRY_BASE_DELAY,
+        max_delay: float = RETRY_MAX_DELAY,
+        retry_status_codes: frozenset[int] = RETRY_STATUS_CODES,
+    ):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_status_codes = retry_status_codes
+
+    def should_retry(self, status_code: int, attempt: int, idempotent: bool = True) -> bool:
+        if attempt >= self.max_retries or status_code not in self.retry_status_codes:
+            return False
+        # 주문 생성/취소는 5xx여도 처리됐을 수 있으므로 요청 자체가 거절된 429만 재시도
+        return idempotent or status_code == 429
+
+    def delay(self, attempt: int, retry_after: str | None = None) -> float:
+        retry_after_seconds = self._parse_retry_after(retry_after)
+        if retry_after_seconds is not None:
+            return min(retry_after_seconds, self.max_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    @staticmethod
+    def _parse_retry_after(retry_after: str | None) -> float | None:
+        if not retry_after:
+            return None
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            pass
+        try:
+            return max(parsedate_to_datetime(retry_after).timestamp() - time.time(), 0.0)
+        except (TypeError, ValueError):
+            return None
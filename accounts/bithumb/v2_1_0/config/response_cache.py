@@ -0,0 +1,160 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable
+
+from accounts.bithumb.v2_1_0.constants import RESPONSE_CACHE_TTLS, RESPONSE_CACHE_MAX_ENTRIES
+
+
+class _Flight:
+    """진행 중인 동일 요청 - 뒤따라온 호출은 결과를 기다렸다가 함께 받는다"""
+    __slots__ = ("event", "response")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.response: dict | None = None
+
+
+class ResponseCache:
+    """공개 시세 API 응답의 짧은 TTL 캐시
+
+    - 엔드포인트 접두사별 TTL (ttls에 없는 엔드포인트는 캐시하지 않음)
+    - max_entries를 넘으면 가장 오래 사용하지 않은 응답부터 제거 (LRU)
+    - 같은 요청이 동시에 들어오면 한 번만 호출하고 결과를 공유 (single-flight)
+    - status_code 200 응답만 저장
+    스레드와 asyncio 양쪽에서 사용할 수 있다.
+    """
+
+    def __init__(
+        self,
+        ttls: dict[str, float] | None = None,
+        max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+    ):
+        self.ttls = dict(RESPONSE_CACHE_TTLS if ttls is None else ttls)
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, tuple[float, dict]] = OrderedDict()
+        self._flights: dict[tuple, _Flight] = {}
+        self._async_flights: dict[tuple, asyncio.Future] = {}
+        self._ttl_by_endpoint: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "coalesced": 0, "bypassed": 0, "evictions": 0}
+
+    @property
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._stats, size=len(self._entries))
+
+    def ttl(self, endpoint: str) -> float:
+        ttl = self._ttl_by_endpoint.get(endpoint)
+        if ttl is None:
+            ttl = self.ttls.get(endpoint)
+            if ttl is None:
+                prefixes = [prefix for prefix in self.ttls if endpoint.startswith(prefix)]
+                ttl = self.ttls[max(prefixes, key=len)] if prefixes else 0.0
+            self._ttl_by_endpoint[endpoint] = ttl
+        return ttl
+
+    def get_or_load(self, endpoint: str, params: dict, loader: Callable[[], dict]) -> dict:
+        ttl = self.ttl(endpoint)
+        if ttl <= 0:
+            return loader()
+
+        key = self._key(endpoint, params)
+        with self._lock:
+            response = self._lookup(key)
+            if response is not None:
+                return response
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                self._stats["misses"] += 1
+                flight = self._flights[key] = _Flight()
+            else:
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            flight.event.wait()
+            # 앞선 호출이 예외로 끝났으면 직접 호출
+            return flight.response if flight.response is not None else loader()
+
+        try:
+            flight.response = loader()
+        finally:
+            with self._lock:
+                self._store(key, ttl, flight.response)
+                del self._flights[key]
+            flight.event.set()
+        return flight.response
+
+    async def get_or_load_async(self, endpoint: str, params: dict, loader: Callable[[], Awaitable[dict]]) -> dict:
+        ttl = self.ttl(endpoint)
+        if ttl <= 0:
+            return await loader()
+
+        key = self._key(endpoint, params)
+        # Future는 생성한 이벤트 루프에서만 기다릴 수 있으므로 루프별로 합친다
+        flight_key = (asyncio.get_running_loop(), key)
+        with self._lock:
+            response = self._lookup(key)
+            if response is not None:
+                return response
+            flight = self._async_flights.get(flight_key)
+            leader = flight is None
+            if leader:
+                self._stats["misses"] += 1
+                flight = self._async_flights[flight_key] = flight_key[0].create_future()
+            else:
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            response = await asyncio.shield(flight)
+            return response if response is not None else await loader()
+
+        response = None
+        try:
+            response = await loader()
+        finally:
+            with self._lock:
+                self._store(key, ttl, response)
+                del self._async_flights[flight_key]
+            flight.set_result(response)
+        return response
+
+    def record_bypass(self):
+        with self._lock:
+            self._stats["bypassed"] += 1
+
+    def invalidate(self, endpoint: str | None = None):
+        """endpoint로 시작하는 응답 (None이면 전체) 삭제"""
+        with self._lock:
+            if endpoint is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0].startswith(endpoint)]:
+                del self._entries[key]
+
+    @staticmethod
+    def _key(endpoint: str, params: dict) -> tuple:
+        return endpoint, tuple(sorted((key, str(value)) for key, value in params.items()))
+
+    def _lookup(self, key: tuple) -> dict | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        self._stats["hits"] += 1
+        return response
+
+    def _store(self, key: tuple, ttl: float, response: dict | None):
+        if response is None or response.get("status_code") != 200:
+            return
+        self._entries[key] = (time.monotonic() + ttl, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
@@ -1 +1,53 @@
-ACCOUNT_BASE_CURRENCY = 'KRW'
\ No newline at end of file
+ACCOUNT_BASE_CURRENCY = 'KRW'
+
+# HTTP 커넥션 풀
+DEFAULT_POOL_CONNECTIONS = 4   # 호스트별 커넥션 풀 개수
+DEFAULT_POOL_MAXSIZE = 32      # 풀당 유지하는 최대 keep-alive 커넥션 수
+DEFAULT_CONNECT_TIMEOUT = 3.05 # 초
+DEFAULT_READ_TIMEOUT = 10.0    # 초
+
+# /v1/ticker 요청 한 번에 담는 최대 마켓 수 (URL 길이 제한 대비)
+TICKER_MARKETS_CHUNK_SIZE = 100
+
+# 캔들 조회
+CANDLE_PAGE_SIZE = 200              # 캔들 API 1회 최대 조회 개수
+CANDLE_HISTORY_MAX_WORKERS = 4      # 과거 캔들 페이지 동시 요청 수
+CANDLE_TO_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# 빗썸 API 요청 수 제한 (초당)
+PUBLIC_API_RATE_LIMIT = 150
+PRIVATE_API_RATE_LIMIT = 140
+ORDER_API_RATE_LIMIT = 10
+
+# 재시도
+RETRY_MAX_ATTEMPTS = 3          # 최초 요청 제외 재시도 횟수
+RETRY_BASE_DELAY = 0.2          # 초
+RETRY_MAX_DELAY = 5.0           # 초
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# 실시간 시세 WebSocket
+WEBSOCKET_URL = "wss://ws-api.bithumb.com/websocket/v1"
+STREAM_RECONNECT_BASE_DELAY = 0.5   # 초, 재연결마다 두 배
+STREAM_RECONNECT_MAX_DELAY = 30.0   # 초
+STREAM_HEARTBEAT = 30.0             # 초, ping 주기
+STREAM_PRICE_MAX_AGE = 5.0          # 초, 이보다 오래된 스트림 가격은 REST로 대체
+
+# 공개 시세 응답 캐시 (엔드포인트 접두사별 TTL, 초)
+RESPONSE_CACHE_TTLS = {
+    "/v1/ticker": 1.0,
+    "/v1/candles/": 5.0,
+}
+RESPONSE_CACHE_MAX_ENTRIES = 1024
+
+# 인증 토큰
+AUTH_TOKEN_MAX_AGE = 1.0            # 초, 미리 만들어 둔 토큰을 쓸 수 있는 최대 경과 시간
+
+# 주문 추적
+ORDER_STATUS_BATCH_SIZE = 100       # /v1/orders 1회 조회 uuid 최대 개수
+ORDER_POLL_INTERVAL = 1.0           # 초
+# /v1/orders는 기본값(state=wait)이 종료된 주문을 빼고, 열린/종료 상태를 한 요청에 섞을 수 없어 나눠 조회
+ORDER_OPEN_STATES = ('wait', 'watch')
+ORDER_CLOSED_STATES = ('done', 'cancel')
+
+# 계좌 스냅샷
+ACCOUNT_REFRESH_INTERVAL = 5.0      # 초, 이보다 오래된 스냅샷은 조회 시 다시 불러옴
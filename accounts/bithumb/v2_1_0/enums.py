@@ -1,3 +1,4 @@
+from datetime import timedelta
 from enum import StrEnum
 
 
@@ -10,4 +11,53 @@ class OrderSide(StrEnum):
 class OrderType(StrEnum):
     LIMIT = "limit"   # 지정가 주문
     PRICE = "price"   # 시장가 주문(매수)
-    MARKET = "market" # 시장가 주문(매도)
\ No newline at end of file
+    MARKET = "market" # 시장가 주문(매도)
+
+class CandleInterval(StrEnum):
+    MINUTE_1 = "minutes/1"
+    MINUTE_3 = "minutes/3"
+    MINUTE_5 = "minutes/5"
+    MINUTE_10 = "minutes/10"
+    MINUTE_15 = "minutes/15"
+    MINUTE_30 = "minutes/30"
+    MINUTE_60 = "minutes/60"
+    MINUTE_240 = "minutes/240"
+    DAY = "days"
+    WEEK = "weeks"
+
+    @property
+    def endpoint(self) -> str:
+        return f"/v1/candles/{self.value}"
+
+    @property
+    def duration(self) -> timedelta:
+        """캔들 한 개가 차지하는 시간"""
+        if self == CandleInterval.DAY:
+            return timedelta(days=1)
+        if self == CandleInterval.WEEK:
+            return timedelta(weeks=1)
+        return timedelta(minutes=int(self.value.split("/")[1]))
+
+
+class DecodeMode(StrEnum):
+    FIELDS = "fields"       # 필드별 기본값/형변환 후 모델 검증 (기존 방식)
+    VALIDATE = "validate"   # TypeAdapter로 응답 리스트 일괄 검증
+    RECORD = "record"       # 검증/형변환 없는 NamedTuple 레코드 (신뢰 가능한 응답 전용)
+
+
+class ApiType(StrEnum):
+    PUBLIC = "public"   # 시세 조회
+    PRIVATE = "private" # 자산/주문 조회
+    ORDER = "order"     # 주문 생성/취소
+
+
+class StreamChannel(StrEnum):
+    TICKER = "ticker"   # 현재가
+    TRADE = "trade"     # 체결
+
+
+class OrderState(StrEnum):
+    WAIT = "wait"       # 체결 대기
+    WATCH = "watch"     # 예약 주문 대기
+    DONE = "done"       # 전체 체결 완료
+    CANCEL = "cancel"   # 주문 취소
@@ -0,0 +1,252 @@
+import asyncio
+import json
+import random
+import threading
+import time
+import uuid
+from typing import Callable
+
+import aiohttp
+
+from accounts.bithumb.v2_1_0.constants import (
+    WEBSOCKET_URL,
+    STREAM_RECONNECT_BASE_DELAY,
+    STREAM_RECONNECT_MAX_DELAY,
+    STREAM_HEARTBEAT,
+    STREAM_PRICE_MAX_AGE,
+)
+from accounts.bithumb.v2_1_0.enums import StreamChannel
+from accounts.bithumb.v2_1_0.schema import PriceTick
+
+TickCallback = Callable[[PriceTick], None]
+
+
+class MarketStream:
+    """하나의 WebSocket 연결로 여러 마켓의 ticker/trade 채널을 구독하는 실시간 시세 스트림
+
+    백그라운드 스레드가 자체 이벤트 루프로 연결을 유지하며 끊기면 지수 백오프로 재연결한다.
+    최신 가격 테이블은 수신 스레드만 쓰고 항목을 불변 PriceTick으로 통째로 교체하므로,
+    조회 스레드는 락 없이 dict에서 바로 읽는다. 콜백은 수신 스레드에서 호출되므로 짧게 유지해야 한다.
+    """
+
+    def __init__(
+        self,
+        markets: list[str],
+        channels: tuple[StreamChannel, ...] = (StreamChannel.TICKER,),
+        url: str = WEBSOCKET_URL,
+        max_age: float = STREAM_PRICE_MAX_AGE,
+        reconnect_base_delay: float = STREAM_RECONNECT_BASE_DELAY,
+        reconnect_max_delay: float = STREAM_RECONNECT_MAX_DELAY,
+        heartbeat: float = STREAM_HEARTBEAT,
+    ):
+        self.url = url
+        self.channels = tuple(StreamChannel(channel) for channel in channels)
+        self.max_age = max_age
+        self.reconnect_base_delay = reconnect_base_delay
+        self.reconnect_max_delay = reconnect_max_delay
+        self.heartbeat = heartbeat
+
+        self._markets = list(dict.fromkeys(markets))
+        self._prices: dict[str, PriceTick] = {}
+        self._callbacks: tuple[TickCallback, ...] = ()
+        self._callback_lock = threading.Lock()
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._task: asyncio.Task | None = None
+        self._ws: aiohttp.ClientWebSocketResponse | None = None
+        self._stopping = False
+        self._connected = threading.Event()
+
+        self.stats = {"messages": 0, "connects": 0, "disconnects": 0, "decode_errors": 0, "callback_errors": 0}
+        self.last_error: Exception | None = None
+
+    @property
+    def markets(self) -> list[str]:
+        return list(self._markets)
+
+    @property
+    def connected(self) -> bool:
+        return self._connected.is_set()
+
+    def start(self) -> "MarketStream":
+        if self._thread is not None and self._thread.is_alive():
+            return self
+        self._stopping = False
+        self._loop = asyncio.new_event_loop()
+        self._task = self._loop.create_task(self._run()) # 스레드 시작 전에 만들어 stop()이 항상 취소할 수 있게 함
+        self._thread = threading.Thread(target=self._run_loop, name="bithumb-market-stream", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float | None = 5.0):
+        self._stopping = True
+        loop = self._loop
+        task = self._task
+        if loop is not None and task is not None:
+            try:
+                loop.call_soon_threadsafe(task.cancel)
+            except RuntimeError:
+                pass # 루프가 이미 종료됨
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._thread = None
+        self._connected.clear()
+
+    def __enter__(self) -> "MarketStream":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def wait_connected(self, timeout: float | None = None) -> bool:
+        return self._connected.wait(timeout)
+
+    def wait_for_prices(self, markets: list[str] | None = None, timeout: float | None = None) -> bool:
+        """markets 모두 첫 가격을 받을 때까지 대기"""
+        markets = markets or self._markets
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not all(market in self._prices for market in markets):
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def add_callback(self, callback: TickCallback):
+        with self._callback_lock:
+            self._callbacks = self._callbacks + (callback,)
+
+    def remove_callback(self, callback: TickCallback):
+        with self._callback_lock:
+            self._callbacks = tuple(registered for registered in self._callbacks if registered is not callback)
+
+    def subscribe(self, markets: list[str]):
+        """구독 마켓 추가 - 연결 중이면 전체 목록으로 구독 메시지를 다시 보낸다"""
+        added = [market for market in dict.fromkeys(markets) if market not in self._markets]
+        if not added:
+            return
+        self._markets = self._markets + added
+        loop = self._loop
+        if loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(self._send_subscription(), loop)
+
+    def tick(self, market: str) -> PriceTick | None:
+        return self._prices.get(market)
+
+    def price(self, market: str, max_age: float | None = None) -> float | None:
+        """max_age(초) 이내에 받은 가격, 없거나 오래됐으면 None"""
+        tick = self._prices.get(market)
+        if tick is None:
+            return None
+        max_age = self.max_age if max_age is None else max_age
+        if time.monotonic() - tick.received_at > max_age:
+            return None
+        return tick.price
+
+    def prices(self, markets: list[str], max_age: float | None = None) -> dict[str, float]:
+        """신선한 가격이 있는 마켓만 담아 반환"""
+        max_age = self.max_age if max_age is None else max_age
+        oldest = time.monotonic() - max_age
+        prices = {}
+        for market in markets:
+            tick = self._prices.get(market)
+            if tick is not None and tick.received_at >= oldest:
+                prices[market] = tick.price
+        return prices
+
+    def _run_loop(self):
+        loop = self._loop
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self._task)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._task = None
+            self._loop = None
+            loop.close()
+
+    async def _run(self):
+        attempt = 0
+        async with aiohttp.ClientSession() as session:
+            while not self._stopping:
+                try:
+                    async with session.ws_connect(self.url, heartbeat=self.heartbeat) as ws:
+                        self._ws = ws
+                        await self._send_subscription()
+                        self.stats["connects"] += 1
+                        self._connected.set()
+                        attempt = 0
+                        await self._receive(ws)
+                except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+                    self.last_error = e
+                except Exception as e:
+                    # 예상하지 못한 오류로 스트림이 조용히 멈추지 않도록 재연결 경로로 보낸다
+                    self.last_error = e
+                finally:
+                    self._ws = None
+                    if self._connected.is_set():
+                        self.stats["disconnects"] += 1
+                    self._connected.clear()
+
+                if self._stopping:
+                    break
+                delay = min(self.reconnect_max_delay, self.reconnect_base_delay * (2 ** attempt))
+                attempt += 1
+                await asyncio.sleep(random.uniform(delay / 2, delay))
+
+    async def _receive(self, ws: aiohttp.ClientWebSocketResponse):
+        async for message in ws:
+            if message.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                self._handle(message.data)
+            elif message.type == aiohttp.WSMsgType.ERROR:
+                self.last_error = ws.exception()
+                break
+
+    async def _send_subscription(self):
+        ws = self._ws
+        if ws is None or ws.closed:
+            return
+        request = [{"ticket": str(uuid.uuid4())}]
+        request.extend({"type": str(channel), "codes": self._markets} for channel in self.channels)
+        request.append({"format": "DEFAULT"})
+        await ws.send_str(json.dumps(request))
+
+    def _handle(self, raw: str | bytes):
+        try:
+            tick = self._decode(raw)
+        except (ValueError, TypeError, AttributeError) as e:
+            # 잘못된 메시지 하나로 수신을 멈추지 않고 건너뛴다
+            self.stats["decode_errors"] += 1
+            self.last_error = e
+            return
+        if tick is None:
+            return # 구독 응답 등 시세가 아닌 메시지
+
+        self.stats["messages"] += 1
+        previous = self._prices.get(tick.market)
+        if previous is not None and previous.timestamp > tick.timestamp:
+            return # ticker/trade 채널이 섞여 늦게 도착한 이전 체결
+        self._prices[tick.market] = tick
+
+        for callback in self._callbacks:
+            try:
+                callback(tick)
+            except Exception as e:
+                self.stats["callback_errors"] += 1
+                self.last_error = e
+
+    @staticmethod
+    def _decode(raw: str | bytes) -> PriceTick | None:
+        payload = json.loads(raw)
+        market = payload.get("code")
+        price = payload.get("trade_price")
+        if market is None or price is None:
+            return None
+        return PriceTick(
+            market=market,
+            price=float(price),
+            timestamp=int(payload.get("trade_timestamp") or payload.get("timestamp") or 0),
+            received_at=time.monotonic(),
+            channel=payload.get("type", ""),
+        )
@@ -0,0 +1,194 @@
+import threading
+import time
+from typing import Callable
+
+from accounts.bithumb.v2_1_0.constants import ORDER_POLL_INTERVAL
+from accounts.bithumb.v2_1_0.enums import OrderState
+from accounts.bithumb.v2_1_0.schema import Order, OrderFillEvent
+from accounts.bithumb.v2_1_0.services.order_service import OrderService
+
+FillCallback = Callable[[OrderFillEvent], None]
+
+
+class OrderManager:
+    """열린 주문을 한 곳에서 추적하고 체결을 이벤트로 전달
+
+    주문마다 조회 루프를 돌리지 않고, poll() 한 번에 추적 중인 모든 주문을 /v1/orders(uuids[])로
+    묶어 조회한 뒤 직전 상태와의 체결량 차이로 OrderFillEvent를 만든다.
+    일괄 조회 응답에서 빠진 주문은 /v1/order로 하나씩 다시 조회한다.
+    체결 완료(done)나 취소(cancel)된 주문은 마지막 이벤트를 보낸 뒤 추적에서 제외한다.
+    """
+
+    def __init__(self, order_service: OrderService, poll_interval: float = ORDER_POLL_INTERVAL):
+        self.order_service = order_service
+        self.poll_interval = poll_interval
+        self._orders: dict[str, Order] = {}
+        self._observed_at: dict[str, float] = {} # 주문별 마지막 상태 조회 시작 시각
+        self._lock = threading.Lock()
+        self._callbacks: tuple[FillCallback, ...] = ()
+        self._thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
+        self.stats = {"polls": 0, "single_lookups": 0, "callback_errors": 0}
+        self.last_error: Exception | None = None
+
+    @property
+    def open_orders(self) -> list[Order]:
+        with self._lock:
+            return list(self._orders.values())
+
+    def add_callback(self, callback: FillCallback):
+        with self._lock:
+            self._callbacks = self._callbacks + (callback,)
+
+    def remove_callback(self, callback: FillCallback):
+        with self._lock:
+            self._callbacks = tuple(registered for registered in self._callbacks if registered is not callback)
+
+    def track(self, order: Order, observed_at: float | None = None) -> Order:
+        """외부에서 생성한 주문도 추적 대상에 추가 - observed_at은 order를 조회(생성) 요청한 시각 (time.monotonic())"""
+        with self._lock:
+            self._orders[order.uuid] = order
+            self._observed_at[order.uuid] = time.monotonic() if observed_at is None else observed_at
+        return order
+
+    def market_buy(self, market: str, price: float) -> Order:
+        started = time.monotonic()
+        return self.track(self.order_service.execute_market_buy_order(market, price), started)
+
+    def market_sell(self, market: str, volume: float) -> Order:
+        started = time.monotonic()
+        return self.track(self.order_service.execute_market_sell_order(market, volume), started)
+
+    def limit_buy(self, market: str, price: float, volume: float) -> Order:
+        started = time.monotonic()
+        return self.track(self.order_service.execute_limit_buy_order(market, price, volume), started)
+
+    def limit_sell(self, market: str, price: float, volume: float) -> Order:
+        started = time.monotonic()
+        return self.track(self.order_service.execute_limit_sell_order(market, price, volume), started)
+
+    def cancel(self, uuid: str) -> Order:
+        """취소 요청 - 취소 전 체결분과 종료 이벤트는 다음 poll()에서 전달된다"""
+        return self.order_service.cancel_order(uuid)
+
+    def cancel_all(self, market: str | None = None) -> list[Order]:
+        return [self.cancel(order.uuid) for order in self.open_orders if market is None or order.market == market]
+
+    def poll(self) -> list[OrderFillEvent]:
+        """추적 중인 주문 상태를 일괄 조회하고 체결/종료 이벤트를 콜백에 전달"""
+        with self._lock:
+            uuids = list(self._orders)
+        if not uuids:
+            return []
+
+        started = time.monotonic()
+        orders = []
+        for chunk in OrderService._chunk_uuids(uuids):
+            try:
+                orders.extend(self.order_service.get_orders(chunk))
+            except Exception as e:
+                self.last_error = e # 실패한 묶음은 아래 개별 조회로 대신한다
+        orders.extend(self._lookup_missing(uuids, orders))
+        finished = time.monotonic()
+        self.stats["polls"] += 1
+
+        events = []
+        with self._lock:
+            for order in orders:
+                previous = self._orders.get(order.uuid)
+                if previous is None:
+                    continue
+                event = self._fill_event(previous, order, self._observed_at.get(order.uuid), finished)
+                self._observed_at[order.uuid] = started
+                if event is None:
+                    continue
+                if event.closed:
+                    del self._orders[order.uuid]
+                    del self._observed_at[order.uuid]
+                else:
+                    self._orders[order.uuid] = order
+                events.append(event)
+            callbacks = self._callbacks
+
+        for event in events:
+            for callback in callbacks:
+                try:
+                    callback(event)
+                except Exception as e:
+                    # 콜백 하나의 오류로 나머지 이벤트가 유실되지 않도록 한다
+                    self.stats["callback_errors"] += 1
+                    self.last_error = e
+        return events
+
+    def _lookup_missing(self, uuids: list[str], orders: list[Order]) -> list[Order]:
+        """일괄 조회 응답에 없는 주문을 개별 조회 - 실패한 주문은 추적을 유지하고 다음 poll()에 다시 시도"""
+        returned = {order.uuid for order in orders}
+        found = []
+        for uuid in uuids:
+            if uuid in returned:
+                continue
+            self.stats["single_lookups"] += 1
+            try:
+                found.append(self.order_service.get_order(uuid))
+            except Exception as e:
+                self.last_error = e
+        return found
+
+    def start(self) -> "OrderManager":
+        """백그라운드 스레드 하나에서 poll_interval마다 poll()"""
+        if self._thread is not None and self._thread.is_alive():
+            return self
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="bithumb-order-manager", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float | None = 5.0):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._thread = None
+
+    def __enter__(self) -> "OrderManager":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def _run(self):
+        while not self._stop_event.wait(self.poll_interval):
+            try:
+                self.poll()
+            except Exception as e:
+                self.last_error = e # 일시적 조회 실패는 다음 주기에 다시 시도
+
+    @staticmethod
+    def _fill_event(
+        previous: Order,
+        order: Order,
+        previous_polled_at: float | None = None,
+        polled_at: float | None = None,
+    ) -> OrderFillEvent | None:
+        """체결량이 늘었거나 주문이 종료됐을 때만 이벤트 생성"""
+        executed_volume = float(order.executed_volume)
+        filled_volume = executed_volume - float(previous.executed_volume)
+        closed = order.state in (OrderState.DONE, OrderState.CANCEL)
+        if filled_volume <= 0 and not closed:
+            return None
+
+        return OrderFillEvent(
+            uuid=order.uuid,
+            market=order.market,
+            side=order.side,
+            ord_type=order.ord_type,
+            state=order.state,
+            filled_volume=max(filled_volume, 0.0),
+            executed_volume=executed_volume,
+            remaining_volume=float(order.remaining_volume or 0),
+            paid_fee=float(order.paid_fee),
+            fee=max(float(order.paid_fee) - float(previous.paid_fee), 0.0),
+            price=float(order.price) if order.price else None,
+            closed=closed,
+            previous_polled_at=previous_polled_at,
+            polled_at=polled_at,
+        )
@@ -1,3 +1,5 @@
+from typing import NamedTuple
+
 from pydantic import BaseModel, Field
 
 class Account(BaseModel):
@@ -21,9 +23,10 @@ class Candle(BaseModel):
     timestamp: int = Field(description="캔들 종료 시각(KST 기준)")
     candle_acc_trade_price: float = Field(description="누적 거래 금액")
     candle_acc_trade_volume: float = Field(description="누적 거래량")
-    prev_closing_price: float = Field(description="전일 종가(UTC 0시 기준)")
-    change_price: float = Field(description="전일 종가 대비 변화 금액")
-    change_rate: float = Field(description="전일 종가 대비 변화량")
+    # 분/주 캔들 응답에는 아래 세 필드가 없다
+    prev_closing_price: float = Field(default=0.0, description="전일 종가(UTC 0시 기준)")
+    change_price: float = Field(default=0.0, description="전일 종가 대비 변화 금액")
+    change_rate: float = Field(default=0.0, description="전일 종가 대비 변화량")
     converted_trade_price: float | None = Field(default=None, description="종가 환산 화폐 단위로 환산된 가격")
     
     
@@ -31,7 +34,7 @@ class Order(BaseModel):
     uuid: str = Field(description="주문의 고유 아이디")
     side: str = Field(description="주문 종류")
     ord_type: str = Field(description="주문 방식")
-    price: str = Field(description="주문 당시 화폐 가격")
+    price: str | None = Field(default=None, description="주문 당시 화폐 가격 (시장가 매도는 없음)")
     state: str = Field(description="주문 상태")
     market: str = Field(description="마켓의 유일키")
     created_at: str = Field(description="주문 생성 시간")
@@ -45,6 +48,23 @@ class Order(BaseModel):
     trades_count: int = Field(description="해당 주문에 걸린 체결 수")
     
     
+class OrderFillEvent(BaseModel):
+    uuid: str = Field(description="주문의 고유 아이디")
+    market: str = Field(description="마켓의 유일키")
+    side: str = Field(description="주문 종류")
+    ord_type: str = Field(description="주문 방식")
+    state: str = Field(description="주문 상태")
+    filled_volume: float = Field(description="직전 조회 이후 새로 체결된 양")
+    executed_volume: float = Field(description="누적 체결된 양")
+    remaining_volume: float = Field(description="체결 후 남은 주문 양")
+    paid_fee: float = Field(description="누적 사용된 수수료")
+    fee: float = Field(description="직전 조회 이후 새로 발생한 수수료")
+    price: float | None = Field(default=None, description="주문 가격")
+    closed: bool = Field(description="체결 완료 또는 취소로 추적 종료 여부")
+    previous_polled_at: float | None = Field(default=None, description="직전 상태를 조회하기 시작한 시각 (time.monotonic()), 이번 체결은 이후에 발생")
+    polled_at: float | None = Field(default=None, description="이번 상태 조회를 마친 시각 (time.monotonic()), 이번 체결은 이전에 발생")
+    
+    
 class Trade(BaseModel):
     uuid: str
     price: str
@@ -80,4 +100,22 @@ class Ticker(BaseModel):
     highest_52_week_date: str = Field(description="52주 신고가 달성일 포맷: yyyy-MM-dd")
     lowest_52_week_price: float = Field(description="52주 신저가")
     lowest_52_week_date: str = Field(description="52주 신저가 달성일 포맷: yyyy-MM-dd")
-    timestamp: int = Field(description="타임스탬프")
\ No newline at end of file
+    timestamp: int = Field(description="타임스탬프")
+
+
+def _record_type(name: str, model: type[BaseModel]) -> type[tuple]:
+    """모델과 같은 필드/속성명을 가진 경량 NamedTuple (검증 없음)"""
+    return NamedTuple(name, [(field_name, field.annotation) for field_name, field in model.model_fields.items()])
+
+
+CandleRecord = _record_type("CandleRecord", Candle)
+TickerRecord = _record_type("TickerRecord", Ticker)
+
+
+class PriceTick(NamedTuple):
+    """WebSocket으로 받은 마켓별 최신 가격"""
+    market: str
+    price: float
+    timestamp: int          # 거래소 체결 시각 (ms)
+    received_at: float      # 수신 시각 (time.monotonic())
+    channel: str
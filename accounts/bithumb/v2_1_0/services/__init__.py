@@ -1,11 +1,36 @@
-from accounts.bithumb.v2_1_0.services.account_service import AccountService
-from accounts.bithumb.v2_1_0.services.ticker_service import TickerService
-from accounts.bithumb.v2_1_0.services.order_service import OrderService
-from accounts.bithumb.v2_1_0.services.candle_service import CandleService
+from typing import TYPE_CHECKING
+
+from common.lazy import lazy_attributes
+
+_LAZY_ATTRIBUTES = {
+    'AccountService': 'accounts.bithumb.v2_1_0.services.account_service',
+    'TickerService': 'accounts.bithumb.v2_1_0.services.ticker_service',
+    'OrderService': 'accounts.bithumb.v2_1_0.services.order_service',
+    'CandleService': 'accounts.bithumb.v2_1_0.services.candle_service',
+    'AsyncAccountService': 'accounts.bithumb.v2_1_0.services.account_service',
+    'AsyncTickerService': 'accounts.bithumb.v2_1_0.services.ticker_service',
+    'AsyncOrderService': 'accounts.bithumb.v2_1_0.services.order_service',
+    'AsyncCandleService': 'accounts.bithumb.v2_1_0.services.candle_service',
+}
+
+if TYPE_CHECKING:
+    from accounts.bithumb.v2_1_0.services.account_service import AccountService, AsyncAccountService
+    from accounts.bithumb.v2_1_0.services.ticker_service import TickerService, AsyncTickerService
+    from accounts.bithumb.v2_1_0.services.order_service import OrderService, AsyncOrderService
+    from accounts.bithumb.v2_1_0.services.candle_service import CandleService, AsyncCandleService
 
 __all__ = [
     'AccountService',
     'TickerService',
     'OrderService',
     'CandleService',
+
+    # asyncio
+    'AsyncAccountService',
+    'AsyncTickerService',
+    'AsyncOrderService',
+    'AsyncCandleService',
 ]
+
+
+__getattr__, __dir__ = lazy_attributes(globals(), _LAZY_ATTRIBUTES)
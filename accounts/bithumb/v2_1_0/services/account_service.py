@@ -1,5 +1,11 @@
+from typing import TYPE_CHECKING
+
 from accounts.bithumb.v2_1_0.config.bithumb_client import BithumbClient
 from accounts.bithumb.v2_1_0.schema import Account
+from common.metrics import metrics
+
+if TYPE_CHECKING:
+    from accounts.bithumb.v2_1_0.config.async_bithumb_client import AsyncBithumbClient
 
 
 class AccountService:
@@ -8,6 +14,11 @@ class AccountService:
 
     def get_accounts(self) -> list[Account]:
         result = self.client.call_private_api("/v1/accounts")
+        return self._parse_accounts(result)
+
+    @staticmethod
+    @metrics.timed("bithumb_decode_seconds", "응답 디코딩 소요 시간", kind="accounts")
+    def _parse_accounts(result: dict) -> list[Account]:
         data = result['data']
 
         if 'error' in data:
@@ -27,3 +38,11 @@ class AccountService:
 
         return results
 
+
+class AsyncAccountService:
+    def __init__(self, client: "AsyncBithumbClient"):
+        self.client = client
+
+    async def get_accounts(self) -> list[Account]:
+        result = await self.client.call_private_api("/v1/accounts")
+        return AccountService._parse_accounts(result)
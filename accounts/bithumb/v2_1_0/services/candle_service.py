@@ -1,26 +1,120 @@
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+
+from pydantic import TypeAdapter
+
 from accounts.bithumb.v2_1_0.config.bithumb_client import BithumbClient
-from accounts.bithumb.v2_1_0.schema import Candle
+from accounts.bithumb.v2_1_0.constants import (
+    CANDLE_PAGE_SIZE,
+    CANDLE_HISTORY_MAX_WORKERS,
+    CANDLE_TO_FORMAT,
+)
+from accounts.bithumb.v2_1_0.enums import CandleInterval, DecodeMode
+from accounts.bithumb.v2_1_0.schema import Candle, CandleRecord
+from common.metrics import metrics
+
+if TYPE_CHECKING:
+    from accounts.bithumb.v2_1_0.config.async_bithumb_client import AsyncBithumbClient
+
+_CANDLES_ADAPTER = TypeAdapter(list[Candle])
+_CANDLE_FIELDS = CandleRecord._fields
+_CANDLE_DEFAULTS = {name: field.default for name, field in Candle.model_fields.items() if not field.is_required()}
 
 
 class CandleService:
-    def __init__(self, client: BithumbClient):
+    def __init__(self, client: BithumbClient, decode_mode: DecodeMode = DecodeMode.FIELDS):
         self.client = client
+        self.decode_mode = decode_mode
+
+    def get_daily_candles(self, market: str, count: int, fresh: bool = False) -> list[Candle]:
+        return self.get_candles(market, CandleInterval.DAY, count, fresh=fresh)
+
+    def get_candles(
+        self,
+        market: str,
+        interval: CandleInterval = CandleInterval.DAY,
+        count: int = CANDLE_PAGE_SIZE,
+        to: datetime | None = None,
+        fresh: bool = False,
+    ) -> list[Candle]:
+        """to 이전(미포함) 캔들 최대 200개 조회 (과거→최신 순서)
+
+        fresh=True면 응답 캐시를 거치지 않음
+        """
+        params = self._candle_params(market, count, to)
+        result = self.client.call_public_api(interval.endpoint, params, use_cache=not fresh)
+        return self._parse_candles(result, self.decode_mode)
+
+    def iter_candle_history(
+        self,
+        market: str,
+        interval: CandleInterval = CandleInterval.DAY,
+        to: datetime | None = None,
+        since: datetime | None = None,
+        limit: int | None = None,
+        max_workers: int = CANDLE_HISTORY_MAX_WORKERS,
+    ) -> Iterator[Candle]:
+        """200개 제한을 넘는 과거 캔들을 최신→과거 순서로 스트리밍
 
-    def get_daily_candles(self, market: str, count: int) -> list[Candle]:
-        if count < 1 or count > 200:
+        to 커서를 200봉 간격으로 미리 계산해 최대 max_workers개 페이지를 동시에 요청하고,
+        페이지 경계에서 겹치는 캔들은 제거한다. 메모리에는 요청 중인 페이지만 유지된다.
+        """
+        paginator = _CandleHistoryPaginator(interval, to, since, limit)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        pending = deque()
+
+        def submit():
+            cursor = paginator.next_cursor()
+            pending.append(executor.submit(self.get_candles, market, interval, CANDLE_PAGE_SIZE, cursor))
+
+        try:
+            for _ in range(paginator.initial_pages(max_workers)):
+                submit()
+
+            while pending:
+                page = pending.popleft().result()
+                yield from paginator.consume(page)
+                if paginator.done:
+                    break
+                submit()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _candle_params(market: str, count: int, to: datetime | None = None) -> dict:
+        if count < 1 or count > CANDLE_PAGE_SIZE:
             raise ValueError(f"count는 1 이상 200 이하여야 합니다. 현재 값: {count}")
 
         params = {
             "market": market,
             "count": count
         }
-        result = self.client.call_public_api("/v1/candles/days", params)
+        if to is not None:
+            params["to"] = _to_utc(to).strftime(CANDLE_TO_FORMAT)
+        return params
 
+    @staticmethod
+    @metrics.timed("bithumb_decode_seconds", "응답 디코딩 소요 시간", kind="candles")
+    def _parse_candles(result: dict, decode_mode: DecodeMode = DecodeMode.FIELDS) -> list[Candle] | list[CandleRecord]:
         if result['status_code'] != 200:
             raise RuntimeError(f"API 호출 실패: 상태 코드 {result['status_code']}")
 
         data = result['data']
 
+        if decode_mode == DecodeMode.VALIDATE:
+            candles = _CANDLES_ADAPTER.validate_python(data)
+            candles.reverse()
+            return candles
+        if decode_mode == DecodeMode.RECORD:
+            return [
+                CandleRecord._make(map({**_CANDLE_DEFAULTS, **candle_data}.get, _CANDLE_FIELDS))
+                for candle_data in reversed(data)
+            ]
+
         candles = []
         for candle_data in data:
             candle = Candle(
@@ -45,5 +139,117 @@ class CandleService:
         return candles
 
 
-        
-        
\ No newline at end of file
+class AsyncCandleService:
+    def __init__(self, client: "AsyncBithumbClient", decode_mode: DecodeMode = DecodeMode.FIELDS):
+        self.client = client
+        self.decode_mode = decode_mode
+
+    async def get_daily_candles(self, market: str, count: int, fresh: bool = False) -> list[Candle]:
+        return await self.get_candles(market, CandleInterval.DAY, count, fresh=fresh)
+
+    async def get_candles(
+        self,
+        market: str,
+        interval: CandleInterval = CandleInterval.DAY,
+        count: int = CANDLE_PAGE_SIZE,
+        to: datetime | None = None,
+        fresh: bool = False,
+    ) -> list[Candle]:
+        params = CandleService._candle_params(market, count, to)
+        result = await self.client.call_public_api(interval.endpoint, params, use_cache=not fresh)
+        return CandleService._parse_candles(result, self.decode_mode)
+
+    async def iter_candle_history(
+        self,
+        market: str,
+        interval: CandleInterval = CandleInterval.DAY,
+        to: datetime | None = None,
+        since: datetime | None = None,
+        limit: int | None = None,
+        max_workers: int = CANDLE_HISTORY_MAX_WORKERS,
+    ) -> AsyncIterator[Candle]:
+        """CandleService.iter_candle_history의 asyncio 버전"""
+        paginator = _CandleHistoryPaginator(interval, to, since, limit)
+        pending = deque()
+
+        def submit():
+            cursor = paginator.next_cursor()
+            pending.append(asyncio.ensure_future(self.get_candles(market, interval, CANDLE_PAGE_SIZE, cursor)))
+
+        try:
+            for _ in range(paginator.initial_pages(max_workers)):
+                submit()
+
+            while pending:
+                page = await pending.popleft()
+                for candle in paginator.consume(page):
+                    yield candle
+                if paginator.done:
+                    break
+                submit()
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+class _CandleHistoryPaginator:
+    """과거 방향 페이지 커서 계산과 페이지 경계 중복 제거"""
+
+    def __init__(
+        self,
+        interval: CandleInterval,
+        to: datetime | None,
+        since: datetime | None,
+        limit: int | None,
+    ):
+        self.span = interval.duration * CANDLE_PAGE_SIZE
+        self.since = _to_utc(since) if since is not None else None
+        self.limit = limit
+        self.done = limit is not None and limit <= 0
+        self._cursor = _to_utc(to) if to is not None else datetime.now(timezone.utc).replace(tzinfo=None)
+        self._oldest: datetime | None = None
+        self._yielded = 0
+
+    def initial_pages(self, max_workers: int) -> int:
+        """limit이 작으면 필요한 페이지 수 이상 미리 요청하지 않음"""
+        if self.limit is None:
+            return max_workers
+        return max(min(max_workers, -(-self.limit // CANDLE_PAGE_SIZE)), 1)
+
+    def next_cursor(self) -> datetime:
+        # 거래가 없는 구간이 있으면 페이지가 더 과거까지 내려오므로 이미 받은 구간은 건너뜀
+        if self._oldest is not None and self._oldest < self._cursor:
+            self._cursor = self._oldest
+        cursor = self._cursor
+        self._cursor -= self.span
+        return cursor
+
+    def consume(self, page: list[Candle]) -> Iterator[Candle]:
+        if self.done:
+            return
+
+        for candle in reversed(page):
+            candle_time = datetime.fromisoformat(candle.candle_date_time_utc)
+            if self._oldest is not None and candle_time >= self._oldest:
+                continue  # 앞 페이지와 겹치는 캔들
+            if self.since is not None and candle_time < self.since:
+                self.done = True
+                return
+
+            self._oldest = candle_time
+            self._yielded += 1
+            yield candle
+
+            if self.limit is not None and self._yielded >= self.limit:
+                self.done = True
+                return
+
+        if len(page) < CANDLE_PAGE_SIZE:
+            self.done = True  # 상장 이전까지 모두 조회함
+
+
+def _to_utc(value: datetime) -> datetime:
+    """aware datetime은 UTC로 변환, naive datetime은 UTC로 간주"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
@@ -1,41 +1,151 @@
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
 from accounts.bithumb.v2_1_0.config.bithumb_client import BithumbClient
+from accounts.bithumb.v2_1_0.constants import ORDER_CLOSED_STATES, ORDER_OPEN_STATES, ORDER_STATUS_BATCH_SIZE
 from accounts.bithumb.v2_1_0.enums import OrderSide, OrderType
 from accounts.bithumb.v2_1_0.schema import Order
+from common.metrics import metrics
+
+if TYPE_CHECKING:
+    from accounts.bithumb.v2_1_0.config.async_bithumb_client import AsyncBithumbClient
 
 
 class OrderService:
     def __init__(self, client: BithumbClient):
         self.client = client
 
-    # TODO: 지정가 매수 추가
     def execute_market_buy_order(self, market: str, price: float) -> Order | None:
-        request_body = {
+        request_body = self._market_buy_body(market, price)
+        response = self.client.call_order_api("/v1/orders", request_body)
+        return self._parse_order(response, "매수가 실패하였습니다.")
+
+    def execute_market_sell_order(self, market: str, volume: float) -> Order | None:
+        request_body = self._market_sell_body(market, volume)
+        response = self.client.call_order_api("/v1/orders", request_body)
+        return self._parse_order(response, "매도가 실패하였습니다.")
+
+    def execute_limit_buy_order(self, market: str, price: float, volume: float) -> Order | None:
+        request_body = self._limit_body(market, OrderSide.BID, price, volume)
+        response = self.client.call_order_api("/v1/orders", request_body)
+        return self._parse_order(response, "지정가 매수가 실패하였습니다.")
+
+    def execute_limit_sell_order(self, market: str, price: float, volume: float) -> Order | None:
+        request_body = self._limit_body(market, OrderSide.ASK, price, volume)
+        response = self.client.call_order_api("/v1/orders", request_body)
+        return self._parse_order(response, "지정가 매도가 실패하였습니다.")
+
+    def cancel_order(self, uuid: str) -> Order:
+        response = self.client.call_order_api("/v1/order", {'uuid': uuid}, method="DELETE")
+        return self._parse_order(response, "주문 취소가 실패하였습니다.", expected_status=200)
+
+    def get_order(self, uuid: str) -> Order:
+        response = self.client.call_order_api("/v1/order", {'uuid': uuid}, method="GET")
+        return self._parse_order(response, "주문 조회가 실패하였습니다.", expected_status=200)
+
+    def get_orders(self, uuids: list[str]) -> list[Order]:
+        """여러 주문 상태를 uuids[]로 묶어 조회 (요청당 최대 100개, 열린/종료 상태 각각 한 번)"""
+        orders = {}
+        for chunk in self._chunk_uuids(uuids):
+            for states in (ORDER_OPEN_STATES, ORDER_CLOSED_STATES):
+                response = self.client.call_order_api("/v1/orders", self._orders_query(chunk, states), method="GET")
+                # 두 조회 사이에 종료된 주문은 나중 결과(종료 상태)로 덮어쓴다
+                orders.update((order.uuid, order) for order in self._parse_orders(response))
+        return list(orders.values())
+
+    @staticmethod
+    def _market_buy_body(market: str, price: float) -> dict:
+        return {
             'market': market,
             'side': OrderSide.BID,
             'price': str(int(price)),
             'ord_type': OrderType.PRICE 
         }
 
-        response = self.client.call_order_api("/v1/orders", request_body)
-
-        if response.get('status_code') == 201 and 'data' in response:
-            return Order(**response['data'])
-        else:
-            raise Exception("매수가 실패하였습니다.")
-
-
-    # TODO: 지정가 매도 추가
-    def execute_market_sell_order(self, market: str, volume: float) -> Order | None:
-        request_body = {
+    @staticmethod
+    def _market_sell_body(market: str, volume: float) -> dict:
+        return {
             'market': market,
             'side': OrderSide.ASK,
             'volume': str(volume),
             'ord_type': OrderType.MARKET 
         }
 
-        response = self.client.call_order_api("/v1/orders", request_body)
+    @staticmethod
+    def _limit_body(market: str, side: OrderSide, price: float, volume: float) -> dict:
+        return {
+            'market': market,
+            'side': side,
+            'volume': str(volume),
+            'price': format(Decimal(str(price)), "f"),  # 지수 표기(1e-05) 방지
+            'ord_type': OrderType.LIMIT
+        }
+
+    @staticmethod
+    def _orders_query(uuids: list[str], states: tuple[str, ...]) -> dict:
+        return {'uuids[]': uuids, 'states[]': list(states)}
+
+    @staticmethod
+    def _chunk_uuids(uuids: list[str]) -> list[list[str]]:
+        unique_uuids = list(dict.fromkeys(uuids))
+        return [
+            unique_uuids[i:i + ORDER_STATUS_BATCH_SIZE]
+            for i in range(0, len(unique_uuids), ORDER_STATUS_BATCH_SIZE)
+        ]
 
-        if response.get('status_code') == 201 and 'data' in response:
+    @staticmethod
+    @metrics.timed("bithumb_decode_seconds", "응답 디코딩 소요 시간", kind="order")
+    def _parse_order(response: dict, error_message: str, expected_status: int = 201) -> Order:
+        if response.get('status_code') == expected_status and 'data' in response:
             return Order(**response['data'])
         else:
-            raise Exception("매도가 실패하였습니다.")
+            raise Exception(error_message)
+
+    @staticmethod
+    @metrics.timed("bithumb_decode_seconds", "응답 디코딩 소요 시간", kind="orders")
+    def _parse_orders(response: dict) -> list[Order]:
+        if response.get('status_code') != 200 or not isinstance(response.get('data'), list):
+            raise Exception(f"주문 목록 조회가 실패하였습니다: 상태 코드 {response.get('status_code')}")
+        return [Order(**order_data) for order_data in response['data']]
+
+
+class AsyncOrderService:
+    def __init__(self, client: "AsyncBithumbClient"):
+        self.client = client
+
+    async def execute_market_buy_order(self, market: str, price: float) -> Order | None:
+        request_body = OrderService._market_buy_body(market, price)
+        response = await self.client.call_order_api("/v1/orders", request_body)
+        return OrderService._parse_order(response, "매수가 실패하였습니다.")
+
+    async def execute_market_sell_order(self, market: str, volume: float) -> Order | None:
+        request_body = OrderService._market_sell_body(market, volume)
+        response = await self.client.call_order_api("/v1/orders", request_body)
+        return OrderService._parse_order(response, "매도가 실패하였습니다.")
+
+    async def execute_limit_buy_order(self, market: str, price: float, volume: float) -> Order | None:
+        request_body = OrderService._limit_body(market, OrderSide.BID, price, volume)
+        response = await self.client.call_order_api("/v1/orders", request_body)
+        return OrderService._parse_order(response, "지정가 매수가 실패하였습니다.")
+
+    async def execute_limit_sell_order(self, market: str, price: float, volume: float) -> Order | None:
+        request_body = OrderService._limit_body(market, OrderSide.ASK, price, volume)
+        response = await self.client.call_order_api("/v1/orders", request_body)
+        return OrderService._parse_order(response, "지정가 매도가 실패하였습니다.")
+
+    async def cancel_order(self, uuid: str) -> Order:
+        response = await self.client.call_order_api("/v1/order", {'uuid': uuid}, method="DELETE")
+        return OrderService._parse_order(response, "주문 취소가 실패하였습니다.", expected_status=200)
+
+    async def get_order(self, uuid: str) -> Order:
+        response = await self.client.call_order_api("/v1/order", {'uuid': uuid}, method="GET")
+        return OrderService._parse_order(response, "주문 조회가 실패하였습니다.", expected_status=200)
+
+    async def get_orders(self, uuids: list[str]) -> list[Order]:
+        orders = {}
+        for chunk in OrderService._chunk_uuids(uuids):
+            for states in (ORDER_OPEN_STATES, ORDER_CLOSED_STATES):
+                query = OrderService._orders_query(chunk, states)
+                response = await self.client.call_order_api("/v1/orders", query, method="GET")
+                orders.update((order.uuid, order) for order in OrderService._parse_orders(response))
+        return list(orders.values())
@@ -1,16 +1,51 @@
+import asyncio
+from typing import TYPE_CHECKING
+
+from pydantic import TypeAdapter
+
 from accounts.bithumb.v2_1_0.config.bithumb_client import BithumbClient
+from accounts.bithumb.v2_1_0.constants import TICKER_MARKETS_CHUNK_SIZE
+from accounts.bithumb.v2_1_0.enums import DecodeMode
+
+from accounts.bithumb.v2_1_0.schema import Ticker, TickerRecord
+from common.metrics import metrics
 
-from accounts.bithumb.v2_1_0.schema import Ticker
+if TYPE_CHECKING:
+    from accounts.bithumb.v2_1_0.config.async_bithumb_client import AsyncBithumbClient
 
+_TICKERS_ADAPTER = TypeAdapter(list[Ticker])
+_TICKER_FIELDS = TickerRecord._fields
 
 
 class TickerService:
-    def __init__(self, client: BithumbClient):
+    def __init__(self, client: BithumbClient, decode_mode: DecodeMode = DecodeMode.FIELDS):
         self.client = client
+        self.decode_mode = decode_mode
+
+    def get_ticker(self, market: str, fresh: bool = False) -> list[Ticker] | None:
+        """fresh=True면 응답 캐시를 거치지 않음 (손절 판단 등)"""
+        result = self.client.call_public_api("/v1/ticker", {"markets": market}, use_cache=not fresh)
+        return self._parse_tickers(result, self.decode_mode)
+
+    def get_tickers(self, markets: list[str], fresh: bool = False) -> dict[str, Ticker]:
+        """여러 마켓 현재가를 청크 단위 일괄 조회"""
+        tickers = {}
+        for chunk in self._chunk_markets(markets):
+            result = self.client.call_public_api("/v1/ticker", {"markets": ",".join(chunk)}, use_cache=not fresh)
+            tickers.update((ticker.market, ticker) for ticker in self._parse_tickers(result, self.decode_mode))
+        return tickers
 
-    def get_ticker(self, market: str) -> list[Ticker] | None:
-        result = self.client.call_public_api("/v1/ticker", {"markets": market})
+    @staticmethod
+    def _chunk_markets(markets: list[str]) -> list[list[str]]:
+        unique_markets = list(dict.fromkeys(markets))
+        return [
+            unique_markets[i:i + TICKER_MARKETS_CHUNK_SIZE]
+            for i in range(0, len(unique_markets), TICKER_MARKETS_CHUNK_SIZE)
+        ]
 
+    @staticmethod
+    @metrics.timed("bithumb_decode_seconds", "응답 디코딩 소요 시간", kind="tickers")
+    def _parse_tickers(result: dict, decode_mode: DecodeMode = DecodeMode.FIELDS) -> list[Ticker]:
         if result['status_code'] != 200:
             raise ValueError(f"Ticker API 에러: {result['status_code']}")
 
@@ -18,6 +53,11 @@ class TickerService:
         if not data or not isinstance(data, list) or len(data) == 0:
             raise ValueError(f"Ticker API 에러: {result['status_code']}")
 
+        if decode_mode == DecodeMode.VALIDATE:
+            return _TICKERS_ADAPTER.validate_python(data)
+        if decode_mode == DecodeMode.RECORD:
+            return [TickerRecord._make(map(ticker_data.get, _TICKER_FIELDS)) for ticker_data in data]
+
         result = []
         for ticker_data in data:
             ticker_data:dict
@@ -54,4 +94,23 @@ class TickerService:
         return result
 
 
-        
\ No newline at end of file
+class AsyncTickerService:
+    def __init__(self, client: "AsyncBithumbClient", decode_mode: DecodeMode = DecodeMode.FIELDS):
+        self.client = client
+        self.decode_mode = decode_mode
+
+    async def get_ticker(self, market: str, fresh: bool = False) -> list[Ticker] | None:
+        result = await self.client.call_public_api("/v1/ticker", {"markets": market}, use_cache=not fresh)
+        return TickerService._parse_tickers(result, self.decode_mode)
+
+    async def get_tickers(self, markets: list[str], fresh: bool = False) -> dict[str, Ticker]:
+        """여러 마켓 현재가를 청크 단위로 동시에 조회"""
+        results = await asyncio.gather(*(
+            self.client.call_public_api("/v1/ticker", {"markets": ",".join(chunk)}, use_cache=not fresh)
+            for chunk in TickerService._chunk_markets(markets)
+        ))
+        return {
+            ticker.market: ticker
+            for result in results
+            for ticker in TickerService._parse_tickers(result, self.decode_mode)
+        }
@@ -0,0 +1,4 @@
+SIMULATED_BASE_CURRENCY = "KRW"
+SIMULATED_INITIAL_BALANCE = 100_000_000 # 기본 원화 잔고
+SIMULATED_FEE_RATE = 0.0025 # 빗썸 기본 거래 수수료 0.25%
+SIMULATED_SLIPPAGE_RATE = 0.0 # 시장가 체결가 = 현재가 × (1 ± 슬리피지)
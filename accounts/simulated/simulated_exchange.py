@@ -0,0 +1,479 @@
+import time
+from datetime import datetime
+from itertools import count
+from typing import Callable
+
+import numpy as np
+
+from accounts.bithumb.v2_1_0.enums import OrderSide, OrderState, OrderType
+from accounts.bithumb.v2_1_0.schema import Account, Order
+from accounts.simulated.constants import (
+    SIMULATED_BASE_CURRENCY,
+    SIMULATED_FEE_RATE,
+    SIMULATED_INITIAL_BALANCE,
+    SIMULATED_SLIPPAGE_RATE,
+)
+from common.ohlc_frame import OHLCFrame
+from common.schema import OHLC
+from interfaces.exchange import ExchangeInterface
+
+ONE_DAY = np.timedelta64(1, "D")
+ONE_MS = np.timedelta64(1, "ms")
+
+
+class _MarketData:
+    """한 마켓의 일봉과 틱 - 시각은 모두 KST 기준 datetime64[ms]"""
+    __slots__ = ("frame", "close_times", "tick_times", "tick_prices")
+
+    def __init__(self, frame: OHLCFrame, ticks: tuple[np.ndarray, np.ndarray] | None):
+        self.frame = frame
+        # 일봉은 그날 마지막 순간에 마감된 것으로 본다
+        self.close_times = (frame.trade_date + ONE_DAY).astype("datetime64[ms]") - ONE_MS
+        if ticks is None:
+            self.tick_times = np.empty(0, dtype="datetime64[ms]")
+            self.tick_prices = np.empty(0)
+        else:
+            self.tick_times = np.asarray(ticks[0], dtype="datetime64[ms]")
+            self.tick_prices = np.asarray(ticks[1], dtype=np.float64)
+
+
+class _SimulatedOrder:
+    __slots__ = (
+        "uuid", "market", "side", "ord_type", "price", "volume", "funds",
+        "executed_volume", "paid_fee", "reserved_fee", "locked", "state", "created_at", "trades_count",
+    )
+
+    def __init__(self, uuid: str, market: str, side: OrderSide, ord_type: OrderType, created_at: str):
+        self.uuid = uuid
+        self.market = market
+        self.side = side
+        self.ord_type = ord_type
+        self.price: float | None = None
+        self.volume: float | None = None
+        self.funds: float | None = None
+        self.executed_volume = 0.0
+        self.paid_fee = 0.0
+        self.reserved_fee = 0.0
+        self.locked = 0.0
+        self.state = OrderState.WAIT
+        self.created_at = created_at
+        self.trades_count = 0
+
+
+class SimulatedExchange(ExchangeInterface):
+    """저장된 일봉/틱을 재생하는 모의 거래소 (네트워크 호출 없음)
+
+    - 시계: 모든 마켓의 일봉 마감 시각과 틱 시각을 합친 타임라인을 step()/advance()/run()으로 이동
+    - 현재가: 현재 시각 이전 마지막 틱, 틱이 없으면 마지막으로 마감된 일봉 종가
+    - candles(): 마감된 일봉 + 틱이 있으면 당일 틱으로 만든 진행 중 봉 (빗썸처럼 당일 봉 포함)
+    - 시장가 주문은 현재가 × (1 ± slippage_rate)로 즉시 체결, 지정가 주문은 시계가 움직일 때
+      그 사이 가격이 지정가에 닿으면 지정가로 전량 체결 (이미 닿아 있으면 접수 즉시 체결)
+    - 수수료는 체결 금액 × fee_rate, 잔고/주문은 메모리에만 보관
+    OrderService/AccountService와 같은 이름의 메서드를 제공하므로 OrderManager와 AccountState에
+    그대로 넘겨 BithumbExchange와 같은 구성을 오프라인으로 돌릴 수 있다.
+    """
+
+    def __init__(
+        self,
+        frames: dict[str, OHLCFrame],
+        ticks: dict[str, tuple[np.ndarray, np.ndarray]] | None = None,
+        balances: dict[str, float] | None = None,
+        fee_rate: float = SIMULATED_FEE_RATE,
+        slippage_rate: float = SIMULATED_SLIPPAGE_RATE,
+        start: np.datetime64 | None = None,
+    ):
+        """ticks: 마켓별 (시각 배열, 가격 배열) - 시각 오름차순
+        start: 재생 시작 시각 (기본: 타임라인 첫 시각)
+        """
+        ticks = ticks or {}
+        self.fee_rate = fee_rate
+        self.slippage_rate = slippage_rate
+        self._data = {market: _MarketData(frame, ticks.get(market)) for market, frame in frames.items()}
+
+        self._timeline = np.unique(np.concatenate(
+            [data.close_times for data in self._data.values()]
+            + [data.tick_times for data in self._data.values()]
+            + [np.empty(0, dtype="datetime64[ms]")]
+        ))
+        self._position = 0
+        if start is not None:
+            self._position = int(np.searchsorted(self._timeline, np.datetime64(start, "ms")))
+        self._now = self._timeline[self._position] if len(self._timeline) else np.datetime64(0, "ms")
+        self._prices: dict[str, float] = {}
+
+        initial = {SIMULATED_BASE_CURRENCY: SIMULATED_INITIAL_BALANCE} if balances is None else balances
+        self._balances: dict[str, list[float]] = {} # 통화 -> [주문가능, 주문중, 매수평균가]
+        for currency, amount in initial.items():
+            self._wallet(currency)[0] = float(amount)
+
+        self._orders: dict[str, _SimulatedOrder] = {}
+        self._open_orders: dict[str, dict[str, _SimulatedOrder]] = {} # 마켓 -> 미체결 지정가 주문
+        self._order_ids = count(1)
+
+    # 시계
+
+    @property
+    def now(self) -> np.datetime64:
+        return self._now
+
+    @property
+    def finished(self) -> bool:
+        return self._position >= len(self._timeline) - 1
+
+    def step(self) -> bool:
+        """다음 이벤트 시각으로 이동 - 타임라인 끝이면 False"""
+        if self.finished:
+            return False
+        self._move(self._position + 1)
+        return True
+
+    def advance(self, until) -> int:
+        """until 시각까지 이동 (그 사이 지정가 체결은 한 번에 판단) -> 지나간 이벤트 수"""
+        target = int(np.searchsorted(self._timeline, np.datetime64(until, "ms"), side="right")) - 1
+        target = min(max(target, self._position), len(self._timeline) - 1)
+        moved = target - self._position
+        if moved > 0:
+            self._move(target)
+        return moved
+
+    def run(
+        self,
+        on_step: Callable[["SimulatedExchange"], None],
+        until=None,
+        speed: float | None = None,
+    ) -> int:
+        """이벤트마다 on_step 호출 -> 실행한 이벤트 수
+
+        speed를 주면 모의 시각이 실제 시간의 speed배로 흐르도록 대기하고, 없으면 대기 없이 최대 속도로 재생한다.
+        """
+        limit = np.datetime64(until, "ms") if until is not None else None
+        started_at = time.monotonic()
+        origin = self._now
+        on_step(self)
+        steps = 1
+        while self.step():
+            if limit is not None and self._now > limit:
+                break
+            if speed:
+                elapsed = (self._now - origin) / np.timedelta64(1, "s") / speed
+                delay = elapsed - (time.monotonic() - started_at)
+                if delay > 0:
+                    time.sleep(delay)
+            on_step(self)
+            steps += 1
+        return steps
+
+    # 시세 조회
+
+    def candles(self, market: str, count: int) -> list[OHLC]:
+        return self.candles_frame(market, count).to_ohlcs()
+
+    def candles_frame(self, market: str, count: int) -> OHLCFrame:
+        data = self._market(market)
+        closed = int(np.searchsorted(data.close_times, self._now, side="right"))
+        frame = data.frame[max(closed - count, 0):closed]
+
+        live = self._live_bar(data, closed)
+        if live is None:
+            return frame
+        frame = frame.tail(count - 1) if count > 1 else frame[:0]
+        return OHLCFrame(
+            high=np.append(frame.high, live.high),
+            low=np.append(frame.low, live.low),
+            close=np.append(frame.close, live.close),
+            trade_date=np.append(frame.trade_date, np.datetime64(live.trade_date, "D")),
+        )
+
+    def current_price(self, market: str, fresh: bool = False) -> float:
+        price = self._prices.get(market)
+        if price is None:
+            price = self._price_at(self._market(market))
+            if price is None:
+                raise ValueError(f"{market}의 현재가를 조회할 수 없습니다.")
+            self._prices[market] = price
+        return price
+
+    def current_prices(self, markets: list[str], fresh: bool = False) -> dict[str, float]:
+        return {market: self.current_price(market) for market in markets}
+
+    # 잔고 (AccountService 호환)
+
+    def balance(self, currency: str = SIMULATED_BASE_CURRENCY) -> float:
+        wallet = self._balances.get(currency.upper())
+        return wallet[0] if wallet is not None else 0.0
+
+    def balances(self, currencies: list[str]) -> dict[str, float]:
+        return {currency: self.balance(currency) for currency in currencies}
+
+    def locked(self, currency: str) -> float:
+        wallet = self._balances.get(currency.upper())
+        return wallet[1] if wallet is not None else 0.0
+
+    def equity(self) -> float:
+        """원화 + 코인 평가금액 (주문중 포함)"""
+        total = 0.0
+        for currency, (balance, locked, _) in self._balances.items():
+            if currency == SIMULATED_BASE_CURRENCY:
+                total += balance + locked
+            elif balance + locked:
+                total += (balance + locked) * self.current_price(f"{SIMULATED_BASE_CURRENCY}-{currency}")
+        return total
+
+    def get_accounts(self) -> list[Account]:
+        return [
+            Account(
+                currency=currency,
+                balance=balance,
+                locked=locked,
+                avg_buy_price=avg_buy_price,
+                avg_buy_price_modified=False,
+                unit_currency=SIMULATED_BASE_CURRENCY,
+            )
+            for currency, (balance, locked, avg_buy_price) in self._balances.items()
+        ]
+
+    # 주문 (OrderService 호환)
+
+    def buy(self, market: str, amount: float) -> Order:
+        return self.execute_market_buy_order(market, amount)
+
+    def sell(self, market: str, volume: float) -> Order:
+        return self.execute_market_sell_order(market, volume)
+
+    def execute_market_buy_order(self, market: str, price: float) -> Order:
+        """price: 매수할 원화 금액 (수수료 별도)"""
+        quote, _ = self._split(market)
+        fee = price * self.fee_rate
+        if self.balance(quote) < price + fee:
+            raise Exception('매수 주문이 실패하였습니다: 잔고 부족')
+
+        order = self._new_order(market, OrderSide.BID, OrderType.PRICE)
+        order.funds = price
+        fill_price = self.current_price(market) * (1 + self.slippage_rate)
+        self._wallet(quote)[0] -= price + fee
+        self._fill(order, price / fill_price, fill_price)
+        return self._to_order(order)
+
+    def execute_market_sell_order(self, market: str, volume: float) -> Order:
+        _, base = self._split(market)
+        if self.balance(base) < volume:
+            raise Exception('매도 주문이 실패하였습니다: 잔고 부족')
+
+        order = self._new_order(market, OrderSide.ASK, OrderType.MARKET)
+        order.volume = volume
+        fill_price = self.current_price(market) * (1 - self.slippage_rate)
+        self._wallet(base)[0] -= volume
+        self._fill(order, volume, fill_price)
+        return self._to_order(order)
+
+    def execute_limit_buy_order(self, market: str, price: float, volume: float) -> Order:
+        quote, _ = self._split(market)
+        funds = price * volume
+        fee = funds * self.fee_rate
+        wallet = self._wallet(quote)
+        if wallet[0] < funds + fee:
+            raise Exception('매수 주문이 실패하였습니다: 잔고 부족')
+
+        order = self._new_order(market, OrderSide.BID, OrderType.LIMIT)
+        order.price, order.volume = price, volume
+        order.locked, order.reserved_fee = funds + fee, fee
+        wallet[0] -= funds + fee
+        wallet[1] += funds + fee
+        return self._place_limit(order)
+
+    def execute_limit_sell_order(self, market: str, price: float, volume: float) -> Order:
+        _, base = self._split(market)
+        wallet = self._wallet(base)
+        if wallet[0] < volume:
+            raise Exception('매도 주문이 실패하였습니다: 잔고 부족')
+
+        order = self._new_order(market, OrderSide.ASK, OrderType.LIMIT)
+        order.price, order.volume = price, volume
+        order.locked = volume
+        wallet[0] -= volume
+        wallet[1] += volume
+        return self._place_limit(order)
+
+    def cancel_order(self, uuid: str) -> Order:
+        order = self._orders.get(uuid)
+        if order is None or order.state != OrderState.WAIT:
+            raise Exception('주문 취소가 실패하였습니다.')
+
+        quote, base = self._split(order.market)
+        wallet = self._wallet(quote if order.side == OrderSide.BID else base)
+        wallet[0] += order.locked
+        wallet[1] -= order.locked
+        order.locked = 0.0
+        order.state = OrderState.CANCEL
+        del self._open_orders[order.market][uuid]
+        return self._to_order(order)
+
+    def get_order(self, uuid: str) -> Order:
+        order = self._orders.get(uuid)
+        if order is None:
+            raise Exception('주문 조회가 실패하였습니다.')
+        return self._to_order(order)
+
+    def get_orders(self, uuids: list[str]) -> list[Order]:
+        orders = self._orders
+        return [self._to_order(orders[uuid]) for uuid in uuids if uuid in orders]
+
+    def open_orders(self, market: str | None = None) -> list[Order]:
+        if market is not None:
+            return [self._to_order(order) for order in self._open_orders.get(market, {}).values()]
+        return [self._to_order(order) for orders in self._open_orders.values() for order in orders.values()]
+
+    # 내부
+
+    def _market(self, market: str) -> _MarketData:
+        data = self._data.get(market)
+        if data is None:
+            raise ValueError(f"{market}의 재생 데이터가 없습니다.")
+        return data
+
+    def _move(self, position: int):
+        previous = self._now
+        self._position = position
+        self._now = self._timeline[position]
+        self._prices.clear()
+        for market, orders in self._open_orders.items():
+            if orders:
+                self._match(market, orders, previous)
+
+    def _price_at(self, data: _MarketData) -> float | None:
+        now = self._now
+        if len(data.tick_times):
+            index = int(np.searchsorted(data.tick_times, now, side="right")) - 1
+            if index >= 0:
+                return float(data.tick_prices[index])
+        index = int(np.searchsorted(data.close_times, now, side="right")) - 1
+        return float(data.frame.close[index]) if index >= 0 else None
+
+    def _live_bar(self, data: _MarketData, closed: int) -> OHLC | None:
+        """당일 틱으로 만든 진행 중 일봉 (틱이 없으면 None)"""
+        if not len(data.tick_times):
+            return None
+        day_start = self._now.astype("datetime64[D]").astype("datetime64[ms]")
+        if closed and data.close_times[closed - 1] >= day_start:
+            return None # 당일 봉이 이미 마감됨
+        start = int(np.searchsorted(data.tick_times, day_start))
+        end = int(np.searchsorted(data.tick_times, self._now, side="right"))
+        if start >= end:
+            return None
+        prices = data.tick_prices[start:end]
+        return OHLC(
+            high=float(prices.max()),
+            low=float(prices.min()),
+            close=float(prices[-1]),
+            trade_date=day_start.astype("datetime64[D]").item(),
+        )
+
+    def _price_range(self, data: _MarketData, since: np.datetime64) -> tuple[float, float] | None:
+        """(since, 현재] 사이 최저/최고가 - 틱이 있으면 틱, 없으면 그 사이 마감된 일봉의 저가/고가"""
+        now = self._now
+        if len(data.tick_times):
+            start = int(np.searchsorted(data.tick_times, since, side="right"))
+            end = int(np.searchsorted(data.tick_times, now, side="right"))
+            if start < end:
+                prices = data.tick_prices[start:end]
+                return float(prices.min()), float(prices.max())
+        start = int(np.searchsorted(data.close_times, since, side="right"))
+        end = int(np.searchsorted(data.close_times, now, side="right"))
+        if start >= end:
+            return None
+        return float(data.frame.low[start:end].min()), float(data.frame.high[start:end].max())
+
+    def _match(self, market: str, orders: dict[str, _SimulatedOrder], since: np.datetime64):
+        price_range = self._price_range(self._data[market], since)
+        if price_range is None:
+            return
+        low, high = price_range
+        for order in list(orders.values()):
+            if (order.side == OrderSide.BID and low <= order.price) or (order.side == OrderSide.ASK and high >= order.price):
+                self._fill_limit(order, order.price)
+
+    def _place_limit(self, order: _SimulatedOrder) -> Order:
+        current = self._price_at(self._market(order.market))
+        marketable = current is not None and (
+            current <= order.price if order.side == OrderSide.BID else current >= order.price
+        )
+        if marketable:
+            # 호가를 넘는 지정가는 현재가로 즉시 체결 (지정가보다 불리하게는 체결되지 않음)
+            if order.side == OrderSide.BID:
+                fill_price = min(current * (1 + self.slippage_rate), order.price)
+            else:
+                fill_price = max(current * (1 - self.slippage_rate), order.price)
+            self._fill_limit(order, fill_price)
+        else:
+            self._open_orders.setdefault(order.market, {})[order.uuid] = order
+        return self._to_order(order)
+
+    def _fill_limit(self, order: _SimulatedOrder, fill_price: float):
+        quote, base = self._split(order.market)
+        if order.side == OrderSide.BID:
+            wallet = self._wallet(quote)
+            # 예약한 금액/수수료를 풀고 실제 체결 금액만큼 다시 차감
+            wallet[1] -= order.locked
+            wallet[0] += order.locked - order.volume * fill_price * (1 + self.fee_rate)
+        else:
+            self._wallet(base)[1] -= order.locked
+        order.locked = 0.0
+        order.reserved_fee = 0.0
+        self._open_orders.get(order.market, {}).pop(order.uuid, None)
+        self._fill(order, order.volume, fill_price)
+
+    def _fill(self, order: _SimulatedOrder, volume: float, fill_price: float):
+        """체결 반영 - 매수는 호출 전에 원화 차감, 매도는 호출 전에 코인 차감이 끝나 있어야 한다"""
+        quote, base = self._split(order.market)
+        funds = volume * fill_price
+        fee = funds * self.fee_rate if order.funds is None else order.funds * self.fee_rate
+        if order.side == OrderSide.BID:
+            wallet = self._wallet(base)
+            held = wallet[0] + wallet[1]
+            wallet[2] = (wallet[2] * held + funds) / (held + volume) if held + volume > 0 else 0.0
+            wallet[0] += volume
+        else:
+            self._wallet(quote)[0] += funds - fee
+        order.executed_volume = volume
+        order.paid_fee = fee
+        order.trades_count = 1
+        order.state = OrderState.DONE
+
+    def _new_order(self, market: str, side: OrderSide, ord_type: OrderType) -> _SimulatedOrder:
+        self._market(market)
+        created_at = datetime.fromisoformat(str(self._now)).isoformat() + "+09:00"
+        order = _SimulatedOrder(f"sim-{next(self._order_ids):012d}", market, side, ord_type, created_at)
+        self._orders[order.uuid] = order
+        return order
+
+    def _wallet(self, currency: str) -> list[float]:
+        wallet = self._balances.get(currency)
+        if wallet is None:
+            wallet = self._balances[currency] = [0.0, 0.0, 0.0]
+        return wallet
+
+    @staticmethod
+    def _split(market: str) -> tuple[str, str]:
+        quote, base = market.split("-", 1)
+        return quote, base
+
+    @staticmethod
+    def _to_order(order: _SimulatedOrder) -> Order:
+        remaining = None if order.volume is None else order.volume - order.executed_volume
+        return Order(
+            uuid=order.uuid,
+            side=order.side,
+            ord_type=order.ord_type,
+            price=None if order.price is None and order.funds is None else str(order.price or order.funds),
+            state=order.state,
+            market=order.market,
+            created_at=order.created_at,
+            volume=None if order.volume is None else str(order.volume),
+            remaining_volume=None if remaining is None else str(remaining),
+            reserved_fee=str(order.reserved_fee),
+            remaining_fee=str(order.reserved_fee),
+            paid_fee=str(order.paid_fee),
+            locked=str(order.locked),
+            executed_volume=str(order.executed_volume),
+            trades_count=order.trades_count,
+        )
@@ -0,0 +1,69 @@
+"""인증 헤더 생성 처리량: 매번 pyjwt + uuid4 서명 vs 미리 만든 서명 키/헤더 템플릿
+
+    python -m benchmarks.bench_auth
+"""
+import hashlib
+import time
+import uuid
+from urllib.parse import urlencode
+
+import jwt
+
+from accounts.bithumb.v2_1_0.config.auth import BithumbAuth
+from benchmarks.harness import measure, report
+
+NUMBER = 2000
+API_KEY = "a" * 40
+SECRET_KEY = "s" * 48
+ORDER_BODY = {"market": "KRW-BTC", "side": "bid", "ord_type": "price", "price": "10000"}
+
+
+def legacy_headers() -> dict[str, str]:
+    payload = {'access_key': API_KEY, 'nonce': str(uuid.uuid4()), 'timestamp': round(time.time() * 1000)}
+    return {'Authorization': f'Bearer {jwt.encode(payload, SECRET_KEY, algorithm="HS256")}'}
+
+
+def legacy_order_headers(request_body: dict) -> dict[str, str]:
+    query_hash = hashlib.sha512(urlencode(request_body).encode()).hexdigest()
+    payload = {
+        'access_key': API_KEY,
+        'nonce': str(uuid.uuid4()),
+        'timestamp': round(time.time() * 1000),
+        'query_hash': query_hash,
+        'query_hash_alg': 'SHA512',
+    }
+    token = jwt.encode(payload, SECRET_KEY, algorithm="HS256")
+    return {'Authorization': f'Bearer {token}', 'Content-Type': 'application/json'}
+
+
+def _report_rate(name: str, result: dict) -> float:
+    report(name, result)
+    rate = 1 / result["median"]
+    print(f"  -> {rate:,.0f} tokens/sec")
+    return rate
+
+
+def main():
+    auth = BithumbAuth(API_KEY, SECRET_KEY)
+
+    baseline = _report_rate("headers [pyjwt + uuid4]", measure(legacy_headers, NUMBER))
+    optimized = _report_rate("headers [BithumbAuth]", measure(auth.headers, NUMBER))
+    print(f"speedup: {optimized / baseline:.2f}x")
+
+    def prefetched():
+        auth.headers()
+
+    def refill():
+        auth.prefetch(NUMBER)
+
+    refill()
+    # prefetch 이후 요청 구간만 측정 (토큰 생성 비용은 요청 전에 치름)
+    _report_rate("headers [BithumbAuth, prefetched]", measure(prefetched, NUMBER, repeat=1, warmup=0))
+
+    baseline = _report_rate("order_headers [pyjwt + uuid4]", measure(lambda: legacy_order_headers(ORDER_BODY), NUMBER))
+    optimized = _report_rate("order_headers [BithumbAuth]", measure(lambda: auth.order_headers(ORDER_BODY), NUMBER))
+    print(f"speedup: {optimized / baseline:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
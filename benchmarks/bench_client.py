@@ -0,0 +1,37 @@
+"""BithumbClient 호출당 지연시간 측정: 매 호출 새 커넥션 vs 커넥션 풀
+
+    python -m benchmarks.bench_client
+"""
+import requests
+
+from accounts.bithumb.v2_1_0.config.bithumb_client import BithumbClient
+from accounts.bithumb.v2_1_0.config.rate_limiter import RateLimiter
+from benchmarks.harness import measure, report
+from benchmarks.stub_server import StubServer
+
+NUMBER = 200
+
+
+def main():
+    with StubServer() as server:
+        url = f"{server.base_url}/v1/ticker"
+        params = {"markets": "KRW-BTC"}
+
+        def one_shot():
+            requests.get(url, headers={"accept": "application/json"}, params=params).json()
+
+        # 커넥션 재사용 효과만 보기 위해 요청 수 제한은 사실상 해제
+        unlimited = RateLimiter(public_rate=1e9)
+        with BithumbClient("key", "secret", base_url=server.base_url, rate_limiter=unlimited) as client:
+            def pooled():
+                client.call_public_api("/v1/ticker", params)
+
+            baseline = measure(one_shot, NUMBER)
+            report("requests.get (new connection per call)", baseline)
+            result = measure(pooled, NUMBER)
+            report("BithumbClient (pooled keep-alive session)", result)
+            print(f"speedup: {baseline['median'] / result['median']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
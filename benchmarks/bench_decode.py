@@ -0,0 +1,33 @@
+"""Ticker/Candle 응답 디코딩 모드별 처리 시간 (캔들 200개, 티커 300개)
+
+    python -m benchmarks.bench_decode
+"""
+from accounts.bithumb.v2_1_0.enums import DecodeMode
+from accounts.bithumb.v2_1_0.services.candle_service import CandleService
+from accounts.bithumb.v2_1_0.services.ticker_service import TickerService
+from benchmarks.fixtures import make_candle_payloads, make_ticker_payload
+from benchmarks.harness import measure, report
+
+CANDLE_COUNT = 200
+TICKER_COUNT = 300
+NUMBER = 50
+
+
+def main():
+    candle_result = {'status_code': 200, 'data': make_candle_payloads("KRW-BTC", CANDLE_COUNT)}
+    ticker_result = {
+        'status_code': 200,
+        'data': [make_ticker_payload(f"KRW-C{i}") for i in range(TICKER_COUNT)],
+    }
+
+    for decode_mode in DecodeMode:
+        result = measure(lambda: CandleService._parse_candles(candle_result, decode_mode), NUMBER)
+        report(f"candles x{CANDLE_COUNT} [{decode_mode}]", result)
+
+    for decode_mode in DecodeMode:
+        result = measure(lambda: TickerService._parse_tickers(ticker_result, decode_mode), NUMBER)
+        report(f"tickers x{TICKER_COUNT} [{decode_mode}]", result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""콜드 스타트 import 시간 측정 및 회귀 검사 (python -X importtime 기반)
+
+    python -m benchmarks.bench_import            # 측정 + 예산/금지 모듈 검사 (실패 시 exit 1)
+    python -m benchmarks.bench_import --top 10   # 대상별로 가장 무거운 모듈 10개 출력
+
+각 대상을 새 인터프리터에서 import하여 stderr의 importtime 로그를 합산한다.
+예산(ms)은 느린 CI에서도 여유가 있도록 잡았고, 금지 모듈은 지연 import가 깨졌는지 확인하는 용도다.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE_NAME = os.path.basename(REPO_ROOT)
+
+REPEAT = 5
+
+# (이름, import 문, 예산 ms, 불러오면 안 되는 모듈)
+TARGETS = [
+    (
+        "package root",
+        f"import {PACKAGE_NAME}",
+        60,
+        ("requests", "jwt", "pydantic", "aiohttp", "numpy"),
+    ),
+    (
+        "accounts.bithumb.v2_1_0",
+        "import accounts.bithumb.v2_1_0",
+        60,
+        ("requests", "jwt", "pydantic", "aiohttp"),
+    ),
+    (
+        "BithumbAPI (sync only)",
+        "from accounts.bithumb.v2_1_0 import BithumbAPI",
+        600,
+        ("aiohttp",),
+    ),
+    (
+        "TurtleStrategy",
+        "from strategies.turtle.turtle_strategy import TurtleStrategy",
+        400,
+        ("requests", "aiohttp"),
+    ),
+    (
+        "VIXStrategy",
+        "from strategies.vix.vix_strategy import VIXStrategy",
+        400,
+        ("yfinance", "pandas"),
+    ),
+    (
+        "FeatGreedStrategy",
+        "from strategies.fear_greed.fear_greed_strategy import FeatGreedStrategy",
+        400,
+        ("fear_and_greed", "requests"),
+    ),
+]
+
+
+def _run(statement: str, forbidden: tuple[str, ...]) -> tuple[list[tuple[int, int, str]], list[str]]:
+    """새 인터프리터에서 statement 실행 -> (importtime 항목, 불러와진 금지 모듈)"""
+    probe = f"import sys; print(','.join(m for m in {forbidden!r} if m in sys.modules))"
+    code = f"import sys; sys.path[:0] = [{REPO_ROOT!r}, {os.path.dirname(REPO_ROOT)!r}]\n{statement}\n{probe}"
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"{statement!r} 실행 실패:\n{completed.stderr[-2000:]}")
+
+    entries = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|", 2)
+        entries.append((int(self_us), int(cumulative_us), name.rstrip()))
+    loaded = [module for module in completed.stdout.strip().split(",") if module]
+    return entries, loaded
+
+
+def _total_ms(entries: list[tuple[int, int, str]], baseline: set[str]) -> float:
+    """인터프리터 기본 모듈을 제외한 최상위 import 누적 시간 합"""
+    total = 0
+    for _, cumulative_us, name in entries:
+        if not name.startswith(" ") or name.startswith("  "):
+            continue # 최상위(들여쓰기 1칸) 항목만 합산
+        if name.strip() in baseline:
+            continue
+        total += cumulative_us
+    return total / 1000
+
+
+def _baseline_modules() -> set[str]:
+    entries, _ = _run("pass", ())
+    return {name.strip() for _, _, name in entries}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--top", type=int, default=0, help="대상별 가장 무거운 모듈 개수")
+    parser.add_argument("--budget-scale", type=float, default=1.0, help="느린 환경에서 예산 배율")
+    args = parser.parse_args(argv)
+
+    baseline = _baseline_modules()
+    failures = []
+    for name, statement, budget_ms, forbidden in TARGETS:
+        samples = []
+        heaviest = []
+        loaded = []
+        for _ in range(REPEAT):
+            entries, loaded = _run(statement, forbidden)
+            samples.append(_total_ms(entries, baseline))
+            own = [entry for entry in entries if entry[2].strip() not in baseline]
+            heaviest = sorted(own, key=lambda entry: entry[0], reverse=True)[:args.top]
+
+        median = statistics.median(samples)
+        budget = budget_ms * args.budget_scale
+        status = "ok" if median <= budget and not loaded else "FAIL"
+        print(f"{name:<28} median {median:>8.1f}ms  best {min(samples):>8.1f}ms  budget {budget:>6.0f}ms  {status}")
+        for self_us, _, module in heaviest:
+            print(f"    {self_us / 1000:>8.1f}ms  {module.strip()}")
+
+        if median > budget:
+            failures.append(f"{name}: {median:.1f}ms > {budget:.0f}ms")
+        if loaded:
+            failures.append(f"{name}: 지연 import 대상이 로드됨 {loaded}")
+
+    for failure in failures:
+        print(f"regression: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
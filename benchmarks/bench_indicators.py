@@ -0,0 +1,47 @@
+"""롤링 지표 시리즈 계산 시간 (10k~1M 봉)
+
+    python -m benchmarks.bench_indicators
+"""
+from common.ohlc_frame import OHLCFrame
+from indicators.moving_average import MovingAverage
+from indicators.rolling import RollingIndicator
+from benchmarks.fixtures import make_price_arrays
+from benchmarks.harness import measure, report
+
+SIZES = (10_000, 100_000, 1_000_000)
+SCALAR_SIZE = 10_000
+N_PERIOD = 20
+DONCHIAN_PERIODS = (10, 20, 55)
+
+
+def main():
+    high, low, close, trade_date = make_price_arrays(SCALAR_SIZE)
+    frame = OHLCFrame(high, low, close, trade_date)
+    closes = close.tolist()
+
+    def scalar_sma():
+        for end in range(N_PERIOD, SCALAR_SIZE + 1):
+            MovingAverage.calculate_sma(closes[end - N_PERIOD:end], N_PERIOD)
+
+    def scalar_atr():
+        for end in range(N_PERIOD + 1, SCALAR_SIZE + 1):
+            MovingAverage.calculate_atr(frame[end - N_PERIOD - 1:end], N_PERIOD)
+
+    report(f"scalar calculate_sma per window x{SCALAR_SIZE}", measure(scalar_sma, 1, repeat=3))
+    report(f"scalar calculate_atr per window x{SCALAR_SIZE}", measure(scalar_atr, 1, repeat=3))
+
+    for size in SIZES:
+        high, low, close, _ = make_price_arrays(size)
+        number = max(1, 100_000 // size)
+
+        report(f"sma({N_PERIOD}) x{size}", measure(lambda: RollingIndicator.sma(close, N_PERIOD), number))
+        report(f"atr({N_PERIOD}) x{size}", measure(lambda: RollingIndicator.atr(high, low, close, N_PERIOD), number))
+        for period in DONCHIAN_PERIODS:
+            report(
+                f"donchian({period}) x{size}",
+                measure(lambda: RollingIndicator.donchian(high, low, period), number),
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+from datetime import datetime, timedelta
+
+
+def make_ticker_payload(market: str, price: float = 50_000_000.0) -> dict:
+    return {
+        "market": market,
+        "trade_date": "20250101",
+        "trade_time": "120000",
+        "trade_date_kst": "20250101",
+        "trade_time_kst": "210000",
+        "trade_timestamp": 1735732800000,
+        "opening_price": price * 0.99,
+        "high_price": price * 1.02,
+        "low_price": price * 0.98,
+        "trade_price": price,
+        "prev_closing_price": price * 0.99,
+        "change": "RISE",
+        "change_price": price * 0.01,
+        "change_rate": 0.0101,
+        "signed_change_price": price * 0.01,
+        "signed_change_rate": 0.0101,
+        "trade_volume": 0.0123,
+        "acc_trade_price": 123456789.0,
+        "acc_trade_price_24h": 234567890.0,
+        "acc_trade_volume": 12.3,
+        "acc_trade_volume_24h": 23.4,
+        "highest_52_week_price": price * 1.5,
+        "highest_52_week_date": "2024-12-01",
+        "lowest_52_week_price": price * 0.5,
+        "lowest_52_week_date": "2024-03-01",
+        "timestamp": 1735732800123,
+    }
+
+
+LISTED_AT = datetime(2018, 1, 1)
+
+
+def make_candle_payloads(
+    market: str,
+    count: int,
+    end: datetime | None = None,
+    step: timedelta = timedelta(days=1),
+    listed_at: datetime = LISTED_AT,
+) -> list[dict]:
+    """최신→과거 순서의 캔들 응답 (빗썸 API와 동일한 정렬)"""
+    end = end or datetime(2025, 1, 1)
+    payloads = []
+    for i in range(count):
+        day = end - step * i
+        if day < listed_at:
+            break
+        base = 50_000_000.0 + (i % 17) * 100_000.0
+        payloads.append({
+            "market": market,
+            "candle_date_time_utc": day.strftime("%Y-%m-%dT%H:%M:%S"),
+            "candle_date_time_kst": (day + timedelta(hours=9)).strftime("%Y-%m-%dT%H:%M:%S"),
+            "opening_price": base,
+            "high_price": base * 1.02,
+            "low_price": base * 0.98,
+            "trade_price": base * 1.01,
+            "timestamp": int(day.timestamp() * 1000),
+            "candle_acc_trade_price": 1234567890.0,
+            "candle_acc_trade_volume": 123.4,
+            "prev_closing_price": base * 0.99,
+            "change_price": base * 0.02,
+            "change_rate": 0.02,
+        })
+    return payloads
+
+
+def make_account_payloads(currencies: list[str]) -> list[dict]:
+    return [
+        {
+            "currency": currency,
+            "balance": "1.5",
+            "locked": "0.0",
+            "avg_buy_price": "50000000",
+            "avg_buy_price_modified": False,
+            "unit_currency": "KRW",
+        }
+        for currency in currencies
+    ]
+
+
+def make_order_payload(
+    uuid: str,
+    market: str = "KRW-BTC",
+    side: str = "bid",
+    ord_type: str = "limit",
+    price: str | None = "50000000",
+    volume: str | None = "0.01",
+    executed_volume: str = "0",
+    state: str = "wait",
+) -> dict:
+    remaining = float(volume or 0) - float(executed_volume)
+    return {
+        "uuid": uuid,
+        "side": side,
+        "ord_type": ord_type,
+        "price": price,
+        "state": state,
+        "market": market,
+        "created_at": "2025-01-01T09:00:00+09:00",
+        "volume": volume,
+        "remaining_volume": f"{remaining:.8f}" if volume is not None else None,
+        "reserved_fee": "0",
+        "remaining_fee": "0",
+        "paid_fee": f"{float(executed_volume) * float(price or 0) * 0.0004:.8f}",
+        "locked": "0",
+        "executed_volume": executed_volume,
+        "trades_count": 1 if float(executed_volume) else 0,
+    }
+
+
+def make_price_arrays(count: int, seed: int = 0):
+    """랜덤워크 기반 (high, low, close, trade_date) numpy 배열"""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    close = 50_000_000.0 * np.exp(np.cumsum(rng.normal(0.0, 0.02, count)))
+    high = close * (1 + rng.uniform(0.0, 0.03, count))
+    low = close * (1 - rng.uniform(0.0, 0.03, count))
+    trade_date = np.datetime64("2000-01-01") + np.arange(count)
+    return high, low, close, trade_date
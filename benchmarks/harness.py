@@ -0,0 +1,41 @@
+import statistics
+import time
+from typing import Callable
+
+BENCHMARKS: dict[str, Callable[[], dict]] = {}
+
+
+def benchmark(name: str):
+    """benchmarks.run에서 실행할 측정 함수 등록 (measure() 결과를 반환하는 함수)"""
+    def register(fn: Callable[[], dict]) -> Callable[[], dict]:
+        BENCHMARKS[name] = fn
+        return fn
+    return register
+
+
+def measure(fn: Callable[[], object], number: int, repeat: int = 5, warmup: int = 1) -> dict:
+    """fn을 number회씩 repeat번 실행하여 1회당 소요 시간(초) 통계 반환"""
+    for _ in range(warmup):
+        fn()
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number)
+
+    return {
+        "number": number,
+        "repeat": repeat,
+        "best": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+    }
+
+
+def report(name: str, result: dict):
+    print(
+        f"{name:<48} best {result['best'] * 1e6:>10.1f}us  "
+        f"median {result['median'] * 1e6:>10.1f}us"
+    )
@@ -0,0 +1,136 @@
+"""등록된 벤치마크 전체 실행 + JSON 저장 + baseline 비교
+
+    python -m benchmarks.run                    # 실행 후 results/latest.json 저장, baseline이 있으면 비교
+    python -m benchmarks.run -k strategy        # 이름에 strategy가 포함된 항목만
+    python -m benchmarks.run --save-baseline    # 이번 결과를 baseline으로 저장
+    python -m benchmarks.run --threshold 0.2    # 중앙값이 20% 넘게 느려졌을 때만 회귀로 판단
+
+결과는 측정한 기기에 종속되므로 baseline은 같은 기기에서 만든 것과 비교해야 한다.
+회귀가 있으면 exit 1.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+
+import benchmarks.suite # noqa: F401 - 측정 항목 등록
+from benchmarks.harness import BENCHMARKS, report
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+DEFAULT_OUTPUT = os.path.join(RESULTS_DIR, "latest.json")
+DEFAULT_BASELINE = os.path.join(RESULTS_DIR, "baseline.json")
+DEFAULT_THRESHOLD = 0.10
+
+
+def run(names: list[str]) -> dict[str, dict]:
+    results = {}
+    for name in names:
+        result = BENCHMARKS[name]()
+        report(name, result)
+        results[name] = {**result, "ops_per_sec": 1 / result["median"]}
+    return results
+
+
+def compare(results: dict[str, dict], baseline: dict[str, dict], threshold: float) -> list[str]:
+    """중앙값 비율로 baseline과 비교 -> 회귀 항목 이름"""
+    regressions = []
+    print(f"\n{'benchmark':<40} {'baseline':>12} {'current':>12} {'change':>9}")
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            print(f"{name:<40} {'-':>12} {_format(result['median']):>12} {'new':>9}")
+            continue
+
+        ratio = result["median"] / previous["median"]
+        if ratio > 1 + threshold:
+            status = "REGRESSION"
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            status = "faster"
+        else:
+            status = ""
+        print(
+            f"{name:<40} {_format(previous['median']):>12} {_format(result['median']):>12} "
+            f"{(ratio - 1) * 100:>+8.1f}%  {status}"
+        )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-k", dest="keyword", default=None, help="이름에 포함된 항목만 실행")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="회귀로 판단할 중앙값 증가 비율")
+    parser.add_argument("--save-baseline", action="store_true", help="결과를 baseline 경로에 저장")
+    parser.add_argument("--list", action="store_true", help="항목 이름만 출력")
+    args = parser.parse_args(argv)
+
+    names = [name for name in BENCHMARKS if args.keyword is None or args.keyword in name]
+    if args.list:
+        print("\n".join(names))
+        return 0
+    if not names:
+        print(f"'{args.keyword}'에 해당하는 벤치마크가 없습니다.")
+        return 1
+
+    document = {"meta": _meta(), "results": run(names)}
+    _write(args.output, document)
+    print(f"\nsaved: {args.output}")
+
+    if args.save_baseline:
+        _write(args.baseline, document)
+        print(f"baseline saved: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"baseline 없음: {args.baseline} (--save-baseline으로 생성)")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)
+    regressions = compare(document["results"], baseline["results"], args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)}개 항목이 {args.threshold:.0%} 넘게 느려졌습니다: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+def _format(seconds: float) -> str:
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds * 1e6:.2f}us"
+
+
+def _meta() -> dict:
+    import numpy
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, cwd=os.path.dirname(RESULTS_DIR),
+        ).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": numpy.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def _write(path: str, document: dict):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(document, file, indent=2)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
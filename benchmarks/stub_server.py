@@ -0,0 +1,182 @@
+import itertools
+import json
+import threading
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from benchmarks.fixtures import (
+    make_ticker_payload,
+    make_candle_payloads,
+    make_account_payloads,
+    make_order_payload,
+)
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive 지원
+    disable_nagle_algorithm = True  # 헤더/바디 분할 전송 시 delayed ACK 대기 방지
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, body):
+        raw = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def _drain_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        query = parse_qs(parsed.query)
+        params = {key: values[-1] for key, values in query.items()}
+
+        if parsed.path == "/v1/ticker":
+            markets = params.get("markets", "KRW-BTC").split(",")
+            self._send_json(200, [make_ticker_payload(market) for market in markets])
+        elif parsed.path.startswith("/v1/candles/"):
+            market = params.get("market", "KRW-BTC")
+            count = int(params.get("count", 1))
+            step = self._candle_step(parsed.path)
+            to = datetime.fromisoformat(params["to"]) if "to" in params else datetime.utcnow()
+            end = datetime.min + ((to - datetime.min) // step) * step
+            if end == to:
+                end -= step  # to 미포함
+            self._send_json(200, make_candle_payloads(market, count, end=end, step=step))
+        elif parsed.path == "/v1/accounts":
+            self._send_json(200, make_account_payloads(["KRW", "BTC", "ETH"]))
+        elif parsed.path == "/v1/orders":
+            orders = self.server.orders.poll(query.get("uuids[]", []), query.get("states[]") or ["wait"])
+            self._send_json(200 if orders is not None else 400, orders if orders is not None else {"error": {"name": "invalid_states"}})
+        elif parsed.path == "/v1/order":
+            order = self.server.orders.get(params.get("uuid", ""))
+            self._send_json(200 if order else 404, order or {"error": {"name": "order_not_found"}})
+        else:
+            self._send_json(404, {"error": {"name": "not_found", "message": parsed.path}})
+
+    @staticmethod
+    def _candle_step(path: str) -> timedelta:
+        unit = path.removeprefix("/v1/candles/")
+        if unit.startswith("minutes/"):
+            return timedelta(minutes=int(unit.split("/")[1]))
+        if unit == "weeks":
+            return timedelta(weeks=1)
+        return timedelta(days=1)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}")
+        self._send_json(201, self.server.orders.create(body))
+
+    def do_DELETE(self):
+        self._drain_body()
+        params = {key: values[-1] for key, values in parse_qs(urlparse(self.path).query).items()}
+        order = self.server.orders.cancel(params.get("uuid", ""))
+        self._send_json(200 if order else 404, order or {"error": {"name": "order_not_found"}})
+
+
+class _StubOrderBook:
+    """생성된 주문을 기억하고 /v1/orders 열린 주문 조회마다 주문 수량의 절반씩 체결시키는 주문장
+
+    실제 API처럼 states[]에 열린 상태(wait/watch)와 종료 상태(done/cancel)를 섞으면 거부한다.
+    """
+
+    def __init__(self):
+        self._orders: dict[str, dict] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def create(self, body: dict) -> dict:
+        with self._lock:
+            uuid = f"stub-{next(self._ids)}"
+            volume = body.get("volume")
+            if volume is None and body.get("price"):  # 시장가 매수: 금액 / 가격
+                volume = f"{float(body['price']) / 50_000_000:.8f}"
+            order = make_order_payload(
+                uuid,
+                market=body.get("market", "KRW-BTC"),
+                side=body.get("side", "bid"),
+                ord_type=body.get("ord_type", "limit"),
+                price=body.get("price", "50000000") if body.get("ord_type") != "market" else None,
+                volume=volume,
+            )
+            self._orders[uuid] = order
+            return order
+
+    def get(self, uuid: str) -> dict | None:
+        with self._lock:
+            return self._orders.get(uuid)
+
+    def cancel(self, uuid: str) -> dict | None:
+        with self._lock:
+            order = self._orders.get(uuid)
+            if order is not None and order["state"] == "wait":
+                order.update(state="cancel")
+            return order
+
+    def poll(self, uuids: list[str], states: list[str]) -> list[dict] | None:
+        open_query = set(states) <= {"wait", "watch"}
+        if not open_query and not set(states) <= {"done", "cancel"}:
+            return None
+        with self._lock:
+            orders = []
+            for uuid in uuids:
+                order = self._orders.get(uuid)
+                if order is None:
+                    continue
+                if open_query and order["state"] == "wait":
+                    volume = float(order["volume"])
+                    executed = min(volume, float(order["executed_volume"]) + volume / 2)
+                    order = make_order_payload(
+                        uuid, order["market"], order["side"], order["ord_type"], order["price"],
+                        order["volume"], f"{executed:.8f}", "done" if executed >= volume else "wait",
+                    )
+                    self._orders[uuid] = order
+                if order["state"] in states:
+                    orders.append(order)
+            return orders
+
+
+class _QuietHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.orders = _StubOrderBook()
+
+    def handle_error(self, request, client_address):
+        pass  # 클라이언트가 keep-alive 커넥션을 끊을 때 발생하는 reset 무시
+
+
+class StubServer:
+    """빗썸 REST API 응답을 흉내내는 로컬 HTTP 서버"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self._server = _QuietHTTPServer((host, port), _StubHandler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubServer":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
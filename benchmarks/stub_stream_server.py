@@ -0,0 +1,111 @@
+import asyncio
+import json
+import threading
+import time
+
+from aiohttp import web, WSMsgType
+
+
+class StubStreamServer:
+    """빗썸 WebSocket 시세 API를 흉내내는 로컬 서버
+
+    구독 메시지를 받으면 구독한 마켓마다 interval초 간격으로 ticker/trade 메시지를 보낸다.
+    가격은 base_price에서 틱마다 1씩 오른다. drop_connections()로 재연결을 시험할 수 있다.
+    """
+
+    def __init__(self, interval: float = 0.01, base_price: float = 100_000_000.0):
+        self.interval = interval
+        self.base_price = base_price
+        self.subscriptions: list[list[dict]] = []
+        self._sockets: set[web.WebSocketResponse] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._runner: web.AppRunner | None = None
+        self._thread: threading.Thread | None = None
+        self._ready = threading.Event()
+        self.port = 0
+
+    @property
+    def url(self) -> str:
+        return f"ws://127.0.0.1:{self.port}/websocket/v1"
+
+    def start(self) -> "StubStreamServer":
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._start(), self._loop).result()
+        return self
+
+    def stop(self):
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+
+    def drop_connections(self):
+        """연결된 모든 클라이언트 소켓을 서버 쪽에서 끊음"""
+        asyncio.run_coroutine_threadsafe(self._close_sockets(), self._loop).result()
+
+    def __enter__(self) -> "StubStreamServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    async def _start(self):
+        app = web.Application()
+        app.router.add_get("/websocket/v1", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    async def _stop(self):
+        await self._close_sockets()
+        await self._runner.cleanup()
+
+    async def _close_sockets(self):
+        for ws in list(self._sockets):
+            await ws.close()
+
+    async def _handle(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self._sockets.add(ws)
+        publisher: asyncio.Task | None = None
+        try:
+            async for message in ws:
+                if message.type != WSMsgType.TEXT:
+                    continue
+                subscription = json.loads(message.data)
+                self.subscriptions.append(subscription)
+                if publisher is not None:
+                    publisher.cancel()
+                publisher = asyncio.ensure_future(self._publish(ws, subscription))
+        finally:
+            if publisher is not None:
+                publisher.cancel()
+            self._sockets.discard(ws)
+        return ws
+
+    async def _publish(self, ws: web.WebSocketResponse, subscription: list[dict]):
+        channels = [(item["type"], item["codes"]) for item in subscription if "type" in item]
+        sequence = 0
+        while not ws.closed:
+            sequence += 1
+            now = int(time.time() * 1000)
+            for channel, codes in channels:
+                for code in codes:
+                    payload = {
+                        "type": channel,
+                        "code": code,
+                        "trade_price": self.base_price + sequence,
+                        "trade_timestamp": now,
+                        "timestamp": now,
+                        "stream_type": "REALTIME",
+                    }
+                    await ws.send_bytes(json.dumps(payload).encode())
+            await asyncio.sleep(self.interval)
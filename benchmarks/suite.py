@@ -0,0 +1,152 @@
+"""benchmarks.run이 실행하는 고정 측정 항목
+
+항목 이름은 결과 JSON과 baseline 비교의 키이므로, 측정 내용을 바꾸면 이름도 바꿔야 비교가 의미 있다.
+모든 항목은 1회(요청/디코딩/판단)당 소요 시간을 반환한다.
+"""
+from itertools import cycle
+
+from accounts.bithumb.v2_1_0.api import BithumbAPI
+from accounts.bithumb.v2_1_0.bithumb_exchange import BithumbExchange
+from accounts.bithumb.v2_1_0.config.bithumb_client import BithumbClient
+from accounts.bithumb.v2_1_0.config.rate_limiter import RateLimiter
+from accounts.bithumb.v2_1_0.services.candle_service import CandleService
+from accounts.bithumb.v2_1_0.services.ticker_service import TickerService
+from accounts.simulated.simulated_exchange import SimulatedExchange
+from benchmarks.fixtures import make_candle_payloads, make_price_arrays, make_ticker_payload
+from benchmarks.harness import benchmark, measure
+from benchmarks.stub_server import StubServer
+from common.ohlc_frame import OHLCFrame
+from indicators.moving_average import MovingAverage
+from strategies.turtle.constants import L1_BASE_BUY_PERIOD, L1_BASE_SELL_PERIOD, N_PERIOD
+from strategies.turtle.turtle_strategy import TurtleStrategy
+
+CANDLE_COUNT = 200
+TICKER_COUNT = 300
+BAR_COUNT = 5_000
+SIMULATED_MARKETS = 20
+SIMULATED_DAYS = 365
+
+
+def _frame(count: int = BAR_COUNT, seed: int = 0) -> OHLCFrame:
+    return OHLCFrame(*make_price_arrays(count, seed))
+
+
+def _windows(frame: OHLCFrame, period: int) -> list[tuple[float, OHLCFrame]]:
+    """(현재가, 직전 period개 봉) 목록 - 판단 함수에 돌아가며 넣는다"""
+    return [(float(frame.close[end]), frame.window(end, period)) for end in range(period, len(frame))]
+
+
+@benchmark("client.call_public_api")
+def client_call_public_api() -> dict:
+    with StubServer() as server:
+        # 요청 수 제한/응답 캐시 없이 HTTP 왕복과 JSON 디코딩만 측정
+        with BithumbClient("key", "secret", base_url=server.base_url, rate_limiter=RateLimiter(public_rate=1e9)) as client:
+            return measure(lambda: client.call_public_api("/v1/ticker", {"markets": "KRW-BTC"}), 200)
+
+
+@benchmark(f"decode.candles_x{CANDLE_COUNT}")
+def decode_candles() -> dict:
+    result = {'status_code': 200, 'data': make_candle_payloads("KRW-BTC", CANDLE_COUNT)}
+    return measure(lambda: CandleService._parse_candles(result), 50)
+
+
+@benchmark(f"decode.tickers_x{TICKER_COUNT}")
+def decode_tickers() -> dict:
+    result = {'status_code': 200, 'data': [make_ticker_payload(f"KRW-C{i}") for i in range(TICKER_COUNT)]}
+    return measure(lambda: TickerService._parse_tickers(result), 50)
+
+
+@benchmark("indicators.calculate_sma")
+def indicators_calculate_sma() -> dict:
+    closes = _frame().close.tolist()
+    windows = cycle([closes[end - N_PERIOD:end] for end in range(N_PERIOD, len(closes))])
+    return measure(lambda: MovingAverage.calculate_sma(next(windows), N_PERIOD), 5_000)
+
+
+@benchmark("indicators.calculate_atr")
+def indicators_calculate_atr() -> dict:
+    frame = _frame()
+    windows = cycle([frame.window(end, N_PERIOD + 1) for end in range(N_PERIOD + 1, len(frame))])
+    return measure(lambda: MovingAverage.calculate_atr(next(windows), N_PERIOD), 5_000)
+
+
+@benchmark("strategy.turtle_buy")
+def strategy_turtle_buy() -> dict:
+    strategy = TurtleStrategy()
+    windows = cycle(_windows(_frame(), L1_BASE_BUY_PERIOD))
+
+    def decide():
+        price, window = next(windows)
+        strategy.buy(price, window)
+    return measure(decide, 20_000)
+
+
+@benchmark("strategy.turtle_sell")
+def strategy_turtle_sell() -> dict:
+    strategy = TurtleStrategy()
+    strategy.add_position(price=50_000_000, quantity=1, trade_date="2000-01-01")
+    windows = cycle(_windows(_frame(), L1_BASE_SELL_PERIOD))
+
+    def decide():
+        price, window = next(windows)
+        strategy.sell(price, window, N=1_000_000)
+    return measure(decide, 20_000)
+
+
+@benchmark("strategy.turtle_pyramid_buy")
+def strategy_turtle_pyramid_buy() -> dict:
+    strategy = TurtleStrategy()
+    strategy.add_position(price=50_000_000, quantity=1, trade_date="2000-01-01")
+    prices = cycle(_frame().close.tolist())
+    return measure(lambda: strategy.pyramid_buy(next(prices), N=1_000_000), 20_000)
+
+
+@benchmark("strategy.simulated_loop_decision")
+def strategy_simulated_loop_decision() -> dict:
+    """SimulatedExchange 위에서 마켓별 시세 조회 + 매수/청산/추가매수 판단 + 주문까지 한 번"""
+    frames = {f"KRW-C{i}": _frame(SIMULATED_DAYS, seed=i) for i in range(SIMULATED_MARKETS)}
+    decisions = SIMULATED_MARKETS * (SIMULATED_DAYS - L1_BASE_BUY_PERIOD - 1)
+
+    def replay():
+        exchange = SimulatedExchange(frames, balances={"KRW": 1e12}, fee_rate=0.0004)
+        strategies = {market: TurtleStrategy(market=market) for market in frames}
+
+        def on_step(simulated: SimulatedExchange):
+            prices = simulated.current_prices(list(frames))
+            for market, strategy in strategies.items():
+                frame = simulated.candles_frame(market, L1_BASE_BUY_PERIOD + 1)[:-1] # 당일 봉 제외
+                if len(frame) < L1_BASE_BUY_PERIOD:
+                    continue
+                price = prices[market]
+                n_value = MovingAverage.calculate_atr(frame, len(frame) - 1)
+                book = strategy.book()
+                if not book:
+                    if strategy.buy(price, frame):
+                        simulated.buy(market, 1_000_000)
+                        strategy.add_position(price=price, quantity=1, trade_date=str(simulated.now))
+                elif strategy.sell(price, frame[-L1_BASE_SELL_PERIOD:], N=n_value):
+                    simulated.sell(market, simulated.balance(market.split("-")[1]))
+                    strategy.clear_position()
+                elif strategy.pyramid_buy(price, N=n_value):
+                    simulated.buy(market, 1_000_000)
+                    strategy.add_position(price=price, quantity=1, trade_date=str(simulated.now))
+
+        exchange.run(on_step)
+
+    result = measure(replay, 1, repeat=3)
+    return {**result, **{key: result[key] / decisions for key in ("best", "median", "mean")}}
+
+
+@benchmark(f"exchange.candles_x{CANDLE_COUNT}")
+def exchange_candles() -> dict:
+    """BithumbExchange.candles 요청부터 OHLC 변환까지 (응답 캐시 없이 매번 HTTP 조회)"""
+    with StubServer() as server:
+        api = BithumbAPI(
+            "key", "secret",
+            use_response_cache=False,
+            base_url=server.base_url,
+            rate_limiter=RateLimiter(public_rate=1e9),
+        )
+        with api:
+            exchange = BithumbExchange(api)
+            return measure(lambda: exchange.candles("KRW-BTC", CANDLE_COUNT), 50)
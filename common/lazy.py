@@ -0,0 +1,33 @@
+"""패키지 공개 API 지연 import (PEP 562)
+
+패키지 __init__에서 하위 모듈을 바로 import하면, 동기 API만 쓰거나 일부 기능만 쓰는
+cron/CLI도 콜드 스타트에 requests/jwt/pydantic/numpy/aiohttp/.env 로드 비용을 모두 치른다.
+공개 이름은 처음 접근할 때 해당 모듈을 import하고, 타입 검사용 import는 TYPE_CHECKING 아래에 둔다.
+
+    __getattr__, __dir__ = lazy_attributes(globals(), {
+        'BithumbAPI': 'accounts.bithumb.v2_1_0.api',
+    })
+"""
+import importlib
+from typing import Any, Callable
+
+
+def lazy_attributes(
+    module_globals: dict[str, Any],
+    attributes: dict[str, str],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """{공개 이름: 모듈 경로}로 모듈 수준 __getattr__, __dir__ 생성"""
+    module_name = module_globals["__name__"]
+
+    def __getattr__(name: str) -> Any:
+        source = attributes.get(name)
+        if source is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(source), name)
+        module_globals[name] = value  # 이후 접근은 일반 속성 조회
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(module_globals) | set(module_globals.get("__all__", ())))
+
+    return __getattr__, __dir__
@@ -0,0 +1,348 @@
+"""경량 계측 - 카운터/히스토그램/구간 측정(span)과 Prometheus 텍스트 내보내기
+
+기본 레지스트리 metrics는 꺼진 상태로 시작하며, 꺼져 있으면 계측 지점은 플래그 확인만 하고 넘어간다.
+
+    from common.metrics import metrics
+    metrics.enable()
+    ...
+    print(metrics.export())                  # Prometheus text format 0.0.4
+    print(metrics.export(openmetrics=True))  # OpenMetrics 1.0
+"""
+import bisect
+import functools
+import math
+import sys
+import threading
+import time
+from collections import Counter as _FrameCounter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 초 단위 지연시간 버킷 - 수 µs 전략 판단부터 수 초 네트워크 지연까지
+DEFAULT_BUCKETS = (
+    1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4,
+    1e-3, 2.5e-3, 5e-3, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+
+class Counter:
+    """레이블 값 튜플별 누적 카운터 (이름에 _total은 붙이지 않는다)"""
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels: tuple = (), amount: float = 1.0):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, labels: tuple = ()) -> float:
+        return self._values.get(labels, 0.0)
+
+    def reset(self):
+        with self._lock:
+            self._values = {}
+
+    def samples(self, openmetrics: bool) -> list[tuple[str, tuple, tuple, float]]:
+        with self._lock:
+            values = dict(self._values)
+        return [(f"{self.name}_total", self.labelnames, labels, value) for labels, value in sorted(values.items())]
+
+
+class Histogram:
+    """레이블 값 튜플별 버킷 히스토그램 (버킷 경계는 le 이하 누적)"""
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[tuple, list] = {} # 레이블 -> [버킷별 개수(+Inf 포함), 합, 개수]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, labels: tuple = ()):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def count(self, labels: tuple = ()) -> int:
+        series = self._series.get(labels)
+        return series[2] if series is not None else 0
+
+    def total(self, labels: tuple = ()) -> float:
+        series = self._series.get(labels)
+        return series[1] if series is not None else 0.0
+
+    def reset(self):
+        with self._lock:
+            self._series = {}
+
+    def samples(self, openmetrics: bool) -> list[tuple[str, tuple, tuple, float]]:
+        with self._lock:
+            series = {labels: (list(counts), total, count) for labels, (counts, total, count) in self._series.items()}
+
+        samples = []
+        bucket_labelnames = self.labelnames + ("le",)
+        for labels, (counts, total, count) in sorted(series.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucket_count
+                samples.append((f"{self.name}_bucket", bucket_labelnames, labels + (_format_bound(bound),), cumulative))
+            samples.append((f"{self.name}_sum", self.labelnames, labels, total))
+            samples.append((f"{self.name}_count", self.labelnames, labels, count))
+        return samples
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("histogram", "labels", "started")
+
+    def __init__(self, histogram: Histogram, labels: tuple):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.histogram.observe(time.perf_counter() - self.started, self.labels)
+        return False
+
+
+class MetricsRegistry:
+    """이름별 메트릭 모음 - counter()/histogram()은 같은 이름이면 기존 메트릭을 돌려준다
+
+    enabled가 False면 span()은 아무것도 하지 않는 객체를, timed()로 감싼 함수는 원래 함수를 바로 호출한다.
+    계측 지점에서 직접 inc()/observe()를 부를 때는 metrics.enabled를 먼저 확인한다.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._metrics: dict[str, Counter | Histogram] = {}
+        self._lock = threading.Lock()
+        self._profiler: SamplingProfiler | None = None
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        """값만 초기화 (계측 지점이 가진 메트릭 참조는 유지)"""
+        for metric in list(self._metrics.values()):
+            metric.reset()
+
+    def counter(self, name: str, documentation: str = "", labelnames: tuple[str, ...] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str = "",
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> Counter | Histogram | None:
+        return self._metrics.get(name)
+
+    def span(self, name: str, **labels):
+        """with metrics.span("name", key=value): 구간 소요 시간(초)을 히스토그램 name에 기록"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self.histogram(name, labelnames=tuple(labels)), tuple(labels.values()))
+
+    def timed(self, name: str, documentation: str = "", **labels):
+        """함수 호출 소요 시간(초)을 히스토그램 name에 기록하는 데코레이터"""
+        histogram = self.histogram(name, documentation, tuple(labels))
+        label_values = tuple(labels.values())
+
+        def decorate(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return fn(*args, **kwargs)
+                started = time.perf_counter()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    histogram.observe(time.perf_counter() - started, label_values)
+            return wrapper
+        return decorate
+
+    def export(self, openmetrics: bool = False) -> str:
+        """Prometheus text format 0.0.4 (openmetrics=True면 OpenMetrics 1.0)"""
+        lines = []
+        for name, metric in sorted(self._metrics.items()):
+            samples = metric.samples(openmetrics)
+            if not samples:
+                continue
+            family = name if openmetrics or metric.kind != "counter" else f"{name}_total"
+            if metric.documentation:
+                lines.append(f"# HELP {family} {_escape_help(metric.documentation)}")
+            lines.append(f"# TYPE {family} {metric.kind}")
+            for sample_name, labelnames, labels, value in samples:
+                lines.append(f"{sample_name}{_format_labels(labelnames, labels)} {_format_value(value)}")
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """/metrics를 내보내는 HTTP 서버를 백그라운드 스레드로 시작 (종료는 shutdown())"""
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                openmetrics = "application/openmetrics-text" in self.headers.get("Accept", "")
+                body = registry.export(openmetrics).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", OPENMETRICS_CONTENT_TYPE if openmetrics else PROMETHEUS_CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+        return server
+
+    def start_profiler(self, interval: float = 0.005, thread_ids: set[int] | None = None) -> "SamplingProfiler":
+        """샘플링 프로파일러 시작 - 기존 프로파일러가 있으면 멈추고 새로 시작"""
+        self.stop_profiler()
+        self._profiler = SamplingProfiler(interval, thread_ids).start()
+        return self._profiler
+
+    def stop_profiler(self) -> "SamplingProfiler | None":
+        profiler, self._profiler = self._profiler, None
+        if profiler is not None:
+            profiler.stop()
+        return profiler
+
+    def _get_or_create(self, cls, name: str, documentation: str, labelnames: tuple[str, ...], **kwargs):
+        metric = self._metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(name)
+                if metric is None:
+                    metric = self._metrics[name] = cls(name, documentation, labelnames, **kwargs)
+        if not isinstance(metric, cls) or metric.labelnames != labelnames:
+            raise ValueError(f"{name} 메트릭이 다른 종류 또는 레이블로 이미 등록되어 있습니다.")
+        if documentation and not metric.documentation:
+            metric.documentation = documentation
+        return metric
+
+
+class SamplingProfiler:
+    """interval마다 스레드 스택을 샘플링해 접힌 스택(folded stack)별 횟수를 모으는 프로파일러
+
+    sys._current_frames()만 읽으므로 대상 코드를 바꾸지 않으며, folded()는 flamegraph.pl/speedscope 입력 형식이다.
+    """
+
+    def __init__(self, interval: float = 0.005, thread_ids: set[int] | None = None):
+        self.interval = interval
+        self.thread_ids = thread_ids
+        self.samples = 0
+        self._stacks: _FrameCounter[str] = _FrameCounter()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> "SamplingProfiler":
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float | None = 5.0):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._thread = None
+
+    def folded(self) -> str:
+        return "\n".join(f"{stack} {count}" for stack, count in self._stacks.most_common())
+
+    def top(self, count: int = 20) -> list[tuple[str, int]]:
+        """가장 많이 샘플링된 함수 (스택의 맨 위 프레임 기준)"""
+        leaves: _FrameCounter[str] = _FrameCounter()
+        for stack, samples in self._stacks.items():
+            leaves[stack.rsplit(";", 1)[-1]] += samples
+        return leaves.most_common(count)
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop_event.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id or (self.thread_ids is not None and thread_id not in self.thread_ids):
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_qualname} ({code.co_filename.rsplit('/', 1)[-1]}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                self._stacks[";".join(reversed(stack))] += 1
+            self.samples += 1
+
+
+def _format_labels(labelnames: tuple[str, ...], labels: tuple) -> str:
+    if not labelnames:
+        return ""
+    pairs = ",".join(f'{name}="{_escape_label(str(value))}"' for name, value in zip(labelnames, labels))
+    return f"{{{pairs}}}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value)) if abs(value) < 1e15 else repr(float(value))
+    return repr(float(value))
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == math.inf else repr(float(bound))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+metrics = MetricsRegistry()
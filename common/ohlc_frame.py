@@ -0,0 +1,69 @@
+from collections.abc import Iterator
+from datetime import date
+
+import numpy as np
+
+from common.schema import OHLC
+
+
+class OHLCFrame:
+    """OHLC 묶음을 high/low/close/trade_date 연속 배열로 보관 (과거→최신 순서)
+
+    슬라이싱은 numpy view를 반환하므로 윈도우를 잘라도 복사가 일어나지 않는다.
+    """
+    __slots__ = ("high", "low", "close", "trade_date")
+
+    def __init__(self, high, low, close, trade_date):
+        self.high = np.asarray(high, dtype=np.float64)
+        self.low = np.asarray(low, dtype=np.float64)
+        self.close = np.asarray(close, dtype=np.float64)
+        self.trade_date = np.asarray(trade_date, dtype="datetime64[D]")
+
+        if not len(self.high) == len(self.low) == len(self.close) == len(self.trade_date):
+            raise ValueError("high, low, close, trade_date 배열 길이가 동일하지 않습니다.")
+
+    @classmethod
+    def from_ohlcs(cls, ohlcs: list[OHLC]) -> "OHLCFrame":
+        return cls(
+            high=[ohlc.high for ohlc in ohlcs],
+            low=[ohlc.low for ohlc in ohlcs],
+            close=[ohlc.close for ohlc in ohlcs],
+            trade_date=[ohlc.trade_date for ohlc in ohlcs],
+        )
+
+    def to_ohlcs(self) -> list[OHLC]:
+        return list(self)
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    def __iter__(self) -> Iterator[OHLC]:
+        for high, low, close, trade_date in zip(
+            self.high.tolist(), self.low.tolist(), self.close.tolist(), self.trade_date.tolist()
+        ):
+            yield OHLC(high=high, low=low, close=close, trade_date=trade_date)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return OHLCFrame(self.high[key], self.low[key], self.close[key], self.trade_date[key])
+
+        trade_date: date = self.trade_date[key].item()
+        return OHLC(
+            high=float(self.high[key]),
+            low=float(self.low[key]),
+            close=float(self.close[key]),
+            trade_date=trade_date,
+        )
+
+    def tail(self, count: int) -> "OHLCFrame":
+        """최근 count개 구간 (view)"""
+        return self[max(len(self) - count, 0):]
+
+    def window(self, end: int, period: int) -> "OHLCFrame":
+        """end 직전 period개 구간 (view) - end 인덱스 봉은 포함하지 않음"""
+        return self[max(end - period, 0):end]
+
+    def __repr__(self) -> str:
+        if not len(self):
+            return "OHLCFrame(0 bars)"
+        return f"OHLCFrame({len(self)} bars, {self.trade_date[0]} ~ {self.trade_date[-1]})"
@@ -1,19 +1,25 @@
+import numpy as np
+
 from common.schema import OHLC
+from common.ohlc_frame import OHLCFrame
 
 
 class MovingAverage:
     @staticmethod
     def calculate_sma(prices: list[float], period: int) -> float:
-        if len(prices) == period:
+        if len(prices) != period:
             raise ValueError(f"prices와 period 개수가 매칭되지 않습니다. {prices=}개, {period=}개")
 
         return sum(prices) / period
 
     @staticmethod
-    def calculate_atr(ohlcs: list[OHLC], period: int) -> float:
+    def calculate_atr(ohlcs: list[OHLC] | OHLCFrame, period: int) -> float:
         if not len(ohlcs) == period + 1:
             raise ValueError(f"ATR 계산을 위해 period보다 1개 더 많은 ohlcs 개수가 필요합니다.")
 
+        if isinstance(ohlcs, OHLCFrame):
+            return MovingAverage._calculate_frame_atr(ohlcs, period)
+
         true_ranges = []
         for i in range(1, len(ohlcs)):
             high_low = ohlcs[i].high - ohlcs[i].low
@@ -27,4 +33,15 @@ class MovingAverage:
             atr = ((period - 1) * atr + true_ranges[i]) / period # (19 × 이전ATR + 새TR) / 20
 
         return atr
-    
\ No newline at end of file
+
+    @staticmethod
+    def _calculate_frame_atr(frame: OHLCFrame, period: int) -> float:
+        high, low, prev_close = frame.high[1:], frame.low[1:], frame.close[:-1]
+        true_ranges = np.maximum(high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)))
+
+        atr = float(true_ranges[:period].mean())
+
+        for true_range in true_ranges[period:].tolist():
+            atr = ((period - 1) * atr + true_range) / period
+
+        return atr
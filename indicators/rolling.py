@@ -0,0 +1,118 @@
+import math
+
+import numpy as np
+
+
+class RollingIndicator:
+    """전체 가격 배열에 대한 롤링 지표 시리즈를 한 번에 계산
+
+    모든 결과는 입력과 같은 길이이며, 값이 정의되지 않는 초기 구간은 NaN으로 채운다.
+    i번째 값은 i번째 봉까지(포함)의 데이터로 계산된다.
+    """
+
+    @staticmethod
+    def sma(values, period: int) -> np.ndarray:
+        """단순 이동평균 - result[i] == MovingAverage.calculate_sma(values[i-period+1:i+1], period)"""
+        values = np.asarray(values, dtype=np.float64)
+        RollingIndicator._validate_period(period)
+
+        result = np.full(len(values), np.nan)
+        if len(values) < period:
+            return result
+
+        # 큰 가격대에서 누적합 오차를 줄이기 위해 첫 값 기준으로 평행이동 후 누적
+        offset = values[0]
+        cumsum = np.concatenate(([0.0], np.cumsum(values - offset)))
+        result[period - 1:] = (cumsum[period:] - cumsum[:-period]) / period + offset
+        return result
+
+    @staticmethod
+    def true_range(high, low, close) -> np.ndarray:
+        """True Range - 첫 봉은 전일 종가가 없으므로 high - low"""
+        high = np.asarray(high, dtype=np.float64)
+        low = np.asarray(low, dtype=np.float64)
+        close = np.asarray(close, dtype=np.float64)
+
+        true_ranges = high - low
+        if len(true_ranges) > 1:
+            prev_close = close[:-1]
+            np.maximum(true_ranges[1:], np.abs(high[1:] - prev_close), out=true_ranges[1:])
+            np.maximum(true_ranges[1:], np.abs(low[1:] - prev_close), out=true_ranges[1:])
+        return true_ranges
+
+    @staticmethod
+    def atr(high, low, close, period: int) -> np.ndarray:
+        """Wilder ATR (터틀의 N)
+
+        result[period]는 첫 period개 True Range의 단순 평균으로, period+1개 봉으로 계산한
+        MovingAverage.calculate_atr와 같다. 이후는 (period-1) × 이전ATR + TR) / period로 이어간다.
+        """
+        RollingIndicator._validate_period(period)
+        true_ranges = RollingIndicator.true_range(high, low, close)
+
+        result = np.full(len(true_ranges), np.nan)
+        if len(true_ranges) < period + 1:
+            return result
+
+        seed = true_ranges[1:period + 1].mean()
+        result[period] = seed
+        result[period + 1:] = RollingIndicator._wilder_smooth(seed, true_ranges[period + 1:], period)
+        return result
+
+    @staticmethod
+    def rolling_max(values, period: int) -> np.ndarray:
+        """period 구간 최고값 (van Herk/Gil-Werman, 봉 하나당 O(1))"""
+        values = np.asarray(values, dtype=np.float64)
+        RollingIndicator._validate_period(period)
+
+        count = len(values)
+        result = np.full(count, np.nan)
+        if count < period:
+            return result
+
+        padded = np.concatenate((values, np.full(-count % period, -np.inf)))
+        blocks = padded.reshape(-1, period)
+        prefix = np.maximum.accumulate(blocks, axis=1).ravel()
+        suffix = np.maximum.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+
+        result[period - 1:] = np.maximum(suffix[:count - period + 1], prefix[period - 1:count])
+        return result
+
+    @staticmethod
+    def rolling_min(values, period: int) -> np.ndarray:
+        """period 구간 최저값"""
+        return -RollingIndicator.rolling_max(-np.asarray(values, dtype=np.float64), period)
+
+    @staticmethod
+    def donchian(high, low, period: int) -> tuple[np.ndarray, np.ndarray]:
+        """돈치안 채널 (period 구간 최고 고가, 최저 저가)"""
+        return RollingIndicator.rolling_max(high, period), RollingIndicator.rolling_min(low, period)
+
+    @staticmethod
+    def _wilder_smooth(seed: float, values: np.ndarray, period: int) -> np.ndarray:
+        """y[k] = ((period-1) × y[k-1] + x[k]) / period 점화식을 블록 단위 누적합으로 계산"""
+        if period == 1:
+            return values.copy()
+
+        decay = (period - 1) / period
+        alpha = 1 / period
+        # decay^-block_size가 float 범위를 넘지 않도록 블록 크기 제한
+        block_size = max(1, min(1024, int(150 * math.log(10) / -math.log(decay))))
+        powers = decay ** np.arange(block_size + 1)
+        inverse_powers = 1 / powers[:-1]
+
+        result = np.empty(len(values))
+        previous = seed
+        for start in range(0, len(values), block_size):
+            block = values[start:start + block_size]
+            size = len(block)
+            weighted = np.cumsum(block * inverse_powers[:size])
+            smoothed = powers[1:size + 1] * previous + alpha * powers[:size] * weighted
+            result[start:start + size] = smoothed
+            previous = smoothed[-1]
+        return result
+
+    @staticmethod
+    def _validate_period(period: int):
+        if period < 1:
+            raise ValueError(f"period는 1 이상이어야 합니다. 현재 값: {period}")
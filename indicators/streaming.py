@@ -0,0 +1,166 @@
+from collections import deque
+
+from common.schema import OHLC
+
+
+class StreamingSMA:
+    """봉이 들어올 때마다 O(1)로 갱신되는 단순 이동평균"""
+
+    def __init__(self, period: int, field: str = "close"):
+        if period < 1:
+            raise ValueError(f"period는 1 이상이어야 합니다. 현재 값: {period}")
+        self.period = period
+        self.field = field
+        self._window: deque[float] = deque()
+        self._sum = 0.0
+
+    @property
+    def value(self) -> float | None:
+        if len(self._window) < self.period:
+            return None
+        return self._sum / self.period
+
+    def update(self, bar: OHLC) -> float | None:
+        price = getattr(bar, self.field)
+        self._window.append(price)
+        self._sum += price
+        if len(self._window) > self.period:
+            self._sum -= self._window.popleft()
+        return self.value
+
+    def snapshot(self) -> dict:
+        return {"period": self.period, "field": self.field, "window": list(self._window)}
+
+    def restore(self, state: dict):
+        self.period = state["period"]
+        self.field = state["field"]
+        self._window = deque(state["window"])
+        self._sum = sum(self._window)
+
+
+class StreamingATR:
+    """Wilder ATR (터틀의 N) - 이전 값을 이어받아 봉당 O(1)로 갱신
+
+    period+1개 봉이 들어오면 첫 period개 True Range 평균으로 시작하며,
+    RollingIndicator.atr의 같은 위치 값과 일치한다.
+    """
+
+    def __init__(self, period: int):
+        if period < 1:
+            raise ValueError(f"period는 1 이상이어야 합니다. 현재 값: {period}")
+        self.period = period
+        self._prev_close: float | None = None
+        self._warmup_count = 0
+        self._warmup_sum = 0.0
+        self._atr: float | None = None
+
+    @property
+    def value(self) -> float | None:
+        return self._atr
+
+    def update(self, bar: OHLC) -> float | None:
+        prev_close = self._prev_close
+        self._prev_close = bar.close
+        if prev_close is None:
+            return None
+
+        true_range = max(bar.high - bar.low, abs(bar.high - prev_close), abs(bar.low - prev_close))
+
+        if self._atr is not None:
+            self._atr = ((self.period - 1) * self._atr + true_range) / self.period
+        else:
+            self._warmup_count += 1
+            self._warmup_sum += true_range
+            if self._warmup_count == self.period:
+                self._atr = self._warmup_sum / self.period
+        return self._atr
+
+    def snapshot(self) -> dict:
+        return {
+            "period": self.period,
+            "prev_close": self._prev_close,
+            "warmup_count": self._warmup_count,
+            "warmup_sum": self._warmup_sum,
+            "atr": self._atr,
+        }
+
+    def restore(self, state: dict):
+        self.period = state["period"]
+        self._prev_close = state["prev_close"]
+        self._warmup_count = state["warmup_count"]
+        self._warmup_sum = state["warmup_sum"]
+        self._atr = state["atr"]
+
+
+class StreamingDonchian:
+    """period 구간 최고/최저값 - 단조 deque로 봉당 amortized O(1)
+
+    기본은 고가/저가 채널이며, 터틀 전략처럼 종가 기준이 필요하면 upper_field/lower_field를 "close"로 지정한다.
+    """
+
+    def __init__(self, period: int, upper_field: str = "high", lower_field: str = "low"):
+        if period < 1:
+            raise ValueError(f"period는 1 이상이어야 합니다. 현재 값: {period}")
+        self.period = period
+        self.upper_field = upper_field
+        self.lower_field = lower_field
+        self._index = 0
+        self._maxima: deque[tuple[int, float]] = deque()  # 값 내림차순
+        self._minima: deque[tuple[int, float]] = deque()  # 값 오름차순
+
+    @property
+    def ready(self) -> bool:
+        return self._index >= self.period
+
+    @property
+    def upper(self) -> float | None:
+        return self._maxima[0][1] if self.ready else None
+
+    @property
+    def lower(self) -> float | None:
+        return self._minima[0][1] if self.ready else None
+
+    @property
+    def value(self) -> tuple[float, float] | None:
+        if not self.ready:
+            return None
+        return self._maxima[0][1], self._minima[0][1]
+
+    def update(self, bar: OHLC) -> tuple[float, float] | None:
+        upper = getattr(bar, self.upper_field)
+        lower = getattr(bar, self.lower_field)
+        index = self._index
+        self._index += 1
+
+        while self._maxima and self._maxima[-1][1] <= upper:
+            self._maxima.pop()
+        self._maxima.append((index, upper))
+        while self._minima and self._minima[-1][1] >= lower:
+            self._minima.pop()
+        self._minima.append((index, lower))
+
+        expired = index - self.period
+        if self._maxima[0][0] <= expired:
+            self._maxima.popleft()
+        if self._minima[0][0] <= expired:
+            self._minima.popleft()
+
+        return self.value
+
+    def snapshot(self) -> dict:
+        return {
+            "period": self.period,
+            "upper_field": self.upper_field,
+            "lower_field": self.lower_field,
+            "index": self._index,
+            "maxima": [list(item) for item in self._maxima],
+            "minima": [list(item) for item in self._minima],
+        }
+
+    def restore(self, state: dict):
+        self.period = state["period"]
+        self.upper_field = state["upper_field"]
+        self.lower_field = state["lower_field"]
+        self._index = state["index"]
+        self._maxima = deque(tuple(item) for item in state["maxima"])
+        self._minima = deque(tuple(item) for item in state["minima"])
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from common.schema import OHLC
+from common.ohlc_frame import OHLCFrame
 from typing import Any
 
 class ExchangeInterface(ABC):
@@ -10,9 +11,18 @@ class ExchangeInterface(ABC):
         """캔들 데이터 조회 (과거→최신 순서)"""
         pass
 
+    def candles_frame(self, market: str, count: int) -> OHLCFrame:
+        """캔들 데이터를 배열 형태로 조회 (과거→최신 순서)"""
+        return OHLCFrame.from_ohlcs(self.candles(market, count))
+
+    @abstractmethod
+    def current_price(self, market: str, fresh: bool = False) -> float:
+        """현재가 조회 - fresh=True면 캐시된 가격을 쓰지 않음 (손절 판단 등)"""
+        pass
+
     @abstractmethod
-    def current_price(self, market: str) -> float:
-        """현재가 조회"""
+    def current_prices(self, markets: list[str], fresh: bool = False) -> dict[str, float]:
+        """여러 마켓 현재가 일괄 조회"""
         pass
 
     @abstractmethod
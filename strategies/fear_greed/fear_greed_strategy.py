@@ -1,7 +1,24 @@
-import fear_and_greed
-from fear_and_greed import FearGreedIndex
+import numpy as np
+
+from strategies.sentiment.constants import FEAR_GREED_EXTREME_GREED
+from strategies.sentiment.enums import SentimentSource
+from strategies.sentiment.feed import SentimentFeed, default_cache_path
+from strategies.sentiment.providers import FearGreedProvider
+from strategies.sentiment.schema import SentimentReading
+from strategies.sentiment.series import SentimentSeries, regime_mask
 
 
 class FeatGreedStrategy():
-    def index(self) -> FearGreedIndex:
-        return fear_and_greed.get()
+    def __init__(self, feed: SentimentFeed | None = None):
+        """feed를 주지 않으면 CNN 조회 결과를 로컬 파일에 캐시하는 기본 피드 사용"""
+        self.feed = feed or SentimentFeed(FearGreedProvider(), cache_path=default_cache_path(SentimentSource.FEAR_GREED))
+
+    def index(self) -> SentimentReading:
+        return self.feed.latest()
+
+    def history(self) -> SentimentSeries:
+        return self.feed.history()
+
+    def entry_mask(self, dates, lower: float | None = None, upper: float | None = FEAR_GREED_EXTREME_GREED) -> np.ndarray:
+        """lower <= 지수 < upper 인 날짜만 진입 허용 (이력이 없는 날짜는 허용)"""
+        return regime_mask(self.history(), dates, lower=lower, upper=upper, missing=True)
@@ -0,0 +1,25 @@
+import os
+
+from strategies.sentiment.enums import SentimentSource
+
+# 최신값 캐시 유지 시간(초) - 두 지수 모두 하루에 몇 번 이상 바뀌지 않는다
+SENTIMENT_TTLS = {
+    SentimentSource.VIX: 15 * 60,
+    SentimentSource.FEAR_GREED: 60 * 60,
+}
+SENTIMENT_HISTORY_TTL = 6 * 60 * 60 # 일봉 이력 캐시 유지 시간(초)
+SENTIMENT_HISTORY_DAYS = 365 * 5 # 이력 조회 기간(일)
+SENTIMENT_PREFETCH_RATIO = 0.8 # TTL의 80%가 지나면 백그라운드에서 미리 갱신
+SENTIMENT_MIN_REFRESH_INTERVAL = 1.0 # 백그라운드 갱신 주기 하한(초)
+
+SENTIMENT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "assetmanagement", "sentiment")
+
+VIX_SYMBOL = "^VIX"
+FEAR_GREED_URL = "https://production.dataviz.cnn.io/index/fearandgreed/graphdata"
+FEAR_GREED_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+FEAR_GREED_TIMEOUT = 10
+
+# 레짐 필터 기준값
+VIX_HIGH = 30 # 공포 구간
+FEAR_GREED_EXTREME_FEAR = 25
+FEAR_GREED_EXTREME_GREED = 75
@@ -0,0 +1,6 @@
+from enum import StrEnum
+
+
+class SentimentSource(StrEnum):
+    VIX = "vix"
+    FEAR_GREED = "fear_greed"
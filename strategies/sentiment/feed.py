@@ -0,0 +1,238 @@
+import json
+import os
+import threading
+import time
+
+from strategies.sentiment.constants import (
+    SENTIMENT_CACHE_DIR,
+    SENTIMENT_HISTORY_DAYS,
+    SENTIMENT_HISTORY_TTL,
+    SENTIMENT_MIN_REFRESH_INTERVAL,
+    SENTIMENT_PREFETCH_RATIO,
+    SENTIMENT_TTLS,
+)
+from strategies.sentiment.enums import SentimentSource
+from strategies.sentiment.providers import SentimentProvider
+from strategies.sentiment.schema import SentimentReading
+from strategies.sentiment.series import SentimentSeries
+
+
+def default_cache_path(source: SentimentSource) -> str:
+    return os.path.join(SENTIMENT_CACHE_DIR, f"{source}.json")
+
+
+class SentimentFeed:
+    """provider 조회 결과를 TTL 동안 재사용하는 지수 피드
+
+    - 최신값(latest)과 일별 이력(history)을 각각의 TTL로 캐시하고, 동시에 만료되면 한 번만 조회
+    - cache_path를 주면 조회할 때마다 파일에 저장하고 생성 시 불러오므로 재시작해도 TTL이 유지된다
+    - 조회에 실패하면 만료된 값이라도 있으면 그 값을 돌려주고 last_error에 남긴다
+    - start()하면 백그라운드 스레드가 TTL이 끝나기 전에 미리 갱신해 호출 쪽은 기다리지 않는다
+    최신값을 받을 때마다 이력에도 그날 값으로 반영한다.
+    """
+
+    def __init__(
+        self,
+        provider: SentimentProvider,
+        ttl: float | None = None,
+        history_ttl: float = SENTIMENT_HISTORY_TTL,
+        history_days: int = SENTIMENT_HISTORY_DAYS,
+        cache_path: str | None = None,
+    ):
+        self.provider = provider
+        self.ttl = SENTIMENT_TTLS[provider.source] if ttl is None else ttl
+        self.history_ttl = history_ttl
+        self.history_days = history_days
+        self.cache_path = cache_path
+        self.last_error: Exception | None = None
+
+        self._reading: SentimentReading | None = None
+        self._reading_at = 0.0
+        self._history = SentimentSeries.empty()
+        self._history_at = 0.0
+        self._lock = threading.Lock()
+        self._latest_lock = threading.Lock()
+        self._history_lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._stats = {"hits": 0, "loads": 0, "errors": 0, "stale_served": 0}
+        self._thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
+
+        if cache_path is not None:
+            self._load_cache()
+
+    @property
+    def source(self) -> SentimentSource:
+        return self.provider.source
+
+    @property
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def latest(self, max_age: float | None = None) -> SentimentReading:
+        max_age = self.ttl if max_age is None else max_age
+        reading = self._fresh_reading(max_age)
+        if reading is not None:
+            return reading
+
+        with self._latest_lock:
+            # 기다리는 동안 다른 스레드가 불러왔으면 그 값을 사용
+            reading = self._fresh_reading(max_age)
+            if reading is not None:
+                return reading
+            try:
+                return self._refresh_latest()
+            except Exception as e:
+                return self._stale(self._reading, e)
+
+    def value(self, max_age: float | None = None) -> float:
+        return self.latest(max_age).value
+
+    def history(self, max_age: float | None = None) -> SentimentSeries:
+        max_age = self.history_ttl if max_age is None else max_age
+        history = self._fresh_history(max_age)
+        if history is not None:
+            return history
+
+        with self._history_lock:
+            history = self._fresh_history(max_age)
+            if history is not None:
+                return history
+            try:
+                return self._refresh_history()
+            except Exception as e:
+                return self._stale(self._history if len(self._history) else None, e)
+
+    def refresh(self) -> SentimentReading:
+        """TTL과 관계없이 최신값 다시 조회"""
+        with self._latest_lock:
+            return self._refresh_latest()
+
+    def refresh_history(self) -> SentimentSeries:
+        with self._history_lock:
+            return self._refresh_history()
+
+    def prefetch(self):
+        """TTL의 SENTIMENT_PREFETCH_RATIO가 지난 값만 미리 갱신"""
+        now = time.time()
+        if self._reading is None or now - self._reading_at >= self.ttl * SENTIMENT_PREFETCH_RATIO:
+            self.refresh()
+        if not len(self._history) or now - self._history_at >= self.history_ttl * SENTIMENT_PREFETCH_RATIO:
+            self.refresh_history()
+
+    def start(self) -> "SentimentFeed":
+        if self._thread is not None and self._thread.is_alive():
+            return self
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name=f"sentiment-feed-{self.source}", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float | None = 5.0):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._thread = None
+
+    def __enter__(self) -> "SentimentFeed":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def _run(self):
+        interval = max(min(self.ttl, self.history_ttl) * (1 - SENTIMENT_PREFETCH_RATIO), SENTIMENT_MIN_REFRESH_INTERVAL)
+        while True:
+            try:
+                self.prefetch()
+            except Exception as e:
+                self.last_error = e # 다음 주기에 다시 시도
+                self._count("errors")
+            if self._stop_event.wait(interval):
+                break
+
+    def _fresh_reading(self, max_age: float) -> SentimentReading | None:
+        with self._lock:
+            if self._reading is None or time.time() - self._reading_at >= max_age:
+                return None
+            self._stats["hits"] += 1
+            return self._reading
+
+    def _fresh_history(self, max_age: float) -> SentimentSeries | None:
+        with self._lock:
+            if not len(self._history) or time.time() - self._history_at >= max_age:
+                return None
+            self._stats["hits"] += 1
+            return self._history
+
+    def _refresh_latest(self) -> SentimentReading:
+        reading = self.provider.latest()
+        today = SentimentSeries([reading.last_update.date()], [reading.value])
+        with self._lock:
+            self._reading, self._reading_at = reading, time.time()
+            self._history = self._history.merge(today)
+            self._stats["loads"] += 1
+        self._save()
+        return reading
+
+    def _refresh_history(self) -> SentimentSeries:
+        history = self.provider.history(self.history_days)
+        with self._lock:
+            # 이력 조회에 아직 반영되지 않은 최신값은 유지
+            self._history = self._history.merge(history).tail(self.history_days)
+            self._history_at = time.time()
+            self._stats["loads"] += 1
+            history = self._history
+        self._save()
+        return history
+
+    def _stale(self, cached, error: Exception):
+        self.last_error = error
+        if cached is None:
+            self._count("errors")
+            raise error
+        with self._lock:
+            self._stats["errors"] += 1
+            self._stats["stale_served"] += 1
+        return cached
+
+    def _count(self, key: str):
+        with self._lock:
+            self._stats[key] += 1
+
+    def _save(self):
+        if self.cache_path is None:
+            return
+        with self._lock:
+            state = {
+                "source": str(self.source),
+                "reading": self._reading.model_dump(mode="json") if self._reading is not None else None,
+                "reading_at": self._reading_at,
+                "history": self._history.to_dict(),
+                "history_at": self._history_at,
+            }
+
+        temp_path = f"{self.cache_path}.tmp"
+        with self._save_lock:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(state, file)
+            os.replace(temp_path, self.cache_path)
+
+    def _load_cache(self):
+        try:
+            with open(self.cache_path, encoding="utf-8") as file:
+                state = json.load(file)
+            if state["source"] != self.source:
+                return
+            reading = SentimentReading(**state["reading"]) if state["reading"] is not None else None
+            history = SentimentSeries.from_dict(state["history"])
+        except FileNotFoundError:
+            return
+        except (ValueError, KeyError, TypeError) as e:
+            self.last_error = e # 손상된 캐시는 무시하고 다시 조회
+            return
+
+        self._reading, self._reading_at = reading, float(state["reading_at"])
+        self._history, self._history_at = history, float(state["history_at"])
@@ -0,0 +1,132 @@
+import json
+from abc import ABC, abstractmethod
+from datetime import date, datetime, time, timedelta, timezone
+
+import numpy as np
+
+from strategies.sentiment.constants import (
+    FEAR_GREED_TIMEOUT,
+    FEAR_GREED_URL,
+    FEAR_GREED_USER_AGENT,
+    VIX_SYMBOL,
+)
+from strategies.sentiment.enums import SentimentSource
+from strategies.sentiment.schema import SentimentReading
+from strategies.sentiment.series import SentimentSeries
+
+
+class SentimentProvider(ABC):
+    """지수 데이터 조회 추상화 - 네트워크 조회만 담당하고 캐시는 SentimentFeed가 맡는다"""
+    source: SentimentSource
+
+    @abstractmethod
+    def latest(self) -> SentimentReading:
+        """최신값 조회"""
+        pass
+
+    @abstractmethod
+    def history(self, days: int) -> SentimentSeries:
+        """최근 days일 일별 이력 조회 (과거→최신 순서)"""
+        pass
+
+
+class YFinanceVIXProvider(SentimentProvider):
+    source = SentimentSource.VIX
+
+    def __init__(self, symbol: str = VIX_SYMBOL):
+        self.symbol = symbol
+
+    def latest(self) -> SentimentReading:
+        # 주말/휴장일에도 마지막 거래일 종가를 받도록 며칠 범위로 조회
+        data = self._ticker().history(period="5d")
+        if data.empty:
+            raise Exception('VIX 데이터를 가져오는데 실패 했습니다.')
+        return SentimentReading(
+            source=self.source,
+            value=float(data["Close"].iloc[-1]),
+            last_update=data.index[-1].to_pydatetime(),
+        )
+
+    def history(self, days: int) -> SentimentSeries:
+        # period는 1d,5d,1mo,...,max만 허용되므로 시작일로 조회
+        data = self._ticker().history(start=(date.today() - timedelta(days=days)).isoformat())
+        return SentimentSeries(
+            data.index.strftime("%Y-%m-%d").to_numpy(),
+            data["Close"].to_numpy(dtype=np.float64),
+        )
+
+    def _ticker(self):
+        import yfinance # pandas까지 불러오므로 실제 조회할 때만 import
+
+        return yfinance.Ticker(self.symbol)
+
+
+class FearGreedProvider(SentimentProvider):
+    """CNN 공포탐욕 지수 - 최신값은 fear_and_greed 패키지, 이력은 같은 CNN 엔드포인트에서 조회"""
+    source = SentimentSource.FEAR_GREED
+
+    def latest(self) -> SentimentReading:
+        import fear_and_greed # 실제 조회할 때만 import
+
+        index = fear_and_greed.get()
+        return SentimentReading(
+            source=self.source,
+            value=float(index.value),
+            description=index.description,
+            last_update=index.last_update,
+        )
+
+    def history(self, days: int) -> SentimentSeries:
+        import requests
+
+        start = date.today() - timedelta(days=days)
+        response = requests.get(
+            f"{FEAR_GREED_URL}/{start.isoformat()}",
+            headers={"User-Agent": FEAR_GREED_USER_AGENT},
+            timeout=FEAR_GREED_TIMEOUT,
+        )
+        response.raise_for_status()
+
+        points = response.json()["fear_and_greed_historical"]["data"]
+        by_date = {}
+        for point in points: # 하루에 여러 값이 있으면 마지막 값 사용
+            trade_date = datetime.fromtimestamp(point["x"] / 1000, tz=timezone.utc).date()
+            by_date[trade_date] = float(point["y"])
+        dates = sorted(by_date)
+        return SentimentSeries(dates, [by_date[trade_date] for trade_date in dates])
+
+
+class FixtureProvider(SentimentProvider):
+    """고정 이력을 돌려주는 오프라인 provider (테스트/백테스트용)
+
+    latest()는 이력의 마지막 값이며, calls로 조회 횟수를 확인할 수 있다.
+    """
+
+    def __init__(self, source: SentimentSource, series: SentimentSeries, description: str = ""):
+        self.source = source
+        self.series = series
+        self.description = description
+        self.calls = 0
+
+    @classmethod
+    def from_file(cls, source: SentimentSource, path: str) -> "FixtureProvider":
+        """SentimentSeries.to_dict() 형식 JSON 파일"""
+        with open(path, encoding="utf-8") as file:
+            return cls(source, SentimentSeries.from_dict(json.load(file)))
+
+    def latest(self) -> SentimentReading:
+        self.calls += 1
+        latest = self.series.latest
+        if latest is None:
+            raise Exception(f'{self.source} 데이터가 없습니다.')
+        trade_date, value = latest
+        return SentimentReading(
+            source=self.source,
+            value=value,
+            description=self.description,
+            last_update=datetime.combine(trade_date, time(), tzinfo=timezone.utc),
+        )
+
+    def history(self, days: int) -> SentimentSeries:
+        self.calls += 1
+        return self.series.tail(days)
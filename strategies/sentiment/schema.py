@@ -0,0 +1,13 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+from strategies.sentiment.enums import SentimentSource
+
+
+class SentimentReading(BaseModel):
+    """지수 최신값 (fear_and_greed.FearGreedIndex와 같은 value/description/last_update 필드)"""
+    source: SentimentSource
+    value: float
+    description: str = Field(default="", description="등급 (예: fear, greed)")
+    last_update: datetime = Field(description="데이터 기준 시각")
@@ -0,0 +1,107 @@
+from datetime import date
+
+import numpy as np
+
+
+class SentimentSeries:
+    """일별 지수 이력을 dates/values 연속 배열로 보관 (과거→최신 순서, 날짜 중복 없음)"""
+    __slots__ = ("dates", "values")
+
+    def __init__(self, dates, values):
+        self.dates = np.asarray(dates, dtype="datetime64[D]")
+        self.values = np.asarray(values, dtype=np.float64)
+
+        if len(self.dates) != len(self.values):
+            raise ValueError("dates, values 배열 길이가 동일하지 않습니다.")
+        if len(self.dates) > 1 and not (self.dates[1:] > self.dates[:-1]).all():
+            raise ValueError("dates는 중복 없이 오름차순이어야 합니다.")
+
+    @classmethod
+    def empty(cls) -> "SentimentSeries":
+        return cls([], [])
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SentimentSeries":
+        return cls(data["dates"], data["values"])
+
+    def to_dict(self) -> dict:
+        return {"dates": self.dates.astype(str).tolist(), "values": self.values.tolist()}
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    @property
+    def latest(self) -> tuple[date, float] | None:
+        if not len(self):
+            return None
+        return self.dates[-1].item(), float(self.values[-1])
+
+    def tail(self, days: int) -> "SentimentSeries":
+        """마지막 날짜 기준 최근 days일 구간"""
+        if not len(self):
+            return self
+        start = self.dates[-1] - np.timedelta64(days - 1, "D")
+        index = int(np.searchsorted(self.dates, start))
+        return SentimentSeries(self.dates[index:], self.values[index:])
+
+    def merge(self, other: "SentimentSeries") -> "SentimentSeries":
+        """두 이력을 합친 새 이력 - 같은 날짜는 other 값을 사용"""
+        if not len(other):
+            return self
+        if not len(self):
+            return other
+
+        dates = np.concatenate([self.dates, other.dates])
+        values = np.concatenate([self.values, other.values])
+        order = np.argsort(dates, kind="stable")
+        dates, values = dates[order], values[order]
+        last_of_day = np.append(dates[1:] != dates[:-1], True)
+        return SentimentSeries(dates[last_of_day], values[last_of_day])
+
+    def align(self, dates, max_gap_days: int | None = None) -> np.ndarray:
+        """주어진 날짜 배열에 맞춘 값 (그 날짜 이전 마지막 값, 없으면 NaN)
+
+        VIX는 주말/휴장일 값이 없으므로 매일 거래되는 암호화폐 일봉에는 직전 값을 이어 쓴다.
+        max_gap_days를 넘게 오래된 값은 NaN으로 둔다.
+        """
+        dates = np.asarray(dates, dtype="datetime64[D]")
+        if not len(self):
+            return np.full(len(dates), np.nan)
+
+        index = np.searchsorted(self.dates, dates, side="right") - 1
+        missing = index < 0
+        index = np.maximum(index, 0)
+        aligned = self.values[index]
+        if max_gap_days is not None:
+            missing |= (dates - self.dates[index]) > np.timedelta64(max_gap_days, "D")
+        aligned[missing] = np.nan
+        return aligned
+
+    def __repr__(self) -> str:
+        if not len(self):
+            return "SentimentSeries(0 days)"
+        return f"SentimentSeries({len(self)} days, {self.dates[0]} ~ {self.dates[-1]})"
+
+
+def regime_mask(
+    series: SentimentSeries,
+    dates,
+    lower: float | None = None,
+    upper: float | None = None,
+    max_gap_days: int | None = None,
+    missing: bool = False,
+) -> np.ndarray:
+    """lower <= 지수 < upper 인 날짜 (TurtleBacktester.run의 entry_mask로 사용)
+
+    예) VIX가 공포 구간이 아닐 때만 진입: regime_mask(vix_history, frame.trade_date, upper=VIX_HIGH)
+    지수 값이 없는 날짜는 missing으로 채운다.
+    """
+    values = series.align(dates, max_gap_days)
+    mask = np.ones(len(values), dtype=bool)
+    with np.errstate(invalid="ignore"):
+        if lower is not None:
+            mask &= values >= lower
+        if upper is not None:
+            mask &= values < upper
+    mask[np.isnan(values)] = missing
+    return mask
@@ -0,0 +1,259 @@
+import math
+
+import numpy as np
+
+from common.ohlc_frame import OHLCFrame
+from indicators.rolling import RollingIndicator
+from strategies.turtle.constants import (
+    MAX_POSITION_UNIT,
+    PYRAMID_N_MULTIPLIER,
+    STOP_LOSS_N_MULTIPLIER,
+    L1_BASE_BUY_PERIOD,
+    L2_BASE_BUY_PERIOD,
+    L1_BASE_SELL_PERIOD,
+    L2_BASE_SELL_PERIOD,
+    N_PERIOD,
+    SPOT_UNIT_RATIO,
+)
+from strategies.turtle.enums import ExitReason, TurtleSystemType
+from strategies.turtle.schema import BacktestResult, BacktestStats, BacktestTrade
+
+TRADING_DAYS_PER_YEAR = 365 # 암호화폐는 휴장일 없음
+
+
+class TurtleBacktester:
+    """터틀 규칙을 전체 캔들 이력에 적용하는 백테스트 엔진
+
+    TurtleStrategy와 같은 판단을 봉 마감 시점 종가로 내린다.
+    - 진입: 종가 > 직전 매수 기간 최고 종가
+    - 피라미딩: 종가 >= 마지막 진입가 + pyramid_n_multiplier × N (봉당 1유닛, 최대 max_position_unit)
+    - 청산: 종가 < 직전 매도 기간 최저 종가, 또는 종가 < 마지막 진입가 - stop_loss_n_multiplier × N
+    N은 진입 시점의 Wilder ATR을 사용한다. 지표는 numpy로 한 번에 계산하고,
+    이벤트(진입/추가매수/청산) 사이 구간은 배열 비교로 건너뛰므로 봉마다 파이썬 루프를 돌지 않는다.
+    """
+
+    def __init__(
+        self,
+        max_position_unit: float = MAX_POSITION_UNIT,
+        pyramid_n_multiplier: float = PYRAMID_N_MULTIPLIER,
+        stop_loss_n_multiplier: float = STOP_LOSS_N_MULTIPLIER,
+        system1_buy_period: int = L1_BASE_BUY_PERIOD,
+        system2_buy_period: int = L2_BASE_BUY_PERIOD,
+        system1_sell_period: int = L1_BASE_SELL_PERIOD,
+        system2_sell_period: int = L2_BASE_SELL_PERIOD,
+        entry_system: TurtleSystemType = TurtleSystemType.ONE,
+        initial_capital: float = 100_000_000,
+        unit_ratio: float = SPOT_UNIT_RATIO,
+        fee_rate: float = 0.0,
+        n_period: int = N_PERIOD,
+    ):
+        self.max_position_unit = max_position_unit
+        self.pyramid_n_multiplier = pyramid_n_multiplier
+        self.stop_loss_n_multiplier = stop_loss_n_multiplier
+        self.system1_buy_period = system1_buy_period
+        self.system2_buy_period = system2_buy_period
+        self.system1_sell_period = system1_sell_period
+        self.system2_sell_period = system2_sell_period
+        self.entry_system = entry_system
+        self.initial_capital = initial_capital
+        self.unit_ratio = unit_ratio
+        self.fee_rate = fee_rate
+        self.n_period = n_period
+
+    def run(self, frame: OHLCFrame, entry_mask: np.ndarray | None = None) -> BacktestResult:
+        """entry_mask: 신규 진입을 허용할 봉 (예: VIX/공포탐욕 지수 레짐 필터)"""
+        if self.entry_system == TurtleSystemType.ONE:
+            buy_period, sell_period = self.system1_buy_period, self.system1_sell_period
+        else:
+            buy_period, sell_period = self.system2_buy_period, self.system2_sell_period
+
+        close = frame.close
+        count = len(frame)
+
+        # t번째 봉의 판단 기준은 t-1번째 봉까지의 데이터
+        breakout = _shift(RollingIndicator.rolling_max(close, buy_period))
+        exit_level = _shift(RollingIndicator.rolling_min(close, sell_period))
+        n_values = _shift(RollingIndicator.atr(frame.high, frame.low, close, self.n_period))
+
+        with np.errstate(invalid="ignore"):
+            entry_signal = (close > breakout) & (n_values > 0) & ~np.isnan(exit_level)
+        if entry_mask is not None:
+            entry_signal &= np.asarray(entry_mask, dtype=bool)
+        next_entry = _next_true_index(entry_signal)
+
+        fee_rate = self.fee_rate
+        cash = float(self.initial_capital)
+        quantity = 0.0
+        trades: list[BacktestTrade] = []
+        events: list[tuple[int, float, float]] = [] # (봉 인덱스, 이벤트 후 현금, 이벤트 후 수량)
+        bars_in_position = 0
+
+        t = 0
+        while t < count:
+            t = int(next_entry[t])
+            if t >= count:
+                break
+
+            # 신규 진입
+            entry_index = t
+            n_value = float(n_values[t])
+            unit_value = (cash + quantity * close[t]) * self.unit_ratio
+            last_price = float(close[t])
+            units = 0
+            cost = 0.0
+            bought = self._buy(cash, unit_value, last_price)
+            if bought is None:
+                t += 1
+                continue
+            cash, bought_quantity, spent = bought
+            quantity += bought_quantity
+            cost += spent
+            units += 1
+            events.append((t, cash, quantity))
+
+            exit_reason = ExitReason.END
+            exit_index = count - 1
+            t += 1
+            while t < count:
+                stop_price = last_price - self.stop_loss_n_multiplier * n_value
+                pyramid_price = (
+                    last_price + self.pyramid_n_multiplier * n_value
+                    if units < self.max_position_unit else math.inf
+                )
+                t = _find_next(close, exit_level, stop_price, pyramid_price, t)
+                if t >= count:
+                    break
+
+                price = float(close[t])
+                if price < exit_level[t] or price < stop_price: # TurtleStrategy.sell과 같이 청산 우선
+                    exit_reason = ExitReason.CHANNEL if price < exit_level[t] else ExitReason.STOP_LOSS
+                    exit_index = t
+                    break
+
+                bought = self._buy(cash, unit_value, price)
+                if bought is not None:
+                    cash, bought_quantity, spent = bought
+                    quantity += bought_quantity
+                    cost += spent
+                    units += 1
+                    events.append((t, cash, quantity))
+                    # TurtleStrategy처럼 손절/추가매수 기준은 실제 매수한 마지막 유닛 기준
+                    last_price = price
+                    n_value = float(n_values[t])
+                t += 1
+
+            exit_price = float(close[exit_index])
+            proceeds = quantity * exit_price * (1 - fee_rate)
+            cash += proceeds
+            pnl = proceeds - cost
+            trades.append(BacktestTrade(
+                entry_date=frame.trade_date[entry_index].item(),
+                exit_date=frame.trade_date[exit_index].item(),
+                entry_price=cost / quantity,
+                exit_price=exit_price,
+                units=units,
+                quantity=quantity,
+                pnl=pnl,
+                return_rate=pnl / cost,
+                exit_reason=exit_reason,
+            ))
+            bars_in_position += exit_index - entry_index
+            quantity = 0.0
+            events.append((exit_index, cash, quantity))
+            t = exit_index + 1
+
+        equity = self._equity_curve(close, events)
+        return BacktestResult(
+            system=self.entry_system,
+            trades=trades,
+            equity=equity,
+            stats=self._stats(equity, trades, bars_in_position),
+        )
+
+    def _buy(self, cash: float, unit_value: float, price: float) -> tuple[float, float, float] | None:
+        """1유닛 매수 (현금 부족 시 남은 현금만큼) -> (남은 현금, 매수 수량, 수수료 포함 지출)"""
+        spend = min(unit_value, cash / (1 + self.fee_rate))
+        if spend <= 0:
+            return None
+        total = spend * (1 + self.fee_rate)
+        return cash - total, spend / price, total
+
+    def _equity_curve(self, close: np.ndarray, events: list[tuple[int, float, float]]) -> np.ndarray:
+        if not events:
+            return np.full(len(close), float(self.initial_capital))
+
+        indices, cash, quantity = (np.asarray(column) for column in zip(*events))
+        # 각 봉에 그 시점까지 마지막으로 발생한 이벤트의 현금/수량 적용
+        latest = np.searchsorted(indices, np.arange(len(close)), side="right") - 1
+        started = latest >= 0
+        latest = np.maximum(latest, 0)
+        cash_series = np.where(started, cash[latest], float(self.initial_capital))
+        quantity_series = np.where(started, quantity[latest], 0.0)
+        return cash_series + quantity_series * close
+
+    def _stats(self, equity: np.ndarray, trades: list[BacktestTrade], bars_in_position: int) -> BacktestStats:
+        if len(equity) == 0:
+            return BacktestStats(
+                total_return=0.0, cagr=0.0, max_drawdown=0.0, sharpe=0.0,
+                trade_count=0, win_rate=0.0, profit_factor=0.0, exposure=0.0,
+            )
+
+        total_return = equity[-1] / self.initial_capital - 1
+        years = len(equity) / TRADING_DAYS_PER_YEAR
+        cagr = (equity[-1] / self.initial_capital) ** (1 / years) - 1 if equity[-1] > 0 else -1.0
+        drawdown = 1 - equity / np.maximum.accumulate(equity)
+
+        returns = np.diff(equity) / equity[:-1]
+        std = returns.std() if len(returns) else 0.0
+        sharpe = returns.mean() / std * math.sqrt(TRADING_DAYS_PER_YEAR) if std > 0 else 0.0
+
+        gains = sum(trade.pnl for trade in trades if trade.pnl > 0)
+        losses = -sum(trade.pnl for trade in trades if trade.pnl < 0)
+        wins = sum(1 for trade in trades if trade.pnl > 0)
+
+        return BacktestStats(
+            total_return=float(total_return),
+            cagr=float(cagr),
+            max_drawdown=float(drawdown.max()),
+            sharpe=float(sharpe),
+            trade_count=len(trades),
+            win_rate=wins / len(trades) if trades else 0.0,
+            profit_factor=gains / losses if losses > 0 else (math.inf if gains > 0 else 0.0),
+            exposure=bars_in_position / len(equity),
+        )
+
+
+def _shift(values: np.ndarray) -> np.ndarray:
+    """한 봉 뒤로 밀기 (t번째 값 = t-1번째까지의 지표)"""
+    shifted = np.empty_like(values)
+    shifted[0] = np.nan
+    shifted[1:] = values[:-1]
+    return shifted
+
+
+def _next_true_index(mask: np.ndarray) -> np.ndarray:
+    """result[t] = t 이후(포함) 첫 True 인덱스, 없으면 len(mask)"""
+    count = len(mask)
+    positions = np.where(mask, np.arange(count), count)
+    return np.minimum.accumulate(positions[::-1])[::-1]
+
+
+def _find_next(
+    close: np.ndarray,
+    exit_level: np.ndarray,
+    stop_price: float,
+    pyramid_price: float,
+    start: int,
+    chunk: int = 32,
+) -> int:
+    """start 이후 청산 또는 추가매수 조건을 만족하는 첫 봉 (구간을 늘려가며 배열 비교)"""
+    count = len(close)
+    while start < count:
+        end = min(start + chunk, count)
+        window = close[start:end]
+        hits = np.flatnonzero((window < exit_level[start:end]) | (window < stop_price) | (window >= pyramid_price))
+        if hits.size:
+            return start + int(hits[0])
+        start = end
+        chunk *= 2
+    return count
@@ -8,3 +8,17 @@ MAX_POSITION_UNIT = 5
 PYRAMID_N_MULTIPLIER = 1
 STOP_LOSS_N_MULTIPLIER = 2 
 
+N_PERIOD = 20 # N(ATR) 계산 기간
+SPOT_UNIT_RATIO = 0.02 # 현물 1유닛 = 계좌 * 2%
+
+# 포트폴리오 유닛 제한
+MAX_GROUP_UNIT = 6 # 상관관계 그룹당 최대 유닛
+MAX_TOTAL_UNIT = 12 # 전체 최대 유닛
+CORRELATION_THRESHOLD = 0.7 # 이 값 이상이면 같은 그룹
+CORRELATION_WINDOW = 60 # 상관계수 계산에 쓰는 최근 수익률 개수 (일)
+CORRELATION_MIN_PERIODS = 20 # 두 마켓이 함께 가진 수익률이 이보다 적으면 상관계수 없음
+
+# 유닛 크기 / 자금 관리
+UNIT_RISK_RATIO = 0.01 # 1유닛 리스크 = 계좌 * 1%
+DRAWDOWN_STEP = 0.1 # 계좌 10% 손실마다
+DRAWDOWN_RISK_CUT = 0.2 # 유닛 리스크 20% 축소
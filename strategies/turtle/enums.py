@@ -16,3 +16,9 @@ class BuyType(StrEnum):
 class TurtleSystemType(IntEnum):
     ONE = 1
     TWO = 2
+
+
+class ExitReason(StrEnum):
+    CHANNEL = "channel"     # 매도 기간 최저가 이탈
+    STOP_LOSS = "stop_loss" # 마지막 진입가 대비 2N 하락
+    END = "end"             # 백테스트 종료 시점 강제 청산
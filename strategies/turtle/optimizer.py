@@ -0,0 +1,135 @@
+import inspect
+import itertools
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from common.ohlc_frame import OHLCFrame
+from strategies.turtle.backtest import TurtleBacktester
+from strategies.turtle.schema import BacktestStats, SweepResult
+
+_TUNABLE_PARAMS = frozenset(inspect.signature(TurtleBacktester.__init__).parameters) - {"self"}
+
+# 워커 프로세스 전역 상태 (initializer에서 공유 메모리에 연결)
+_worker_memory: shared_memory.SharedMemory | None = None
+_worker_frame: OHLCFrame | None = None
+_worker_options: dict = {}
+
+
+class TurtleOptimizer:
+    """TurtleBacktester 파라미터 스윕을 프로세스 풀에 분산
+
+    캔들 배열은 공유 메모리에 한 번만 올리고 워커는 복사 없이 numpy view로 붙으므로,
+    작업마다 캔들을 피클링하지 않는다. 워커는 통계만 돌려준다.
+    """
+
+    def __init__(
+        self,
+        frame: OHLCFrame,
+        max_workers: int | None = None,
+        metric: str = "sharpe",
+        descending: bool = True,
+        **backtest_options,
+    ):
+        if metric not in BacktestStats.model_fields:
+            raise ValueError(f"지원하지 않는 metric입니다: {metric}")
+        self._validate_params(backtest_options)
+
+        self.frame = frame
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.metric = metric
+        self.descending = descending
+        self.backtest_options = backtest_options
+
+    def grid_search(self, grid: dict[str, list]) -> list[SweepResult]:
+        """모든 파라미터 조합 실행"""
+        names = list(grid)
+        param_sets = [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+        return self.run(param_sets)
+
+    def random_search(self, space: dict[str, list | tuple], samples: int, seed: int | None = None) -> list[SweepResult]:
+        """space 값이 리스트면 그 중 선택, (low, high) 튜플이면 구간에서 균등 추출 (정수 구간은 양 끝 포함)"""
+        rng = random.Random(seed)
+        param_sets = []
+        for _ in range(samples):
+            params = {}
+            for name, candidates in space.items():
+                if isinstance(candidates, tuple):
+                    low, high = candidates
+                    if isinstance(low, int) and isinstance(high, int):
+                        params[name] = rng.randint(low, high)
+                    else:
+                        params[name] = rng.uniform(low, high)
+                else:
+                    params[name] = rng.choice(candidates)
+            param_sets.append(params)
+        return self.run(param_sets)
+
+    def run(self, param_sets: list[dict]) -> list[SweepResult]:
+        """param_sets를 백테스트하고 metric 기준으로 정렬된 결과 반환"""
+        for params in param_sets:
+            self._validate_params(params)
+        if not param_sets:
+            return []
+
+        memory, layout = _share_frame(self.frame)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(memory.name, layout, self.backtest_options),
+            ) as executor:
+                chunksize = max(1, len(param_sets) // (self.max_workers * 4))
+                stats = list(executor.map(_run_backtest, param_sets, chunksize=chunksize))
+        finally:
+            memory.close()
+            memory.unlink()
+
+        ranked = sorted(
+            zip(param_sets, stats),
+            key=lambda item: item[1][self.metric],
+            reverse=self.descending,
+        )
+        return [
+            SweepResult(rank=rank, params=params, stats=BacktestStats(**stat))
+            for rank, (params, stat) in enumerate(ranked, start=1)
+        ]
+
+    @staticmethod
+    def _validate_params(params: dict):
+        unknown = set(params) - _TUNABLE_PARAMS
+        if unknown:
+            raise ValueError(f"TurtleBacktester에 없는 파라미터입니다: {sorted(unknown)}")
+
+
+def _share_frame(frame: OHLCFrame) -> tuple[shared_memory.SharedMemory, int]:
+    """high/low/close/trade_date를 하나의 공유 메모리 블록에 (4, n) 형태로 복사"""
+    count = len(frame)
+    memory = shared_memory.SharedMemory(create=True, size=max(4 * count * 8, 1))
+    block = np.ndarray((4, count), dtype=np.float64, buffer=memory.buf)
+    block[0] = frame.high
+    block[1] = frame.low
+    block[2] = frame.close
+    block[3].view(np.int64)[:] = frame.trade_date.astype(np.int64)
+    return memory, count
+
+
+def _init_worker(name: str, count: int, backtest_options: dict):
+    global _worker_memory, _worker_frame, _worker_options
+    _worker_memory = shared_memory.SharedMemory(name=name)
+    block = np.ndarray((4, count), dtype=np.float64, buffer=_worker_memory.buf)
+    _worker_frame = OHLCFrame(
+        high=block[0],
+        low=block[1],
+        close=block[2],
+        trade_date=block[3].view(np.int64).view("datetime64[D]"),
+    )
+    _worker_options = backtest_options
+
+
+def _run_backtest(params: dict) -> dict:
+    backtester = TurtleBacktester(**{**_worker_options, **params}) # 그리드 값이 생성자 옵션보다 우선
+    return backtester.run(_worker_frame).stats.model_dump()
@@ -0,0 +1,203 @@
+import bisect
+import json
+import os
+import threading
+from collections.abc import Iterator
+
+from strategies.turtle.schema import TurtlePosition
+
+DEFAULT_MARKET = ""  # market을 지정하지 않는 단일 마켓 사용
+
+
+class PositionJournal:
+    """add/clear를 한 줄씩 기록하는 append-only JSONL 저널 (재시작 시 replay로 복구)"""
+
+    def __init__(self, path: str, fsync: bool = False):
+        self.path = path
+        self.fsync = fsync
+        self._file = None
+        self._lock = threading.Lock()
+
+    def record_add(self, market: str, position: TurtlePosition):
+        self._write({"op": "add", "market": market, **position.model_dump()})
+
+    def record_clear(self, market: str):
+        self._write({"op": "clear", "market": market})
+
+    def replay(self) -> dict[str, list[TurtlePosition]]:
+        """저널을 처음부터 재생한 마켓별 포지션
+
+        기록 도중 종료돼 잘린 마지막 줄은 이후 기록과 섞이지 않도록 파일에서 잘라낸다.
+        """
+        positions: dict[str, list[TurtlePosition]] = {}
+        if not os.path.exists(self.path):
+            return positions
+
+        valid_size = 0
+        with open(self.path, "rb") as file:
+            for line in file:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    break
+                valid_size += len(line)
+                market = entry.pop("market")
+                if entry.pop("op") == "add":
+                    positions.setdefault(market, []).append(TurtlePosition(**entry))
+                else:
+                    positions.pop(market, None)
+
+        if valid_size < os.path.getsize(self.path):
+            with open(self.path, "r+b") as file:
+                file.truncate(valid_size)
+        return positions
+
+    def compact(self, positions: dict[str, list[TurtlePosition]]):
+        """현재 포지션만 남도록 저널을 다시 작성 (임시 파일 후 교체)"""
+        temp_path = f"{self.path}.tmp"
+        with self._lock:
+            self._close()
+            with open(temp_path, "w", encoding="utf-8") as file:
+                for market, market_positions in positions.items():
+                    for position in market_positions:
+                        file.write(json.dumps({"op": "add", "market": market, **position.model_dump()}) + "\n")
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, self.path)
+
+    def close(self):
+        with self._lock:
+            self._close()
+
+    def _write(self, entry: dict):
+        line = json.dumps(entry) + "\n"
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(line)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+
+    def _close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class PositionBook:
+    """한 마켓의 포지션을 trade_date 순서로 유지
+
+    최신/최초 포지션은 양 끝 원소라 O(1)이고, 수량/매입 금액은 추가할 때 누적한다.
+    """
+
+    def __init__(self, market: str = DEFAULT_MARKET, journal: PositionJournal | None = None):
+        self.market = market
+        self.journal = journal
+        self._positions: list[TurtlePosition] = []
+        self._dates: list[str] = []
+        self._quantity = 0
+        self._cost = 0.0
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __bool__(self) -> bool:
+        return bool(self._positions)
+
+    def __iter__(self) -> Iterator[TurtlePosition]:
+        return iter(self._positions)
+
+    def __getitem__(self, index):
+        return self._positions[index]
+
+    @property
+    def positions(self) -> list[TurtlePosition]:
+        return list(self._positions)
+
+    @property
+    def latest(self) -> TurtlePosition | None:
+        return self._positions[-1] if self._positions else None
+
+    @property
+    def earliest(self) -> TurtlePosition | None:
+        return self._positions[0] if self._positions else None
+
+    @property
+    def quantity(self) -> int:
+        return self._quantity
+
+    @property
+    def cost(self) -> float:
+        return self._cost
+
+    @property
+    def average_price(self) -> float | None:
+        return self._cost / self._quantity if self._quantity else None
+
+    def add(self, position: TurtlePosition):
+        if self.journal is not None:
+            self.journal.record_add(self.market, position)
+        self._insert(position)
+
+    def clear(self):
+        if self.journal is not None:
+            self.journal.record_clear(self.market)
+        self._reset()
+
+    def _insert(self, position: TurtlePosition):
+        # 보통 시간 순서로 추가되므로 append, 과거 날짜가 들어오면 같은 날짜 뒤에 삽입
+        if not self._dates or position.trade_date >= self._dates[-1]:
+            index = len(self._dates)
+        else:
+            index = bisect.bisect_right(self._dates, position.trade_date)
+        self._positions.insert(index, position)
+        self._dates.insert(index, position.trade_date)
+        self._quantity += position.quantity
+        self._cost += position.total_value
+
+    def _reset(self):
+        self._positions = []
+        self._dates = []
+        self._quantity = 0
+        self._cost = 0.0
+
+
+class PositionBooks:
+    """마켓별 PositionBook 모음 - 하나의 저널을 공유하며 생성 시 저널을 재생해 복구"""
+
+    def __init__(self, journal_path: str | None = None, fsync: bool = False):
+        self.journal = PositionJournal(journal_path, fsync) if journal_path else None
+        self._books: dict[str, PositionBook] = {}
+
+        if self.journal is not None:
+            for market, positions in self.journal.replay().items():
+                book = self.book(market)
+                for position in positions:
+                    book._insert(position)
+
+    def __contains__(self, market: str) -> bool:
+        return bool(self._books.get(market))
+
+    def __len__(self) -> int:
+        return len(self._books)
+
+    def book(self, market: str = DEFAULT_MARKET) -> PositionBook:
+        book = self._books.get(market)
+        if book is None:
+            book = self._books[market] = PositionBook(market, self.journal)
+        return book
+
+    def markets(self) -> list[str]:
+        """포지션을 보유 중인 마켓"""
+        return [market for market, book in self._books.items() if book]
+
+    def compact(self):
+        if self.journal is not None:
+            self.journal.compact({market: book.positions for market, book in self._books.items() if book})
+
+    def close(self):
+        if self.journal is not None:
+            self.journal.close()
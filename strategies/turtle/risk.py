@@ -0,0 +1,354 @@
+import math
+
+import numpy as np
+
+from strategies.turtle.constants import (
+    CORRELATION_MIN_PERIODS,
+    CORRELATION_THRESHOLD,
+    CORRELATION_WINDOW,
+    DRAWDOWN_RISK_CUT,
+    DRAWDOWN_STEP,
+    MAX_GROUP_UNIT,
+    MAX_POSITION_UNIT,
+    MAX_TOTAL_UNIT,
+    STOP_LOSS_N_MULTIPLIER,
+    UNIT_RISK_RATIO,
+)
+
+
+class PortfolioRiskEngine:
+    """전체 마켓의 유닛 한도와 유닛 크기를 관리하는 포트폴리오 리스크 엔진
+
+    - 유닛 한도: 마켓당 max_market_unit, 상관관계 그룹당 max_group_unit, 전체 max_total_unit
+    - 상관관계: 최근 window개 일간 로그 수익률 링 버퍼로 계산. 두 마켓이 함께 가진 수익률만 쓰도록
+      (쌍별 개수, 합, 제곱합, 곱의 합) 행렬을 수익률이 들어올 때마다 외적으로 더하고 빠지는 값은 빼서 유지한다.
+    - 그룹: 상관계수 >= correlation_threshold 인 마켓을 이은 연결 요소 (A~B, B~C면 A, B, C가 한 그룹)
+    - 유닛 크기: (계좌 × unit_risk_ratio × risk_scale) / (N × stop_loss_n_multiplier)
+    - 자금 관리: 최고 계좌 대비 drawdown_step 손실마다 유닛 리스크 drawdown_risk_cut 축소, 회복하면 원래대로
+    그룹과 그룹별 유닛 합은 수익률 갱신 시점에 미리 계산하므로 can_add_unit()은 O(1)이고,
+    can_add_units()는 여러 마켓을 한 번의 배열 비교로 판단한다.
+    """
+
+    def __init__(
+        self,
+        max_market_unit: int = MAX_POSITION_UNIT,
+        max_group_unit: int = MAX_GROUP_UNIT,
+        max_total_unit: int = MAX_TOTAL_UNIT,
+        correlation_threshold: float = CORRELATION_THRESHOLD,
+        window: int = CORRELATION_WINDOW,
+        min_periods: int = CORRELATION_MIN_PERIODS,
+        unit_risk_ratio: float = UNIT_RISK_RATIO,
+        stop_loss_n_multiplier: float = STOP_LOSS_N_MULTIPLIER,
+        drawdown_step: float = DRAWDOWN_STEP,
+        drawdown_risk_cut: float = DRAWDOWN_RISK_CUT,
+    ):
+        self.max_market_unit = max_market_unit
+        self.max_group_unit = max_group_unit
+        self.max_total_unit = max_total_unit
+        self.correlation_threshold = correlation_threshold
+        self.window = window
+        self.min_periods = min_periods
+        self.unit_risk_ratio = unit_risk_ratio
+        self.stop_loss_n_multiplier = stop_loss_n_multiplier
+        self.drawdown_step = drawdown_step
+        self.drawdown_risk_cut = drawdown_risk_cut
+
+        self.markets: list[str] = []
+        self._index: dict[str, int] = {}
+        self._capacity = 0
+        self._last_price = np.empty(0)
+        self._units = np.zeros(0, dtype=np.int64)
+        self._labels = np.zeros(0, dtype=np.int64) # 마켓 -> 그룹 번호 (그룹 내 가장 작은 인덱스)
+        self._group_units = np.zeros(0, dtype=np.int64)
+        self._total_units = 0
+
+        # 수익률 링 버퍼 (행: 날짜, 열: 마켓) - 값이 없으면 0, valid False
+        self._returns = np.zeros((window, 0))
+        self._valid = np.zeros((window, 0), dtype=bool)
+        self._head = 0
+        self._rows = 0
+        self._pushes_since_rebuild = 0
+
+        # 쌍별 누적 합: [i, j]는 i, j 모두 값이 있는 날짜에 대한 합
+        self._pair_count = np.zeros((0, 0))
+        self._pair_sum = np.zeros((0, 0)) # x_i의 합
+        self._pair_sumsq = np.zeros((0, 0)) # x_i 제곱의 합
+        self._cross = np.zeros((0, 0)) # x_i * x_j의 합
+
+        self._peak_equity: float | None = None
+        self._risk_scale = 1.0
+
+    # 상관관계
+
+    def update_prices(self, prices: dict[str, float]):
+        """마감 종가로 일간 수익률 한 행 추가 (하루 한 번, 처음 보는 마켓은 다음 날부터 수익률 반영)"""
+        size_before = len(self.markets)
+        rows = np.fromiter((self._row(market) for market in prices), dtype=np.int64, count=len(prices))
+        price_array = np.fromiter(prices.values(), dtype=np.float64, count=len(prices))
+
+        previous = self._last_price[rows]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            returns = np.log(price_array / previous)
+        valid = np.isfinite(returns) & (rows < size_before)
+        self._last_price[rows] = np.where(price_array > 0, price_array, self._last_price[rows])
+        self._push_sparse(rows[valid], returns[valid])
+
+    def update_returns(self, returns: dict[str, float]):
+        """일간 수익률 한 행 추가 (없는 마켓은 그날 값 없음)"""
+        rows = np.fromiter((self._row(market) for market in returns), dtype=np.int64, count=len(returns))
+        values = np.fromiter(returns.values(), dtype=np.float64, count=len(returns))
+        valid = np.isfinite(values)
+        self._push_sparse(rows[valid], values[valid])
+
+    def load_closes(self, markets: list[str], closes: np.ndarray):
+        """종가 행렬(날짜 × markets, 과거→최신, 값 없으면 NaN)로 수익률 버퍼를 한 번에 채움"""
+        closes = np.asarray(closes, dtype=np.float64)
+        rows = np.array([self._row(market) for market in markets], dtype=np.int64)
+
+        # update_prices와 같이 값이 빠진 날 다음 수익률은 마지막 종가 기준
+        latest = np.where(np.isfinite(closes), np.arange(len(closes))[:, np.newaxis], 0)
+        filled = np.take_along_axis(closes, np.maximum.accumulate(latest, axis=0), axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            returns = np.log(closes[1:] / filled[:-1])[-self.window:]
+
+        size = len(self.markets)
+        for day_returns in returns:
+            valid = np.isfinite(day_returns)
+            x = np.zeros(size)
+            x[rows[valid]] = day_returns[valid]
+            v = np.zeros(size, dtype=bool)
+            v[rows[valid]] = True
+            self._write_row(x, v)
+
+        for column, row in enumerate(rows):
+            finite = closes[:, column][np.isfinite(closes[:, column])]
+            if len(finite):
+                self._last_price[row] = finite[-1]
+        self._rebuild()
+        self._regroup()
+
+    def correlation(self, markets: list[str] | None = None) -> np.ndarray:
+        """상관계수 행렬 (함께 가진 수익률이 min_periods 미만이면 NaN)"""
+        matrix = self._correlation_matrix()
+        if markets is None:
+            return matrix
+        rows = [self._index[market] for market in markets]
+        return matrix[np.ix_(rows, rows)]
+
+    def group(self, market: str) -> list[str]:
+        """market과 같은 상관관계 그룹의 마켓 (자신 포함)"""
+        row = self._index.get(market)
+        if row is None:
+            return [market]
+        members = np.flatnonzero(self._labels[:len(self.markets)] == self._labels[row])
+        return [self.markets[member] for member in members]
+
+    def groups(self) -> list[list[str]]:
+        """두 개 이상 마켓으로 이루어진 그룹"""
+        labels = self._labels[:len(self.markets)]
+        result = []
+        for label in np.unique(labels):
+            members = np.flatnonzero(labels == label)
+            if len(members) > 1:
+                result.append([self.markets[member] for member in members])
+        return result
+
+    # 유닛 한도
+
+    @property
+    def total_units(self) -> int:
+        return self._total_units
+
+    def units(self, market: str) -> int:
+        row = self._index.get(market)
+        return int(self._units[row]) if row is not None else 0
+
+    def group_units(self, market: str) -> int:
+        row = self._index.get(market)
+        return int(self._group_units[self._labels[row]]) if row is not None else 0
+
+    def set_units(self, market: str, units: int):
+        """보유 유닛 수 동기화 (재시작 후 포지션 복구 등)"""
+        self.add_unit(market, units - self.units(market))
+
+    def add_unit(self, market: str, count: int = 1):
+        row = self._row(market)
+        self._units[row] += count
+        self._group_units[self._labels[row]] += count
+        self._total_units += count
+
+    def clear_units(self, market: str):
+        self.set_units(market, 0)
+
+    def can_add_unit(self, market: str) -> bool:
+        if self._total_units >= self.max_total_unit:
+            return False
+        row = self._index.get(market)
+        if row is None:
+            return self.max_market_unit > 0 and self.max_group_unit > 0
+        return (
+            self._units[row] < self.max_market_unit
+            and self._group_units[self._labels[row]] < self.max_group_unit
+        )
+
+    def can_add_units(self, markets: list[str]) -> np.ndarray:
+        """마켓별로 지금 1유닛을 추가할 수 있는지 (각각 독립적으로 판단)"""
+        index = self._index
+        rows = np.fromiter((index.get(market, -1) for market in markets), dtype=np.int64, count=len(markets))
+        if self._total_units >= self.max_total_unit:
+            return np.zeros(len(markets), dtype=bool)
+
+        known = rows >= 0
+        safe_rows = np.where(known, rows, 0)
+        market_units = np.where(known, self._units[safe_rows], 0)
+        group_units = np.where(known, self._group_units[self._labels[safe_rows]], 0)
+        return (market_units < self.max_market_unit) & (group_units < self.max_group_unit)
+
+    # 유닛 크기 / 자금 관리
+
+    @property
+    def risk_scale(self) -> float:
+        return self._risk_scale
+
+    def update_equity(self, equity: float) -> float:
+        """계좌 평가금액 반영 -> 유닛 리스크 배율"""
+        if self._peak_equity is None or equity > self._peak_equity:
+            self._peak_equity = equity
+        drawdown = 1 - equity / self._peak_equity if self._peak_equity > 0 else 0.0
+        steps = math.floor(drawdown / self.drawdown_step + 1e-9) if drawdown > 0 else 0
+        self._risk_scale = (1 - self.drawdown_risk_cut) ** steps
+        return self._risk_scale
+
+    def unit_size(self, equity: float, n: float) -> float:
+        """1유닛 수량 - N이 없거나 0 이하면 0"""
+        if not n or n <= 0 or math.isnan(n):
+            return 0.0
+        return equity * self.unit_risk_ratio * self._risk_scale / (n * self.stop_loss_n_multiplier)
+
+    def unit_sizes(self, equity: float, n_values: np.ndarray) -> np.ndarray:
+        n_values = np.asarray(n_values, dtype=np.float64)
+        risk = equity * self.unit_risk_ratio * self._risk_scale
+        with np.errstate(invalid="ignore", divide="ignore"):
+            sizes = risk / (n_values * self.stop_loss_n_multiplier)
+        return np.where(n_values > 0, sizes, 0.0)
+
+    # 내부
+
+    def _row(self, market: str) -> int:
+        row = self._index.get(market)
+        if row is not None:
+            return row
+
+        row = len(self.markets)
+        if row >= self._capacity:
+            self._grow(max(16, row * 2))
+        self.markets.append(market)
+        self._index[market] = row
+        self._labels[row] = row
+        return row
+
+    def _grow(self, capacity: int):
+        def grown(values: np.ndarray, fill=0) -> np.ndarray:
+            resized = np.full(values.shape[:-1] + (capacity,), fill, dtype=values.dtype)
+            resized[..., :values.shape[-1]] = values
+            return resized
+
+        def grown_square(values: np.ndarray) -> np.ndarray:
+            resized = np.zeros((capacity, capacity))
+            size = len(values)
+            resized[:size, :size] = values
+            return resized
+
+        self._last_price = grown(self._last_price, np.nan)
+        self._units = grown(self._units)
+        self._labels = grown(self._labels)
+        self._group_units = grown(self._group_units)
+        self._returns = grown(self._returns)
+        self._valid = grown(self._valid, False)
+        self._pair_count = grown_square(self._pair_count)
+        self._pair_sum = grown_square(self._pair_sum)
+        self._pair_sumsq = grown_square(self._pair_sumsq)
+        self._cross = grown_square(self._cross)
+        self._capacity = capacity
+
+    def _push_sparse(self, rows: np.ndarray, values: np.ndarray):
+        size = len(self.markets)
+        x = np.zeros(size)
+        x[rows] = values
+        v = np.zeros(size, dtype=bool)
+        v[rows] = True
+
+        evicted = self._write_row(x, v)
+        if evicted is not None:
+            self._accumulate(*evicted, sign=-1.0)
+        self._accumulate(x, v, sign=1.0)
+
+        # 더하고 빼기를 반복한 부동소수점 오차가 쌓이지 않도록 주기적으로 버퍼에서 다시 계산
+        self._pushes_since_rebuild += 1
+        if self._pushes_since_rebuild >= self.window:
+            self._rebuild()
+        self._regroup()
+
+    def _write_row(self, x: np.ndarray, v: np.ndarray) -> tuple[np.ndarray, np.ndarray] | None:
+        """링 버퍼에 한 행 기록 -> 밀려난 행 (버퍼가 가득 찼을 때)"""
+        size = len(x)
+        evicted = None
+        if self._rows == self.window:
+            evicted = self._returns[self._head, :size].copy(), self._valid[self._head, :size].copy()
+        else:
+            self._rows += 1
+        self._returns[self._head] = 0.0
+        self._valid[self._head] = False
+        self._returns[self._head, :size] = x
+        self._valid[self._head, :size] = v
+        self._head = (self._head + 1) % self.window
+        return evicted
+
+    def _accumulate(self, x: np.ndarray, v: np.ndarray, sign: float):
+        size = len(x)
+        v = v.astype(np.float64)
+        self._pair_count[:size, :size] += sign * np.outer(v, v)
+        self._pair_sum[:size, :size] += sign * np.outer(x, v)
+        self._pair_sumsq[:size, :size] += sign * np.outer(x * x, v)
+        self._cross[:size, :size] += sign * np.outer(x, x)
+
+    def _rebuild(self):
+        size = len(self.markets)
+        x = self._returns[:, :size]
+        v = self._valid[:, :size].astype(np.float64)
+        self._pair_count[:size, :size] = v.T @ v
+        self._pair_sum[:size, :size] = x.T @ v
+        self._pair_sumsq[:size, :size] = (x * x).T @ v
+        self._cross[:size, :size] = x.T @ x
+        self._pushes_since_rebuild = 0
+
+    def _correlation_matrix(self) -> np.ndarray:
+        size = len(self.markets)
+        n = self._pair_count[:size, :size]
+        sx = self._pair_sum[:size, :size]
+        sxx = self._pair_sumsq[:size, :size]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            covariance = n * self._cross[:size, :size] - sx * sx.T
+            variance = n * sxx - sx * sx
+            correlation = covariance / np.sqrt(variance * variance.T)
+        correlation[n < max(self.min_periods, 2)] = np.nan
+        return np.clip(correlation, -1.0, 1.0)
+
+    def _regroup(self):
+        """상관계수 임계값 이상인 마켓을 이은 연결 요소로 그룹 재계산 (최소 인덱스 전파)"""
+        size = len(self.markets)
+        with np.errstate(invalid="ignore"):
+            adjacent = self._correlation_matrix() >= self.correlation_threshold
+        np.fill_diagonal(adjacent, True)
+
+        labels = np.arange(size)
+        while True:
+            propagated = np.where(adjacent, labels[np.newaxis, :], size).min(axis=1)
+            propagated = labels[propagated] # 이웃의 라벨이 가리키는 라벨까지 한 번에 따라감
+            if np.array_equal(propagated, labels):
+                break
+            labels = propagated
+
+        self._labels[:size] = labels
+        self._group_units[:] = 0
+        self._group_units[:size] = np.bincount(labels, weights=self._units[:size], minlength=size).astype(np.int64)
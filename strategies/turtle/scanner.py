@@ -0,0 +1,152 @@
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+
+from common.ohlc_frame import OHLCFrame
+from indicators.rolling import RollingIndicator
+from interfaces.exchange import ExchangeInterface
+from strategies.turtle.constants import (
+    L1_BASE_BUY_PERIOD,
+    L2_BASE_BUY_PERIOD,
+    L1_BASE_SELL_PERIOD,
+    L2_BASE_SELL_PERIOD,
+    N_PERIOD,
+)
+from strategies.turtle.enums import TurtleSystemType
+
+KST = timezone(timedelta(hours=9))
+
+
+class TurtleScanner:
+    """전체 마켓의 돌파/청산 기준가와 N을 배열 인덱스로 유지하는 스캐너
+
+    기준가는 마감된 일봉 기준이므로 하루 한 번만 바뀐다. refresh()는 마지막 마감 봉이
+    바뀐 마켓만 다시 조회하고, breakouts()/exits()는 일괄 현재가 스냅샷과 한 번의 배열 비교로 답한다.
+    """
+
+    def __init__(
+        self,
+        system1_buy_period: int = L1_BASE_BUY_PERIOD,
+        system2_buy_period: int = L2_BASE_BUY_PERIOD,
+        system1_sell_period: int = L1_BASE_SELL_PERIOD,
+        system2_sell_period: int = L2_BASE_SELL_PERIOD,
+        n_period: int = N_PERIOD,
+        lookback: int | None = None,
+    ):
+        self.buy_periods = {TurtleSystemType.ONE: system1_buy_period, TurtleSystemType.TWO: system2_buy_period}
+        self.sell_periods = {TurtleSystemType.ONE: system1_sell_period, TurtleSystemType.TWO: system2_sell_period}
+        self.n_period = n_period
+        # N은 Wilder 평활이라 기간보다 긴 구간으로 계산해야 안정적
+        self.lookback = lookback or max(system2_buy_period, n_period * 3)
+
+        self.markets: list[str] = []
+        self._index: dict[str, int] = {}
+        self._last_dates: dict[str, date] = {}
+        self._breakout = {system: np.empty(0) for system in TurtleSystemType}
+        self._exit = {system: np.empty(0) for system in TurtleSystemType}
+        self._n = np.empty(0)
+
+    def update(self, market: str, frame: OHLCFrame) -> bool:
+        """마감된 봉 기준 지표 갱신 - 마지막 봉 날짜가 같으면 건너뜀"""
+        if not len(frame):
+            return False
+
+        last_date = frame.trade_date[-1].item()
+        if self._last_dates.get(market) == last_date:
+            return False
+
+        row = self._row(market)
+        close = frame.close
+        for system in TurtleSystemType:
+            self._breakout[system][row] = _window_extreme(close, self.buy_periods[system], np.max)
+            self._exit[system][row] = _window_extreme(close, self.sell_periods[system], np.min)
+        atr = RollingIndicator.atr(frame.high, frame.low, close, self.n_period)
+        self._n[row] = atr[-1] if len(atr) else np.nan
+        self._last_dates[market] = last_date
+        return True
+
+    def refresh(self, exchange: ExchangeInterface, markets: list[str], today: date | None = None) -> list[str]:
+        """어제(KST) 봉이 아직 반영되지 않은 마켓만 조회해 갱신
+
+        Returns: 새로 조회한 마켓 목록
+        """
+        today = today or datetime.now(KST).date()
+        expected = today - timedelta(days=1)
+
+        stale = [market for market in markets if self._last_dates.get(market) != expected]
+        for market in stale:
+            frame = exchange.candles_frame(market, self.lookback + 1)
+            if len(frame) and frame.trade_date[-1].item() >= today:
+                frame = frame[:-1] # 진행 중인 당일 봉 제외
+            self.update(market, frame)
+        return stale
+
+    def breakouts(self, prices: dict[str, float], system: TurtleSystemType = TurtleSystemType.ONE) -> list[str]:
+        """현재가가 매수 기간 최고 종가를 넘어선 마켓"""
+        price_array = self._align(prices)
+        with np.errstate(invalid="ignore"):
+            mask = price_array > self._breakout[system][:len(self.markets)]
+        return self._select(mask)
+
+    def exits(self, prices: dict[str, float], system: TurtleSystemType = TurtleSystemType.ONE) -> list[str]:
+        """현재가가 매도 기간 최저 종가 아래로 내려간 마켓"""
+        price_array = self._align(prices)
+        with np.errstate(invalid="ignore"):
+            mask = price_array < self._exit[system][:len(self.markets)]
+        return self._select(mask)
+
+    def levels(self, market: str) -> dict[str, float]:
+        row = self._index[market]
+        return {
+            "system1_breakout": float(self._breakout[TurtleSystemType.ONE][row]),
+            "system2_breakout": float(self._breakout[TurtleSystemType.TWO][row]),
+            "system1_exit": float(self._exit[TurtleSystemType.ONE][row]),
+            "system2_exit": float(self._exit[TurtleSystemType.TWO][row]),
+            "N": float(self._n[row]),
+        }
+
+    def n_values(self, markets: list[str]) -> np.ndarray:
+        return self._n[[self._index[market] for market in markets]]
+
+    def _row(self, market: str) -> int:
+        row = self._index.get(market)
+        if row is not None:
+            return row
+
+        row = len(self.markets)
+        if row >= len(self._n):
+            self._grow(max(16, row * 2))
+        self.markets.append(market)
+        self._index[market] = row
+        return row
+
+    def _grow(self, capacity: int):
+        def grown(values: np.ndarray) -> np.ndarray:
+            resized = np.full(capacity, np.nan)
+            resized[:len(values)] = values
+            return resized
+
+        for system in TurtleSystemType:
+            self._breakout[system] = grown(self._breakout[system])
+            self._exit[system] = grown(self._exit[system])
+        self._n = grown(self._n)
+
+    def _align(self, prices: dict[str, float]) -> np.ndarray:
+        """self.markets 순서로 정렬된 현재가 배열 (스냅샷에 없는 마켓은 NaN)"""
+        price_array = np.full(len(self.markets), np.nan)
+        index = self._index
+        for market, price in prices.items():
+            row = index.get(market)
+            if row is not None:
+                price_array[row] = price
+        return price_array
+
+    def _select(self, mask: np.ndarray) -> list[str]:
+        markets = self.markets
+        return [markets[row] for row in np.flatnonzero(mask)]
+
+
+def _window_extreme(values: np.ndarray, period: int, reducer) -> float:
+    if len(values) < period:
+        return np.nan
+    return float(reducer(values[-period:]))
@@ -1,5 +1,8 @@
-from pydantic import BaseModel, Field
-from strategies.turtle.enums import SignalAction, BuyType
+from datetime import date
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field
+from strategies.turtle.enums import SignalAction, BuyType, ExitReason, TurtleSystemType
 
 
 class TurtlePosition(BaseModel):
@@ -32,4 +35,42 @@ class Position(BaseModel):
     current_value: float
     profit_rate: float
     profit_amount: float
-    last_updated: str
\ No newline at end of file
+    last_updated: str
+
+
+class BacktestTrade(BaseModel):
+    entry_date: date
+    exit_date: date
+    entry_price: float = Field(description="평균 진입가")
+    exit_price: float
+    units: int = Field(description="피라미딩 포함 유닛 수")
+    quantity: float
+    pnl: float = Field(description="수수료 차감 손익")
+    return_rate: float
+    exit_reason: ExitReason
+
+
+class BacktestStats(BaseModel):
+    total_return: float
+    cagr: float
+    max_drawdown: float
+    sharpe: float
+    trade_count: int
+    win_rate: float
+    profit_factor: float
+    exposure: float = Field(description="포지션 보유 봉 비율")
+
+
+class BacktestResult(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    system: TurtleSystemType
+    trades: list[BacktestTrade]
+    equity: np.ndarray = Field(description="봉별 평가금액")
+    stats: BacktestStats
+
+
+class SweepResult(BaseModel):
+    rank: int
+    params: dict
+    stats: BacktestStats
@@ -5,11 +5,17 @@ from strategies.turtle.constants import (
     L1_BASE_BUY_PERIOD,
     L2_BASE_BUY_PERIOD,
     L1_BASE_SELL_PERIOD,
-    L2_BASE_SELL_PERIOD
+    L2_BASE_SELL_PERIOD,
+    N_PERIOD
 )
 from strategies.turtle.schema import TurtlePosition
+from strategies.turtle.position_book import DEFAULT_MARKET, PositionBook, PositionBooks
+from strategies.turtle.risk import PortfolioRiskEngine
 from strategies.turtle.enums import TurtleSystemType
 from common.schema import OHLC
+from common.ohlc_frame import OHLCFrame
+from common.metrics import metrics
+from indicators.streaming import StreamingATR, StreamingDonchian
 
 
 class TurtleStrategy():
@@ -21,8 +27,15 @@ class TurtleStrategy():
         system1_buy_period: int = L1_BASE_BUY_PERIOD,
         system2_buy_period: int = L2_BASE_BUY_PERIOD,
         system1_sell_period: int = L1_BASE_SELL_PERIOD,
-        system2_sell_period: int = L2_BASE_SELL_PERIOD
+        system2_sell_period: int = L2_BASE_SELL_PERIOD,
+        market: str = DEFAULT_MARKET,
+        journal_path: str | None = None,
+        risk_engine: PortfolioRiskEngine | None = None,
     ):
+        """market: market 인자를 생략한 호출이 사용할 기본 마켓
+        journal_path: 포지션 변경을 기록할 JSONL 파일 (있으면 생성 시 재생해 복구)
+        risk_engine: 상관관계 그룹/전체 유닛 한도를 함께 적용할 포트폴리오 리스크 엔진 (여러 전략이 공유 가능)
+        """
         self.max_position_unit = max_position_unit
         self.pyramid_n_multiplier = pyramid_n_multiplier
         self.stop_loss_n_multiplier = stop_loss_n_multiplier
@@ -30,33 +43,121 @@ class TurtleStrategy():
         self.system2_buy_period = system2_buy_period
         self.system1_sell_period = system1_sell_period
         self.system2_sell_period = system2_sell_period
-        self.positions: list[TurtlePosition] = []
+        self.market = market
+        self.books = PositionBooks(journal_path)
+        self.risk_engine = risk_engine
         self.entry_system: TurtleSystemType = TurtleSystemType.ONE
- 
-    def buy(self, current_price: float, ohlcs: list[OHLC]) -> bool:
-        if self.positions: # 이미 매수 기록 존재 => pyramid_buy 수행
+
+        # update()로 마감된 봉을 넣어주면 윈도우 재계산 없이 N과 돌파/청산 기준가를 유지
+        self._n = StreamingATR(N_PERIOD)
+        self._channels = {
+            period: StreamingDonchian(period, upper_field="close", lower_field="close")
+            for period in {system1_buy_period, system2_buy_period, system1_sell_period, system2_sell_period}
+        }
+
+        if risk_engine is not None:
+            for book_market in self.books.markets():
+                risk_engine.set_units(book_market, len(self.books.book(book_market)))
+
+    @property
+    def positions(self) -> list[TurtlePosition]:
+        """기본 마켓의 포지션 (trade_date 순서)"""
+        return self.books.book(self.market).positions
+
+    @positions.setter
+    def positions(self, positions: list[TurtlePosition]):
+        book = self.books.book(self.market)
+        book.clear()
+        for position in positions:
+            book.add(position)
+
+    def book(self, market: str | None = None) -> PositionBook:
+        return self.books.book(self.market if market is None else market)
+
+    def update(self, ohlc: OHLC):
+        """마감된 봉 반영 (과거→최신 순서로 한 번씩 호출)"""
+        self._n.update(ohlc)
+        for channel in self._channels.values():
+            channel.update(ohlc)
+
+    @property
+    def N(self) -> float | None:
+        return self._n.value
+
+    @property
+    def breakout_level(self) -> float | None:
+        """현재 진입 시스템의 돌파 기준가 (매수 기간 최고 종가)"""
+        period = self.system1_buy_period if self.entry_system == TurtleSystemType.ONE else self.system2_buy_period
+        return self._channels[period].upper
+
+    @property
+    def exit_level(self) -> float | None:
+        """현재 진입 시스템의 청산 기준가 (매도 기간 최저 종가)"""
+        period = self.system1_sell_period if self.entry_system == TurtleSystemType.ONE else self.system2_sell_period
+        return self._channels[period].lower
+
+    def snapshot_indicators(self) -> dict:
+        return {
+            "n": self._n.snapshot(),
+            "channels": {str(period): channel.snapshot() for period, channel in self._channels.items()},
+        }
+
+    def restore_indicators(self, state: dict):
+        self._n.restore(state["n"])
+        for period, channel_state in state["channels"].items():
+            self._channels[int(period)].restore(channel_state)
+
+    @metrics.timed("turtle_decision_seconds", "터틀 매매 판단 소요 시간", decision="buy")
+    def buy(
+        self,
+        current_price: float,
+        ohlcs: list[OHLC] | OHLCFrame | None = None,
+        market: str | None = None,
+    ) -> bool:
+        if self.book(market): # 이미 매수 기록 존재 => pyramid_buy 수행
             return False
-        
+
+        if not self._risk_allows(market):
+            return False
+
+        if ohlcs is None:
+            return current_price > self._require_live(self.breakout_level, "돌파 기준가")
+
         if self.entry_system == TurtleSystemType.ONE:
             self._validate_ohlcs_period(ohlcs, self.system1_buy_period)
         elif self.entry_system == TurtleSystemType.TWO:
             self._validate_ohlcs_period(ohlcs, self.system2_buy_period)
 
-        return current_price > max(ohlc.close for ohlc in ohlcs)
+        return current_price > self._highest_close(ohlcs)
 
-    def sell(self, current_price: float, ohlcs: list[OHLC], N: float) -> bool:
-        if not self.positions:
+    @metrics.timed("turtle_decision_seconds", "터틀 매매 판단 소요 시간", decision="sell")
+    def sell(
+        self,
+        current_price: float,
+        ohlcs: list[OHLC] | OHLCFrame | None = None,
+        N: float | None = None,
+        market: str | None = None,
+    ) -> bool:
+        book = self.book(market)
+        if not book:
             return False
 
-        if self.entry_system == TurtleSystemType.ONE:
-            self._validate_ohlcs_period(ohlcs, self.system1_sell_period)
-        elif self.entry_system == TurtleSystemType.TWO:
-            self._validate_ohlcs_period(ohlcs, self.system2_sell_period)
+        if ohlcs is None:
+            exit_level = self._require_live(self.exit_level, "청산 기준가")
+        else:
+            if self.entry_system == TurtleSystemType.ONE:
+                self._validate_ohlcs_period(ohlcs, self.system1_sell_period)
+            elif self.entry_system == TurtleSystemType.TWO:
+                self._validate_ohlcs_period(ohlcs, self.system2_sell_period)
+            exit_level = self._lowest_close(ohlcs)
 
-        if current_price < min(ohlc.close for ohlc in ohlcs): # system 최저가 이탈
+        if current_price < exit_level: # system 최저가 이탈
             return True
 
-        latest_position: TurtlePosition | None = self._get_latest_position()
+        if N is None:
+            N = self._require_live(self.N, "N")
+
+        latest_position: TurtlePosition | None = book.latest
         
         # 2N 손절
         if latest_position and current_price < latest_position.price - (self.stop_loss_n_multiplier * N):
@@ -64,43 +165,77 @@ class TurtleStrategy():
 
         return False
 
-    def pyramid_buy(self, current_price: float, N: float) -> bool:
-        if not self.positions:
+    @metrics.timed("turtle_decision_seconds", "터틀 매매 판단 소요 시간", decision="pyramid_buy")
+    def pyramid_buy(self, current_price: float, N: float | None = None, market: str | None = None) -> bool:
+        book = self.book(market)
+        if not book:
             return False
 
         # 최대 유닛 검증
-        if len(self.positions) >= self.max_position_unit:
+        if len(book) >= self.max_position_unit:
             return False
 
+        # 상관관계 그룹/전체 유닛 한도 검증
+        if not self._risk_allows(market):
+            return False
 
-        latest_position: TurtlePosition | None = self._get_latest_position()
+        latest_position: TurtlePosition | None = book.latest
         if not latest_position:
             return False
 
+        # 추가 매수 여지가 있을 때만 실시간 N이 필요하다
+        if N is None:
+            N = self._require_live(self.N, "N")
+
         # 최근 진입가 대비 1N 상승 시 추가 매수
         return current_price >= latest_position.price + (self.pyramid_n_multiplier * N)
 
-    def add_position(self, price: float, quantity: int, trade_date: str):
+    def add_position(self, price: float, quantity: int, trade_date: str, market: str | None = None):
         position = TurtlePosition(
             price=price,
             quantity=quantity,
             trade_date=trade_date,
         )
-        self.positions.append(position)
+        book = self.book(market)
+        book.add(position)
+        if self.risk_engine is not None:
+            self.risk_engine.add_unit(book.market)
 
-    def clear_position(self):
-        self.positions = []
+    def clear_position(self, market: str | None = None):
+        book = self.book(market)
+        book.clear()
+        if self.risk_engine is not None:
+            self.risk_engine.clear_units(book.market)
 
-    def _get_latest_position(self) -> TurtlePosition | None:
-        if not self.positions:
-            return None
-        return max(self.positions, key=lambda p: p.trade_date)
+    def _get_latest_position(self, market: str | None = None) -> TurtlePosition | None:
+        return self.book(market).latest
 
-    def _get_earliest_position(self) -> TurtlePosition | None:
-        if not self.positions:
-            return None
-        return min(self.positions, key=lambda p: p.trade_date)
+    def _get_earliest_position(self, market: str | None = None) -> TurtlePosition | None:
+        return self.book(market).earliest
 
-    def _validate_ohlcs_period(self, ohlcs: list[OHLC], period: int):
+    def _risk_allows(self, market: str | None) -> bool:
+        if self.risk_engine is None:
+            return True
+        return self.risk_engine.can_add_unit(self.market if market is None else market)
+
+    @staticmethod
+    def _require_live(value: float | None, name: str) -> float:
+        if value is None:
+            raise ValueError(f"{name}를 계산할 봉이 부족합니다. update()로 충분한 봉을 먼저 반영해야 합니다.")
+        return value
+
+    @staticmethod
+    def _highest_close(ohlcs: list[OHLC] | OHLCFrame) -> float:
+        if isinstance(ohlcs, OHLCFrame):
+            return float(ohlcs.close.max())
+        return max(ohlc.close for ohlc in ohlcs)
+
+    @staticmethod
+    def _lowest_close(ohlcs: list[OHLC] | OHLCFrame) -> float:
+        if isinstance(ohlcs, OHLCFrame):
+            return float(ohlcs.close.min())
+        return min(ohlc.close for ohlc in ohlcs)
+
+    def _validate_ohlcs_period(self, ohlcs: list[OHLC] | OHLCFrame, period: int):
         if len(ohlcs) != period:
             raise ValueError(f"ohlcs 개수({len(ohlcs)})가 period({period})와 동일하지 않습니다.")
@@ -1,8 +1,23 @@
-import yfinance
+import numpy as np
+
+from strategies.sentiment.constants import VIX_HIGH
+from strategies.sentiment.enums import SentimentSource
+from strategies.sentiment.feed import SentimentFeed, default_cache_path
+from strategies.sentiment.providers import YFinanceVIXProvider
+from strategies.sentiment.series import SentimentSeries, regime_mask
 
 
 class VIXStrategy():
+    def __init__(self, feed: SentimentFeed | None = None):
+        """feed를 주지 않으면 yfinance 조회 결과를 로컬 파일에 캐시하는 기본 피드 사용"""
+        self.feed = feed or SentimentFeed(YFinanceVIXProvider(), cache_path=default_cache_path(SentimentSource.VIX))
+
     def index(self) -> float:
-        vix = yfinance.Ticker("^VIX")
-        data = vix.history(period="1d")
-        return float(data['Close'].iloc[-1])
\ No newline at end of file
+        return self.feed.value()
+
+    def history(self) -> SentimentSeries:
+        return self.feed.history()
+
+    def entry_mask(self, dates, upper: float = VIX_HIGH) -> np.ndarray:
+        """VIX가 upper 미만인 날짜만 진입 허용 (이력이 없는 날짜는 허용)"""
+        return regime_mask(self.history(), dates, upper=upper, missing=True)
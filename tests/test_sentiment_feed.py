@@ -0,0 +1,156 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from strategies.sentiment.enums import SentimentSource
+from strategies.sentiment.feed import SentimentFeed
+from strategies.sentiment.providers import FixtureProvider
+from strategies.sentiment.series import SentimentSeries
+
+
+def _fixture(days: int = 30, source: SentimentSource = SentimentSource.VIX) -> FixtureProvider:
+    dates = np.arange(np.datetime64("2024-01-01"), np.datetime64("2024-01-01") + days)
+    return FixtureProvider(source, SentimentSeries(dates, np.arange(days, dtype=float) + 10))
+
+
+class FailingProvider(FixtureProvider):
+    """fail=True인 동안 조회 실패"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fail = False
+
+    def latest(self):
+        if self.fail:
+            self.calls += 1
+            raise ConnectionError("offline")
+        return super().latest()
+
+    def history(self, days: int):
+        if self.fail:
+            self.calls += 1
+            raise ConnectionError("offline")
+        return super().history(days)
+
+
+class SlowProvider(FixtureProvider):
+    def latest(self):
+        time.sleep(0.05)
+        return super().latest()
+
+
+def test_latest_is_cached_within_ttl():
+    provider = _fixture()
+    feed = SentimentFeed(provider, ttl=60)
+
+    first = feed.latest()
+    second = feed.latest()
+
+    assert first is second
+    assert first.value == 39
+    assert provider.calls == 1
+    assert feed.stats["hits"] == 1
+
+
+def test_latest_reloads_after_ttl():
+    provider = _fixture()
+    feed = SentimentFeed(provider, ttl=60)
+
+    feed.latest()
+    feed.latest(max_age=0)
+
+    assert provider.calls == 2
+
+
+def test_stale_value_served_when_provider_fails():
+    provider = FailingProvider(SentimentSource.VIX, _fixture().series)
+    feed = SentimentFeed(provider, ttl=0)
+    cached = feed.latest()
+
+    provider.fail = True
+    assert feed.latest() is cached
+    assert isinstance(feed.last_error, ConnectionError)
+    assert feed.stats["stale_served"] == 1
+
+
+def test_error_raised_without_cached_value():
+    provider = FailingProvider(SentimentSource.VIX, _fixture().series)
+    provider.fail = True
+    feed = SentimentFeed(provider)
+
+    with pytest.raises(ConnectionError):
+        feed.latest()
+    with pytest.raises(ConnectionError):
+        feed.history()
+
+
+def test_concurrent_misses_load_once():
+    provider = SlowProvider(SentimentSource.FEAR_GREED, _fixture().series)
+    feed = SentimentFeed(provider, ttl=60)
+    barrier = threading.Barrier(8)
+    values = []
+
+    def read():
+        barrier.wait()
+        values.append(feed.value())
+
+    threads = [threading.Thread(target=read) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert provider.calls == 1
+    assert values == [39.0] * 8
+
+
+def test_history_keeps_latest_reading():
+    provider = _fixture(days=10)
+    feed = SentimentFeed(provider, history_days=5)
+
+    history = feed.history()
+    assert history.values.tolist() == [15, 16, 17, 18, 19]
+
+    provider.series = provider.series.merge(SentimentSeries(["2024-01-11"], [99]))
+    feed.latest()
+    assert feed.history().latest[1] == 99 # 이력 TTL 안에서도 최신값은 반영
+    assert provider.calls == 2
+
+
+def test_cache_file_reload(tmp_path):
+    cache_path = str(tmp_path / "vix.json")
+    provider = _fixture()
+    feed = SentimentFeed(provider, ttl=60, cache_path=cache_path)
+    reading = feed.latest()
+    history = feed.history()
+
+    reloaded_provider = _fixture()
+    reloaded = SentimentFeed(reloaded_provider, ttl=60, cache_path=cache_path)
+
+    assert reloaded.latest() == reading
+    assert reloaded.history().values.tolist() == history.values.tolist()
+    assert reloaded_provider.calls == 0
+
+
+def test_cache_file_for_other_source_is_ignored(tmp_path):
+    cache_path = str(tmp_path / "sentiment.json")
+    SentimentFeed(_fixture(), cache_path=cache_path).latest()
+
+    provider = _fixture(source=SentimentSource.FEAR_GREED)
+    SentimentFeed(provider, cache_path=cache_path).latest()
+
+    assert provider.calls == 1
+
+
+def test_corrupt_cache_file_is_ignored(tmp_path):
+    cache_path = tmp_path / "vix.json"
+    cache_path.write_text("{not json", encoding="utf-8")
+    provider = _fixture()
+
+    feed = SentimentFeed(provider, cache_path=str(cache_path))
+
+    assert feed.last_error is not None
+    assert feed.latest().value == 39
+    assert provider.calls == 1
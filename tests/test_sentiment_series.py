@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from strategies.sentiment.series import SentimentSeries, regime_mask
+
+
+def _series(start: str, values: list[float]) -> SentimentSeries:
+    dates = np.arange(np.datetime64(start), np.datetime64(start) + len(values))
+    return SentimentSeries(dates, values)
+
+
+def test_rejects_unsorted_dates():
+    with pytest.raises(ValueError):
+        SentimentSeries(["2024-01-02", "2024-01-01"], [1.0, 2.0])
+
+
+def test_merge_prefers_other_on_same_date():
+    merged = _series("2024-01-01", [1, 2, 3]).merge(_series("2024-01-03", [30, 40]))
+
+    assert merged.dates.astype(str).tolist() == ["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04"]
+    assert merged.values.tolist() == [1, 2, 30, 40]
+
+
+def test_merge_with_empty():
+    series = _series("2024-01-01", [1, 2])
+
+    assert series.merge(SentimentSeries.empty()) is series
+    assert SentimentSeries.empty().merge(series) is series
+
+
+def test_tail_counts_calendar_days_from_last_date():
+    series = SentimentSeries(["2024-01-01", "2024-01-05", "2024-01-06", "2024-01-08"], [1, 2, 3, 4])
+
+    assert series.tail(4).values.tolist() == [2, 3, 4]
+    assert series.tail(1).values.tolist() == [4]
+    assert len(SentimentSeries.empty().tail(3)) == 0
+
+
+def test_align_forward_fills_and_respects_max_gap():
+    series = SentimentSeries(["2024-01-02", "2024-01-05"], [10, 20])
+    dates = np.arange(np.datetime64("2024-01-01"), np.datetime64("2024-01-09"))
+
+    aligned = series.align(dates)
+    assert np.isnan(aligned[0])
+    assert aligned[1:].tolist() == [10, 10, 10, 20, 20, 20, 20]
+
+    limited = series.align(dates, max_gap_days=1)
+    assert np.isnan(limited[[0, 3, 6, 7]]).all()
+    assert limited[[1, 2, 4, 5]].tolist() == [10, 10, 20, 20]
+
+
+def test_align_empty_series():
+    assert np.isnan(SentimentSeries.empty().align(["2024-01-01", "2024-01-02"])).all()
+
+
+def test_regime_mask_bounds_and_missing():
+    series = SentimentSeries(["2024-01-02", "2024-01-03", "2024-01-04"], [20, 30, 40])
+    dates = ["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04"]
+
+    assert regime_mask(series, dates, upper=30).tolist() == [False, True, False, False]
+    assert regime_mask(series, dates, lower=30).tolist() == [False, False, True, True]
+    assert regime_mask(series, dates, lower=25, upper=35, missing=True).tolist() == [True, False, True, False]
+
+
+def test_dict_round_trip():
+    series = _series("2024-02-28", [1.5, 2.5, 3.5])
+    restored = SentimentSeries.from_dict(series.to_dict())
+
+    assert (restored.dates == series.dates).all()
+    assert restored.values.tolist() == series.values.tolist()